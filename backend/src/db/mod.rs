@@ -448,7 +448,7 @@ pub async fn get_player_game_logs(pool: &SqlitePool, player_id: i64, limit: i64)
     sqlx::query_as::<_, PlayerGameLog>(
         r#"SELECT
                pgl.game_id,
-               pgl.player_id,
+               CAST(pgl.player_id AS TEXT) AS player_id,
                pgl.team_id,
                pgl.season,
                pgl.game_date,
@@ -782,3 +782,51 @@ pub async fn get_dnp_players_for_game(
         .collect())
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use sqlx::sqlite::SqlitePoolOptions;
+
+    #[tokio::test]
+    async fn game_logs_decode_integer_player_ids() {
+        // One connection: every connection to sqlite::memory: is its own database
+        let pool = SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect("sqlite::memory:")
+            .await
+            .unwrap();
+        sqlx::query(
+            r#"CREATE TABLE player_game_logs (
+                   game_id TEXT, player_id INTEGER, team_id INTEGER, season TEXT, game_date TEXT,
+                   matchup TEXT, min REAL, pts INTEGER, reb INTEGER, ast INTEGER, stl INTEGER,
+                   blk INTEGER, fgm INTEGER, fga INTEGER, fg3m INTEGER, fg3a INTEGER, ftm INTEGER,
+                   fta INTEGER, tov INTEGER, oreb INTEGER, dreb INTEGER
+               )"#,
+        )
+        .execute(&pool)
+        .await
+        .unwrap();
+        sqlx::query(
+            r#"CREATE TABLE schedule (
+                   game_id TEXT, home_team_id INTEGER, away_team_id INTEGER,
+                   home_score INTEGER, away_score INTEGER
+               )"#,
+        )
+        .execute(&pool)
+        .await
+        .unwrap();
+        sqlx::query(
+            r#"INSERT INTO player_game_logs (game_id, player_id, team_id, season, game_date, matchup, pts)
+               VALUES ('0022400001', 2544, 1610612747, '2024-25', '2024-12-20', 'LAL vs. GSW', 30)"#,
+        )
+        .execute(&pool)
+        .await
+        .unwrap();
+
+        let logs = get_player_game_logs(&pool, 2544, 10).await.unwrap();
+
+        assert_eq!(logs.len(), 1);
+        assert_eq!(logs[0].player_id, "2544");
+        assert_eq!(logs[0].pts, Some(30));
+    }
+}
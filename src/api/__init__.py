@@ -1,12 +1,13 @@
 """API layer - External API communication."""
 
 from .client import NBAApiClient, ProductionNBAApiClient, MockNBAApiClient
-from .retry import RetryStrategy, with_retry
+from .retry import RetryStrategy, TokenBucket, with_retry
 
 __all__ = [
     'NBAApiClient',
     'ProductionNBAApiClient',
     'MockNBAApiClient',
     'RetryStrategy',
+    'TokenBucket',
     'with_retry',
 ]
@@ -1,6 +1,7 @@
 """Retry Strategy - Configurable retry logic for API calls."""
 
 import logging
+import threading
 import time
 from functools import wraps
 from typing import Callable, TypeVar, Optional, List, Type
@@ -161,3 +162,55 @@ class ThrottleDetector:
             )
             return wait
         return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each request takes one token, so the long-run request rate is bounded
+    while idle time (slow responses, cache hits) banks up to ``capacity``
+    requests that may go out back-to-back. Concurrent workers sharing one
+    bucket share the same budget.
+
+    Usage::
+
+        limiter = TokenBucket(rate=1 / 0.6)
+        for game_id in game_ids:
+            limiter.acquire()
+            fetch(game_id)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second (<= 0 disables limiting)
+            capacity: Maximum tokens that can accumulate (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_delay(cls, delay: float, capacity: float = 1.0) -> 'TokenBucket':
+        """Create a bucket allowing on average one request every ``delay`` seconds."""
+        return cls(rate=1.0 / delay if delay > 0 else 0.0, capacity=capacity)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` are available, then take them."""
+        if self.rate <= 0:
+            return
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                self._condition.wait((tokens - self._tokens) / self.rate)
@@ -99,14 +99,20 @@ def _print_report(report):
             status_str = click.style(r.error, fg="yellow")
         elif r.new_rows > 0:
             status_str = click.style(f"+{r.new_rows}", fg="green")
+        elif r.replaced_rows > 0:
+            status_str = click.style(f"{r.replaced_rows:,} replaced", fg="green")
         else:
             status_str = click.style("OK", fg="green")
 
-        after = r.local_after if not report.dry_run else "-"
+        # Local row counts are only taken by the dry-run preview and by
+        # "replace" merges
+        counted = report.dry_run or (r.strategy == "replace" and not r.error)
+        before = f"{r.local_before:,}" if counted else "-"
+        after = f"{r.local_after:,}" if counted and not report.dry_run else "-"
 
         click.echo(
             f"{r.table:<25} {r.strategy:<10} {r.cloud_rows:>8,} "
-            f"{r.local_before:>8,} {str(after):>8} {r.new_rows:>8,} {status_str}"
+            f"{before:>8} {after:>8} {r.new_rows:>8,} {status_str}"
         )
 
         if r.skipped_columns:
@@ -132,7 +138,7 @@ def _print_report(report):
     else:
         click.echo(
             click.style(
-                f"\n{mode} complete: {report.total_new_rows:,} new rows across "
+                f"\n{mode} complete: {report.total_new_rows:,} rows merged across "
                 f"{report.tables_updated} table(s).",
                 fg="green",
             )
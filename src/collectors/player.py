@@ -259,12 +259,10 @@ class PlayerGameLogCollector(BaseCollector):
         if df is None or df.empty:
             return Result.skipped(f"No game logs for player {player_id}")
 
-        # Transform and save each game log
-        count = 0
-        for _, row in df.iterrows():
-            log = self._transform_to_game_log(player_id, row)
-            self.repository.save(log)
-            count += 1
+        # Transform all game logs, then save them in one batch
+        logs = [self._transform_to_game_log(player_id, row) for _, row in df.iterrows()]
+        self.repository.save_many(logs)
+        count = len(logs)
 
         return Result.success(count, f"Collected {count} game logs")
 
@@ -1,17 +1,30 @@
 """Zone Collectors - Collects shooting and assist zone statistics."""
 
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
 import re
-import time
+import threading
 import unicodedata
 
+import numpy as np
+import pandas as pd
+
 from .base import BaseCollector, Result
 from ..models.zones import ShootingZone, AssistZone
 from ..db.zones import ZoneRepository
 from ..api.client import NBAApiClient
-from ..api.retry import RetryStrategy
-from ..helpers.zone_mapper import get_zone_from_coordinates
+from ..api.retry import RetryStrategy, TokenBucket
+from ..helpers.zone_mapper import ZONE_NAMES, count_zones_from_coordinates
+
+logger = logging.getLogger(__name__)
+
+# Columns of the assist-event frame produced from play-by-play
+ASSIST_EVENT_COLUMNS = [
+    'game_id', 'shooter_name', 'passer_name', 'passer_name_lc',
+    'x', 'y', 'period', 'team_id', 'description',
+]
 
 
 class ShootingZoneCollector(BaseCollector):
@@ -54,15 +67,15 @@ class ShootingZoneCollector(BaseCollector):
         if df is None or df.empty:
             return Result.skipped(f"No shot data for player {player_id}")
 
-        # Transform to zone models
-        zones = self._transform_to_zones(df)
+        names, fgm, fga = self._zone_columns(df)
 
-        if not zones:
+        if len(names) == 0:
             return Result.skipped(f"No valid zones for player {player_id}")
 
-        # Save zones
-        self.repository.save_shooting_zones(player_id, self.season, zones)
+        # Save straight from the column arrays
+        self.repository.save_shooting_zones_bulk(player_id, self.season, names, fgm, fga)
 
+        zones = self._to_shooting_zones(names, fgm, fga)
         return Result.success(zones, f"Collected {len(zones)} shooting zones")
 
     def _fetch_with_retry(self, fetch_func):
@@ -71,24 +84,27 @@ class ShootingZoneCollector(BaseCollector):
             return self.retry_strategy.execute(fetch_func)
         return fetch_func()
 
-    def _transform_to_zones(self, df) -> List[ShootingZone]:
-        """Transform shot area player dashboard data to ShootingZone models."""
-        zones = []
-
-        for _, row in df.iterrows():
-            zone_name = row.get('GROUP_VALUE', '')
+    def _zone_columns(self, df) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Extract (names, fgm, fga) arrays from shot area player dashboard data."""
+        rows = df.reindex(columns=['GROUP_VALUE', 'FGM', 'FGA'])
+        names = rows['GROUP_VALUE'].fillna('').to_numpy(dtype=object)
 
-            # Skip Backcourt (heaves with no statistical significance)
-            if zone_name == 'Backcourt':
-                continue
+        # Skip Backcourt (heaves with no statistical significance)
+        keep = names != 'Backcourt'
+        fgm = rows['FGM'].fillna(0).to_numpy()[keep].astype(np.int64)
+        fga = rows['FGA'].fillna(0).to_numpy()[keep].astype(np.int64)
+        return names[keep], fgm, fga
 
-            zones.append(ShootingZone(
-                zone_name=zone_name,
-                fgm=int(row.get('FGM', 0)),
-                fga=int(row.get('FGA', 0)),
-            ))
+    @staticmethod
+    def _to_shooting_zones(names, fgm, fga) -> List[ShootingZone]:
+        return [
+            ShootingZone(zone_name=zone_name, fgm=made, fga=attempted)
+            for zone_name, made, attempted in zip(names.tolist(), fgm.tolist(), fga.tolist())
+        ]
 
-        return zones
+    def _transform_to_zones(self, df) -> List[ShootingZone]:
+        """Transform shot area player dashboard data to ShootingZone models."""
+        return self._to_shooting_zones(*self._zone_columns(df))
 
 
 class AssistZoneCollector(BaseCollector):
@@ -98,15 +114,24 @@ class AssistZoneCollector(BaseCollector):
     # Handles formats like:
     #   "Ayton 3' Dunk (6 PTS) (L. James 1 AST)"
     #   "Ayton Alley Oop Dunk (10 PTS) (L. James 3 AST)" (no distance)
+    # Name groups are bounded classes that cannot cross a digit or parenthesis
+    # and the shot type cannot cross a parenthesis, so matching pivots on the
+    # "(N PTS)" token and cannot backtrack quadratically on malformed input.
     ASSIST_PATTERN = re.compile(
-        r"(?P<shooter>[\w\s.'\-]+?)\s+"     # Shooter name
+        r"(?P<shooter>[^\d()]{1,40}?)\s+"   # Shooter name
         r"(?:(?P<distance>\d+)'?\s*)?"      # Optional distance (e.g., "3'")
-        r"(?P<shot_type>.*?)\s+"            # Shot type
+        r"(?P<shot_type>[^()]{0,60}?)\s+"   # Shot type
         r"\((?P<points>\d+)\s+PTS\)\s+"     # Points
-        r"\((?P<passer>[\w\s.'\-]+?)\s+"    # Passer name
+        r"\((?P<passer>[^\d()]{1,40}?)\s+"  # Passer name
         r"(?P<ast>\d+)\s+AST\)"             # Assist number
     )
 
+    # Parsed assist events keyed by game_id, shared across collector instances
+    # so teammates in the same game reuse a single play-by-play fetch + parse
+    EVENTS_CACHE_SIZE = 4096
+    _events_cache: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+    _events_cache_lock = threading.Lock()
+
     def __init__(
         self,
         repository: ZoneRepository,
@@ -114,12 +139,28 @@ class AssistZoneCollector(BaseCollector):
         season: str,
         retry_strategy: Optional[RetryStrategy] = None,
         delay: float = 0.6,
+        max_workers: int = 8,
+        rate_limiter: Optional[TokenBucket] = None,
     ):
+        """
+        Initialize collector.
+
+        Args:
+            repository: Repository for persisting zone data
+            api_client: API client for fetching game logs and play-by-play
+            season: Season string (e.g., "2025-26")
+            retry_strategy: Optional retry strategy for API calls
+            delay: Average spacing in seconds between play-by-play requests
+            max_workers: Number of play-by-play requests allowed in flight
+            rate_limiter: Optional shared limiter (defaults to one request per `delay`)
+        """
         self.repository = repository
         self.api_client = api_client
         self.season = season
         self.retry_strategy = retry_strategy or RetryStrategy(max_retries=3)
         self.delay = delay
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or TokenBucket.from_delay(delay)
 
     def should_update(self, player_id: int) -> bool:
         """Check if player assist zones need updating."""
@@ -156,11 +197,8 @@ class AssistZoneCollector(BaseCollector):
 
         # Filter to only new games with assists
         new_games = []
-        for _, row in game_logs_df.iterrows():
-            game_id = row.get('Game_ID', '')
-            game_date = row.get('GAME_DATE', '')
-            assists_in_game = row.get('AST', 0)
-
+        game_rows = game_logs_df.reindex(columns=['Game_ID', 'GAME_DATE', 'AST'])
+        for game_id, game_date, assists_in_game in game_rows.itertuples(index=False, name=None):
             if game_id in completed_games:
                 continue
             if not assists_in_game or assists_in_game == 0:
@@ -173,45 +211,48 @@ class AssistZoneCollector(BaseCollector):
         if not new_games:
             return Result.skipped(f"All {len(game_logs_df)} games already processed")
 
-        # Process each new game
+        # Fetch play-by-play concurrently; aggregation and repository writes
+        # stay on this thread as results arrive
         total_new_assists = 0
-        for i, game in enumerate(new_games):
-            game_id = game['game_id']
-            game_date = game['game_date']
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {
+                executor.submit(self._fetch_game_assist_events, game['game_id']): game
+                for game in new_games
+            }
 
-            try:
-                game_assists = self._get_game_assist_events(game_id)
+            for future in as_completed(futures):
+                game = futures[future]
+                game_id = game['game_id']
 
-                if game_assists:
-                    # Aggregate this game's assists by zone
-                    zone_stats = self._aggregate_assists_by_zone(
-                        player_id, player_name, game_assists, team_id=team_id
-                    )
+                try:
+                    game_assists = future.result()
 
-                    # Accumulate into existing totals
-                    zones = self._zone_stats_to_models(player_id, zone_stats)
-                    self.repository.accumulate_assist_zones(player_id, self.season, zones)
-
-                    assists_found = sum(s['assists'] for s in zone_stats.values())
-                    total_new_assists += assists_found
-                else:
-                    assists_found = 0
-
-                # Mark game as completed
-                self.repository.mark_game_completed(
-                    player_id, self.season, game_id, game_date, assists_found
-                )
-
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).warning(
-                    "Error fetching assist events for game %s, player %d: %s", game_id, player_id, e
-                )
-                # Don't mark as completed - will be retried on next run
-                continue
+                    if not game_assists.empty:
+                        # Aggregate this game's assists by zone
+                        zone_stats = self._aggregate_assists_by_zone(
+                            player_id, player_name, game_assists, team_id=team_id
+                        )
 
-            if i < len(new_games) - 1:
-                time.sleep(self.delay)
+                        # Accumulate into existing totals
+                        zones = self._zone_stats_to_models(player_id, zone_stats)
+                        self.repository.accumulate_assist_zones(player_id, self.season, zones)
+
+                        assists_found = sum(s['assists'] for s in zone_stats.values())
+                        total_new_assists += assists_found
+                    else:
+                        assists_found = 0
+
+                    # Mark game as completed
+                    self.repository.mark_game_completed(
+                        player_id, self.season, game_id, game['game_date'], assists_found
+                    )
+
+                except Exception as e:
+                    logger.warning(
+                        "Error fetching assist events for game %s, player %d: %s", game_id, player_id, e
+                    )
+                    # Don't mark as completed - will be retried on next run
+                    continue
 
         return Result.success(
             {'games_processed': len(new_games), 'assists_added': total_new_assists},
@@ -239,48 +280,124 @@ class AssistZoneCollector(BaseCollector):
             return self.retry_strategy.execute(fetch_func)
         return fetch_func()
 
-    def _get_game_assist_events(self, game_id: str) -> List[Dict]:
-        """Parse a game's play-by-play to extract all assist events."""
-        df = self._fetch_with_retry(
-            lambda: self.api_client.get_play_by_play(game_id)
-        )
+    def _fetch_game_assist_events(self, game_id: str) -> pd.DataFrame:
+        """Get a game's assist events from the cache, or fetch them under the rate limiter."""
+        cache = AssistZoneCollector._events_cache
+        with self._events_cache_lock:
+            if game_id in cache:
+                cache.move_to_end(game_id)
+                return cache[game_id]
+
+        assists = self._get_game_assist_events(game_id)
+
+        # Empty results are not cached: play-by-play may not be published yet
+        if not assists.empty:
+            with self._events_cache_lock:
+                cache[game_id] = assists
+                if len(cache) > self.EVENTS_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return assists
+
+    @classmethod
+    def clear_events_cache(cls) -> None:
+        """Drop all cached play-by-play assist events."""
+        with cls._events_cache_lock:
+            cls._events_cache.clear()
+
+    def _get_game_assist_events(self, game_id: str) -> pd.DataFrame:
+        """Parse a game's play-by-play into a frame of assist events (ASSIST_EVENT_COLUMNS)."""
+        def fetch():
+            # Every attempt, retries included, takes a token: error bursts
+            # are exactly when the API is throttling
+            self.rate_limiter.acquire()
+            return self.api_client.get_play_by_play(game_id)
+
+        df = self._fetch_with_retry(fetch)
 
         if df is None or df.empty:
-            return []
+            return pd.DataFrame(columns=ASSIST_EVENT_COLUMNS)
+        if 'shotResult' not in df.columns or 'description' not in df.columns:
+            return pd.DataFrame(columns=ASSIST_EVENT_COLUMNS)
+
+        # Cheap substring prefilter: only made field goals whose description
+        # carries an assist credit ever reach the regex
+        candidates = df[
+            (df['shotResult'] == 'Made')
+            & df['description'].str.contains(' AST)', regex=False, na=False)
+        ]
 
-        assists = []
+        columns = candidates.reindex(columns=['description', 'xLegacy', 'yLegacy', 'period', 'teamId'])
 
-        for _, row in df.iterrows():
-            # Only look at made field goals
-            if row.get('shotResult') != 'Made':
-                continue
+        rows = []
 
-            description = row.get('description', '')
-            if not description or 'AST' not in description:
+        for description, x, y, period, team_id in columns.itertuples(index=False, name=None):
+            if description.find(' PTS) ') < 0:
                 continue
 
-            match = self.ASSIST_PATTERN.search(description)
-            if not match:
+            names = self._parse_assist_description(description)
+            if names is None:
                 continue
 
-            assists.append({
-                'game_id': game_id,
-                'shooter_name': match.group('shooter').strip(),
-                'passer_name': match.group('passer').strip(),
-                'x': row.get('xLegacy', 0) or 0,
-                'y': row.get('yLegacy', 0) or 0,
-                'period': row.get('period'),
-                'team_id': row.get('teamId'),
-                'description': description
-            })
+            shooter_name, passer_name = names
+            rows.append((
+                game_id,
+                shooter_name,
+                passer_name,
+                passer_name.lower(),
+                x, y, period, team_id,
+                description,
+            ))
 
+        assists = pd.DataFrame(rows, columns=ASSIST_EVENT_COLUMNS)
+        assists[['x', 'y']] = assists[['x', 'y']].fillna(0)
         return assists
 
+    @classmethod
+    def _parse_assist_description(cls, description: str) -> Optional[Tuple[str, str]]:
+        """Extract (shooter, passer) from an assisted-shot description.
+
+        Well-formed descriptions ("<shooter> <shot> (<pts> PTS) (<passer> <n> AST)")
+        are split with plain string operations; anything irregular falls back
+        to ASSIST_PATTERN, which defines the accepted format.
+        """
+        if description.endswith(' AST)'):
+            tail_start = description.rfind(' (')
+            head = description[:tail_start]
+            pts_start = head.rfind(' (')
+            tail = description[tail_start + 2:-1].rsplit(' ', 2)
+            if tail_start > 0 and pts_start > 0 and head.endswith(' PTS)') and len(tail) == 3:
+                passer, ast_count, _ = tail
+                shooter, _, shot = head[:pts_start].partition(' ')
+                if (
+                    ast_count.isdigit()
+                    and head[pts_start + 2:-5].isdigit()
+                    and cls._is_plain_name(passer)
+                    and cls._is_plain_name(shooter)
+                    and shot and len(shot) <= 60
+                    and '(' not in shot and ')' not in shot
+                ):
+                    return shooter, passer
+
+        match = cls.ASSIST_PATTERN.search(description)
+        if not match:
+            return None
+        return match.group('shooter').strip(), match.group('passer').strip()
+
+    @staticmethod
+    def _is_plain_name(name: str) -> bool:
+        """True if name is 1-40 chars with no digits, parentheses or edge whitespace."""
+        return (
+            0 < len(name) <= 40
+            and name == name.strip()
+            and '(' not in name and ')' not in name
+            and not any(char.isdigit() for char in name)
+        )
+
     def _aggregate_assists_by_zone(
         self,
         player_id: int,
         player_name: str,
-        game_assists: List[Dict],
+        game_assists: pd.DataFrame,
         team_id: int = None
     ) -> Dict[str, Dict]:
         """Aggregate assist events by zone for a specific player. 
@@ -289,15 +406,9 @@ class AssistZoneCollector(BaseCollector):
         Args:
             player_id: NBA player ID
             player_name: Player's full name
-            game_assists: List of assist events from play-by-play
+            game_assists: Frame of assist events from play-by-play
             team_id: Player's team ID (unused, kept for API compatibility)
         """
-        zone_stats = defaultdict(lambda: {
-            'assists': 0,
-            'ast_fgm': 0,
-            'ast_fga': 0,
-        })
-
         def to_ascii(text):
             """Remove diacritics and convert to ASCII."""
             nfd = unicodedata.normalize('NFD', text)
@@ -362,49 +473,42 @@ class AssistZoneCollector(BaseCollector):
         last_name_lower = last_name.lower() if len(name_parts) >= 2 else player_name.lower()
         high_confidence_variations = name_variations - {last_name_lower, to_ascii(last_name).lower() if len(name_parts) >= 2 else ''}
 
-        # First pass: find high-confidence matches
-        matched_assists = []
-        last_name_only_assists = []
-
-        for assist in game_assists:
-            passer = assist['passer_name'].strip()
-            passer_lower = passer.lower()
+        passers = game_assists['passer_name_lc']
 
-            if passer_lower in high_confidence_variations:
-                matched_assists.append(assist)
-            elif passer_lower == last_name_lower:
-                last_name_only_assists.append(assist)
+        # First pass: find high-confidence matches
+        matched = passers.isin(high_confidence_variations)
+        last_name_only = passers == last_name_lower
 
         # Second pass: include last-name-only if unambiguous
-        if last_name_only_assists:
+        if last_name_only.any():
             # Check for ambiguity: other player formats OR multiple teams with same last name
-            other_players_with_lastname = set()
-            teams_with_lastname = set()
-            for assist in game_assists:
-                passer_lower = assist['passer_name'].strip().lower()
-                if last_name_lower in passer_lower:
-                    if passer_lower != last_name_lower:
-                        # Found another player format like "B. James" vs "L. James"
-                        other_players_with_lastname.add(passer_lower)
-                    else:
-                        # Track which teams have just last name
-                        teams_with_lastname.add(assist.get('team_id'))
+            # (e.g. "B. James" vs "L. James")
+            other_players_with_lastname = (
+                passers.str.contains(last_name_lower, regex=False) & ~last_name_only
+            ).any()
+            teams_with_lastname = game_assists.loc[last_name_only, 'team_id'].nunique(dropna=False)
 
-            if not other_players_with_lastname and len(teams_with_lastname) == 1:
+            if not other_players_with_lastname and teams_with_lastname == 1:
                 # No other formats and only one team - safe to include all
-                matched_assists.extend(last_name_only_assists)
+                matched |= last_name_only
             elif team_id and not other_players_with_lastname:
                 # Multiple teams but we have team_id - filter by team
-                for assist in last_name_only_assists:
-                    if assist.get('team_id') == team_id:
-                        matched_assists.append(assist)
+                matched |= last_name_only & (game_assists['team_id'] == team_id)
             # else: too ambiguous, skip last-name-only matches
 
         # Aggregate matched assists by zone
-        for assist in matched_assists:
-            zone_name = get_zone_from_coordinates(int(assist['x']), int(assist['y']))
-            zone_stats[zone_name]['assists'] += 1
-            zone_stats[zone_name]['ast_fgm'] += 1
+        matched_assists = game_assists.loc[matched]
+        counts = count_zones_from_coordinates(
+            matched_assists['x'].to_numpy(),
+            matched_assists['y'].to_numpy(),
+        )
 
-        return dict(zone_stats)
+        return {
+            ZONE_NAMES[zone_id]: {
+                'assists': int(counts[zone_id]),
+                'ast_fgm': int(counts[zone_id]),
+                'ast_fga': 0,
+            }
+            for zone_id in np.flatnonzero(counts)
+        }
 
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 import os
 
+__all__ = ['Config', 'APIConfig', 'get_db_path', 'DEFAULT_DB_PATH']
+
 # Default database path constant
 DEFAULT_DB_PATH = 'data/nba_stats.db'
 
@@ -40,8 +42,8 @@ class Config:
             season = os.getenv('NBA_SEASON', '2025-26'),
             db_path = get_db_path(),
             api=APIConfig(
-                timeout = int(os.getenv('API_TIMEOUT', 30)),
-                delay = float(os.getenv('API_DELAY', 0.6)),
+                timeout = int(os.getenv('API_TIMEOUT', '30')),
+                delay = float(os.getenv('API_DELAY', '0.6')),
             )
         )
     
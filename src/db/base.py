@@ -1,3 +1,5 @@
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, List, TypeVar, Generic
 
@@ -28,4 +30,43 @@ class BaseRepository(ABC, Generic[T]):
     @abstractmethod
     def exists(self, entity_id: int) -> bool:
         """Check if entity exists."""
-        pass
\ No newline at end of file
+        pass
+
+
+class ThreadLocalConnectionMixin:
+    """Keeps one SQLite connection open per thread for a repository.
+
+    Repositories call `_get_connection()` freely; the connection is opened
+    on first use in each thread and reused until `close()`. Subclasses
+    customize connection setup by overriding `_open_connection()`.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Read pages straight from a memory map instead of read() per page
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        return conn
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this repository."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
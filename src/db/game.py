@@ -3,10 +3,186 @@
 import sqlite3
 from abc import abstractmethod
 from datetime import date
-from typing import Optional, List
-from .base import BaseRepository
+from functools import lru_cache
+from itertools import groupby
+from typing import Callable, Dict, Iterable, Optional, List, Tuple, TypeVar
+from .base import BaseRepository, ThreadLocalConnectionMixin
 from ..models.game import GameLog, Game, PlayerGameSummary
 
+T = TypeVar('T')
+
+# Rows pulled per fetchmany() call when converting result sets
+_FETCH_BATCH_SIZE = 1024
+
+# Keep IN (...) lists under SQLite's default host-parameter limit (999)
+_MAX_IN_PARAMS = 900
+
+# Explicit column lists for hot reads: only the columns the row readers
+# consume, so wide rows are not materialized column-by-column
+_GAME_COLUMNS = "game_id, game_date, home_team_id, away_team_id, home_score, away_score"
+_GAME_LOG_COLUMNS = (
+    "player_id, player_name, game_id, game_date, team_id, opponent_abbr, is_home, "
+    "min, pts, reb, ast, stl, blk, tov, fgm, fga, fg3m, fg3a, ftm, fta"
+)
+
+_UPSERT_GAME_SQL = """
+    INSERT OR REPLACE INTO schedule
+    (game_id, game_date, home_team_id, home_team_abbr,
+     away_team_id, away_team_abbr, home_score, away_score, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Use actual schema column names (min, pts, reb, ast, stl, blk, tov)
+_UPSERT_GAME_LOG_SQL = """
+    INSERT OR REPLACE INTO player_game_logs
+    (player_id, game_id, game_date, team_id, opponent_abbr, is_home,
+     min, pts, reb, ast, stl, blk, tov,
+     fgm, fga, fg3m, fg3a, ftm, fta)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _game_params(game: Game) -> tuple:
+    return (
+        game.game_id, game.game_date.isoformat(),
+        game.home_team_id, game.home_team_abbr,
+        game.away_team_id, game.away_team_abbr,
+        game.home_score, game.away_score, game.status,
+    )
+
+
+def _game_log_params(log: GameLog) -> tuple:
+    return (
+        log.player_id, log.game_id, log.game_date.isoformat(),
+        log.team_id, log.opponent_abbr, log.is_home,
+        log.minutes, log.points, log.rebounds, log.assists,
+        log.steals, log.blocks, log.turnovers,
+        log.fgm, log.fga, log.fg3m, log.fg3a, log.ftm, log.fta,
+    )
+
+
+def _to_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _execute_tuples(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+    """Execute on a cursor that yields plain tuples instead of sqlite3.Row."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    return cursor
+
+
+def _column_names(cursor: sqlite3.Cursor) -> Tuple[str, ...]:
+    return tuple(column[0] for column in cursor.description)
+
+
+def _convert_rows(cursor: sqlite3.Cursor, convert: Callable[[tuple], T]) -> List[T]:
+    """Convert rows in fetchmany batches so raw rows never all sit in memory at once."""
+    result = []
+    while True:
+        batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        if not batch:
+            return result
+        result.extend(convert(row) for row in batch)
+
+
+@lru_cache(maxsize=32)
+def _game_reader(columns: Tuple[str, ...]) -> Callable[[tuple], Game]:
+    """Build a tuple-row -> Game converter specialized to one column layout."""
+    index = {name: i for i, name in enumerate(columns)}
+    game_id_i = index['game_id']
+    game_date_i = index['game_date']
+    home_team_id_i = index['home_team_id']
+    away_team_id_i = index['away_team_id']
+    home_abbr_i = index.get('home_team_abbr')
+    away_abbr_i = index.get('away_team_abbr')
+    home_score_i = index.get('home_score')
+    away_score_i = index.get('away_score')
+    status_i = index.get('status')
+
+    def to_game(row: tuple) -> Game:
+        return Game(
+            game_id=row[game_id_i],
+            game_date=_to_date(row[game_date_i]),
+            home_team_id=row[home_team_id_i],
+            home_team_abbr=row[home_abbr_i] if home_abbr_i is not None else '',
+            away_team_id=row[away_team_id_i],
+            away_team_abbr=row[away_abbr_i] if away_abbr_i is not None else '',
+            home_score=row[home_score_i] if home_score_i is not None else None,
+            away_score=row[away_score_i] if away_score_i is not None else None,
+            status=row[status_i] if status_i is not None else 'scheduled',
+        )
+
+    return to_game
+
+
+@lru_cache(maxsize=32)
+def _game_log_reader(columns: Tuple[str, ...]) -> Callable[[tuple], GameLog]:
+    """Build a tuple-row -> GameLog converter specialized to one column layout.
+
+    Handles both old column names (minutes, points, ...) and actual schema
+    names (min, pts, ...).
+    """
+    index = {name: i for i, name in enumerate(columns)}
+
+    def first(*names):
+        for name in names:
+            if name in index:
+                return index[name]
+        return None
+
+    player_id_i = index['player_id']
+    game_id_i = index['game_id']
+    game_date_i = index['game_date']
+    team_id_i = index['team_id']
+    player_name_i = index.get('player_name')
+    team_abbr_i = index.get('team_abbr')
+    opponent_id_i = index.get('opponent_id')
+    opponent_abbr_i = index.get('opponent_abbr')
+    is_home_i = index.get('is_home')
+    minutes_i = first('min', 'minutes')
+    points_i = first('pts', 'points')
+    rebounds_i = first('reb', 'rebounds')
+    assists_i = first('ast', 'assists')
+    steals_i = first('stl', 'steals')
+    blocks_i = first('blk', 'blocks')
+    turnovers_i = first('tov', 'turnovers')
+    fgm_i, fga_i = index['fgm'], index['fga']
+    fg3m_i, fg3a_i = index['fg3m'], index['fg3a']
+    ftm_i, fta_i = index['ftm'], index['fta']
+
+    def stat(row: tuple, i: Optional[int]):
+        return (row[i] or 0) if i is not None else 0
+
+    def to_game_log(row: tuple) -> GameLog:
+        return GameLog(
+            player_id=row[player_id_i],
+            player_name=row[player_name_i] if player_name_i is not None else '',
+            game_id=row[game_id_i],
+            game_date=_to_date(row[game_date_i]),
+            team_id=row[team_id_i],
+            team_abbr=row[team_abbr_i] if team_abbr_i is not None else '',
+            opponent_id=row[opponent_id_i] if opponent_id_i is not None else 0,
+            opponent_abbr=row[opponent_abbr_i] if opponent_abbr_i is not None else '',
+            is_home=bool(row[is_home_i]) if is_home_i is not None else False,
+            minutes=float(stat(row, minutes_i)),
+            points=int(stat(row, points_i)),
+            rebounds=int(stat(row, rebounds_i)),
+            assists=int(stat(row, assists_i)),
+            steals=int(stat(row, steals_i)),
+            blocks=int(stat(row, blocks_i)),
+            turnovers=int(stat(row, turnovers_i)),
+            fgm=int(row[fgm_i] or 0),
+            fga=int(row[fga_i] or 0),
+            fg3m=int(row[fg3m_i] or 0),
+            fg3a=int(row[fg3a_i] or 0),
+            ftm=int(row[ftm_i] or 0),
+            fta=int(row[fta_i] or 0),
+        )
+
+    return to_game_log
+
 
 class GameRepository(BaseRepository[Game]):
     """Abstract interface for game data access."""
@@ -21,6 +197,11 @@ class GameRepository(BaseRepository[Game]):
         """Get recent games for a team."""
         pass
 
+    @abstractmethod
+    def save_many(self, games: List[Game]) -> None:
+        """Save multiple games in a single transaction."""
+        pass
+
 
 class GameLogRepository(BaseRepository[GameLog]):
     """Abstract interface for game log data access."""
@@ -40,265 +221,191 @@ class GameLogRepository(BaseRepository[GameLog]):
         """Get all game logs for a player against a specific opponent."""
         pass
 
+    @abstractmethod
+    def get_by_players(
+        self, player_ids: Iterable[int], since: Optional[date] = None
+    ) -> Dict[int, List[GameLog]]:
+        """Get game logs for several players at once, keyed by player ID."""
+        pass
+
+    @abstractmethod
+    def save_many(self, logs: List[GameLog]) -> None:
+        """Save multiple game logs in a single transaction."""
+        pass
 
-class SQLiteGameRepository(GameRepository):
-    """SQLite implementation of GameRepository."""
 
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+class SQLiteGameRepository(ThreadLocalConnectionMixin, GameRepository):
+    """SQLite implementation of GameRepository."""
 
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _open_connection(self) -> sqlite3.Connection:
+        # Tuned for batched writes (WAL, relaxed fsync)
+        conn = super()._open_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
+    def _fetch_games(self, sql: str, params: tuple = ()) -> List[Game]:
+        cursor = _execute_tuples(self._get_connection(), sql, params)
+        return _convert_rows(cursor, _game_reader(_column_names(cursor)))
+
     def get_by_id(self, game_id: int) -> Optional[Game]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM schedule WHERE game_id = ?",
-                (game_id,)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_game(row)
-        finally:
-            conn.close()
-
-    def _row_to_game(self, row) -> Game:
-        """Convert database row to Game dataclass."""
-        return Game(
-            game_id=row['game_id'],
-            game_date=date.fromisoformat(row['game_date']) if isinstance(row['game_date'], str) else row['game_date'],
-            home_team_id=row['home_team_id'],
-            home_team_abbr=row['home_team_abbr'] if 'home_team_abbr' in row.keys() else '',
-            away_team_id=row['away_team_id'],
-            away_team_abbr=row['away_team_abbr'] if 'away_team_abbr' in row.keys() else '',
-            home_score=row['home_score'] if 'home_score' in row.keys() else None,
-            away_score=row['away_score'] if 'away_score' in row.keys() else None,
-            status=row['status'] if 'status' in row.keys() else 'scheduled',
+        games = self._fetch_games(
+            f"SELECT {_GAME_COLUMNS} FROM schedule WHERE game_id = ?",
+            (game_id,)
         )
+        return games[0] if games else None
 
     def get_all(self) -> List[Game]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute("SELECT * FROM schedule ORDER BY game_date DESC")
-            return [self._row_to_game(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self._fetch_games(f"SELECT {_GAME_COLUMNS} FROM schedule ORDER BY game_date DESC")
 
     def get_by_date(self, game_date: date) -> List[Game]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM schedule WHERE game_date = ?",
-                (game_date.isoformat(),)
-            )
-            return [self._row_to_game(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self._fetch_games(
+            f"SELECT {_GAME_COLUMNS} FROM schedule WHERE game_date = ?",
+            (game_date.isoformat(),)
+        )
 
     def get_by_team(self, team_id: int, limit: int = 10) -> List[Game]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM schedule
-                   WHERE home_team_id = ? OR away_team_id = ?
-                   ORDER BY game_date DESC LIMIT ?""",
-                (team_id, team_id, limit)
-            )
-            return [self._row_to_game(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self._fetch_games(
+            f"""SELECT {_GAME_COLUMNS} FROM schedule
+               WHERE home_team_id = ? OR away_team_id = ?
+               ORDER BY game_date DESC LIMIT ?""",
+            (team_id, team_id, limit)
+        )
 
     def save(self, game: Game) -> None:
+        self.save_many([game])
+
+    def save_many(self, games: List[Game]) -> None:
+        if not games:
+            return
         conn = self._get_connection()
-        try:
-            conn.execute("""
-                INSERT OR REPLACE INTO schedule
-                (game_id, game_date, home_team_id, home_team_abbr,
-                 away_team_id, away_team_abbr, home_score, away_score, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                game.game_id, game.game_date.isoformat(),
-                game.home_team_id, game.home_team_abbr,
-                game.away_team_id, game.away_team_abbr,
-                game.home_score, game.away_score, game.status,
-            ))
-            conn.commit()
-        finally:
-            conn.close()
+        with conn:
+            conn.executemany(_UPSERT_GAME_SQL, [_game_params(game) for game in games])
 
     def delete(self, game_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "DELETE FROM schedule WHERE game_id = ?",
-                (game_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "DELETE FROM schedule WHERE game_id = ?",
+            (game_id,)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
 
     def exists(self, game_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM schedule WHERE game_id = ?",
-                (game_id,)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "SELECT 1 FROM schedule WHERE game_id = ?",
+            (game_id,)
+        )
+        return cursor.fetchone() is not None
 
 
-class SQLiteGameLogRepository(GameLogRepository):
+class SQLiteGameLogRepository(ThreadLocalConnectionMixin, GameLogRepository):
     """SQLite implementation of GameLogRepository."""
 
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _open_connection(self) -> sqlite3.Connection:
+        # Tuned for batched writes (WAL, relaxed fsync)
+        conn = super()._open_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
+    def _fetch_game_logs(self, sql: str, params: tuple = ()) -> List[GameLog]:
+        cursor = _execute_tuples(self._get_connection(), sql, params)
+        return _convert_rows(cursor, _game_log_reader(_column_names(cursor)))
+
     def get_by_id(self, log_id: int) -> Optional[GameLog]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM player_game_logs WHERE id = ?",
-                (log_id,)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_game_log(row)
-        finally:
-            conn.close()
-
-    def _row_to_game_log(self, row) -> GameLog:
-        """Convert database row to GameLog dataclass."""
-        keys = row.keys()
-        # Handle both old column names and actual schema names
-        return GameLog(
-            player_id=row['player_id'],
-            player_name=row['player_name'] if 'player_name' in keys else '',
-            game_id=row['game_id'],
-            game_date=date.fromisoformat(row['game_date']) if isinstance(row['game_date'], str) else row['game_date'],
-            team_id=row['team_id'],
-            team_abbr=row['team_abbr'] if 'team_abbr' in keys else '',
-            opponent_id=row['opponent_id'] if 'opponent_id' in keys else 0,
-            opponent_abbr=row['opponent_abbr'] if 'opponent_abbr' in keys else '',
-            is_home=bool(row['is_home']) if 'is_home' in keys else False,
-            minutes=float(row['min'] if 'min' in keys else row.get('minutes', 0) or 0),
-            points=int(row['pts'] if 'pts' in keys else row.get('points', 0) or 0),
-            rebounds=int(row['reb'] if 'reb' in keys else row.get('rebounds', 0) or 0),
-            assists=int(row['ast'] if 'ast' in keys else row.get('assists', 0) or 0),
-            steals=int(row['stl'] if 'stl' in keys else row.get('steals', 0) or 0),
-            blocks=int(row['blk'] if 'blk' in keys else row.get('blocks', 0) or 0),
-            turnovers=int(row['tov'] if 'tov' in keys else row.get('turnovers', 0) or 0),
-            fgm=int(row['fgm'] or 0),
-            fga=int(row['fga'] or 0),
-            fg3m=int(row['fg3m'] or 0),
-            fg3a=int(row['fg3a'] or 0),
-            ftm=int(row['ftm'] or 0),
-            fta=int(row['fta'] or 0),
+        logs = self._fetch_game_logs(
+            f"SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs WHERE id = ?",
+            (log_id,)
         )
+        return logs[0] if logs else None
 
     def get_all(self) -> List[GameLog]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM player_game_logs ORDER BY game_date DESC LIMIT 1000"
-            )
-            return [self._row_to_game_log(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self._fetch_game_logs(
+            f"SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs ORDER BY game_date DESC LIMIT 1000"
+        )
 
     def get_by_player(self, player_id: int, limit: int = 10) -> List[GameLog]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM player_game_logs
-                   WHERE player_id = ?
-                   ORDER BY game_date DESC LIMIT ?""",
-                (player_id, limit)
+        return self._fetch_game_logs(
+            f"""SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs
+               WHERE player_id = ?
+               ORDER BY game_date DESC LIMIT ?""",
+            (player_id, limit)
+        )
+
+    def get_by_players(
+        self, player_ids: Iterable[int], since: Optional[date] = None
+    ) -> Dict[int, List[GameLog]]:
+        """
+        Get game logs for many players with one query per chunk of IDs.
+
+        Args:
+            player_ids: Player IDs to load
+            since: Only include games on or after this date
+
+        Returns:
+            Dict of player ID to game logs (most recent first); players
+            without logs are omitted
+        """
+        ids = list(dict.fromkeys(player_ids))
+        date_clause = " AND game_date >= ?" if since else ""
+        date_params = (since.isoformat(),) if since else ()
+
+        result: Dict[int, List[GameLog]] = {}
+        for start in range(0, len(ids), _MAX_IN_PARAMS):
+            chunk = ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            logs = self._fetch_game_logs(
+                f"""SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs
+                   WHERE player_id IN ({placeholders}){date_clause}
+                   ORDER BY player_id, game_date DESC""",
+                (*chunk, *date_params)
             )
-            return [self._row_to_game_log(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+            # Older databases store player_id as TEXT; key results by the integer ID
+            for player_id, player_logs in groupby(logs, key=lambda log: log.player_id):
+                result[int(player_id)] = list(player_logs)
+        return result
 
     def get_by_player_and_date(self, player_id: int, game_date: date) -> Optional[GameLog]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM player_game_logs
-                   WHERE player_id = ? AND game_date = ?""",
-                (player_id, game_date.isoformat())
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_game_log(row)
-        finally:
-            conn.close()
+        logs = self._fetch_game_logs(
+            f"""SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs
+               WHERE player_id = ? AND game_date = ?""",
+            (player_id, game_date.isoformat())
+        )
+        return logs[0] if logs else None
 
     def get_player_vs_opponent(self, player_id: int, opponent_id: int) -> List[GameLog]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM player_game_logs
-                   WHERE player_id = ? AND opponent_id = ?
-                   ORDER BY game_date DESC""",
-                (player_id, opponent_id)
-            )
-            return [self._row_to_game_log(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self._fetch_game_logs(
+            f"""SELECT {_GAME_LOG_COLUMNS} FROM player_game_logs
+               WHERE player_id = ? AND opponent_id = ?
+               ORDER BY game_date DESC""",
+            (player_id, opponent_id)
+        )
 
     def save(self, log: GameLog) -> None:
+        self.save_many([log])
+
+    def save_many(self, logs: List[GameLog]) -> None:
+        if not logs:
+            return
         conn = self._get_connection()
-        try:
-            # Use actual schema column names (min, pts, reb, ast, stl, blk, tov)
-            conn.execute("""
-                INSERT OR REPLACE INTO player_game_logs
-                (player_id, game_id, game_date, team_id, opponent_abbr, is_home,
-                 min, pts, reb, ast, stl, blk, tov,
-                 fgm, fga, fg3m, fg3a, ftm, fta)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                log.player_id, log.game_id, log.game_date.isoformat(),
-                log.team_id, log.opponent_abbr, log.is_home,
-                log.minutes, log.points, log.rebounds, log.assists,
-                log.steals, log.blocks, log.turnovers,
-                log.fgm, log.fga, log.fg3m, log.fg3a, log.ftm, log.fta,
-            ))
-            conn.commit()
-        finally:
-            conn.close()
+        with conn:
+            conn.executemany(_UPSERT_GAME_LOG_SQL, [_game_log_params(log) for log in logs])
 
     def delete(self, log_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "DELETE FROM player_game_logs WHERE id = ?",
-                (log_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "DELETE FROM player_game_logs WHERE id = ?",
+            (log_id,)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
 
     def exists(self, log_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM player_game_logs WHERE id = ?",
-                (log_id,)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "SELECT 1 FROM player_game_logs WHERE id = ?",
+            (log_id,)
+        )
+        return cursor.fetchone() is not None
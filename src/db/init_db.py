@@ -6,15 +6,866 @@ This should be run once when setting up the project for the first time.
 
 Usage:
     python init_db.py
+
+After the initial data load, call vacuum_and_analyze() once so the query
+planner has table statistics.
 """
 
 import sqlite3
+from contextlib import closing, contextmanager
+from typing import Iterator, Optional, Sequence
+
+# WAL is persistent in the database file, so setting it here once switches
+# every later connection to WAL (concurrent readers, no rollback-journal
+# fsync per commit). The remaining settings tune this connection's DDL run;
+# mmap_size is per-connection too, so long-lived repository connections set
+# their own (see ThreadLocalConnectionMixin).
+_INIT_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA busy_timeout=5000",
+)
+
+# Narrow tables keyed by a natural composite primary key are declared
+# STRICT, WITHOUT ROWID: rows live in one B-tree clustered on the key instead
+# of a rowid table plus a separate PK index. Wide tables (game logs, rolling
+# stats) stay on rowid storage, which handles large rows better.
+#
+# Foreign keys are DEFERRABLE INITIALLY DEFERRED: connections that enable
+# PRAGMA foreign_keys check them at COMMIT, so bulk loads can write children
+# before parents inside one transaction.
+#
+# Timestamps that are only ever filled by their DEFAULT are INTEGER unix
+# epochs (unixepoch()); read them with datetime(col, 'unixepoch'). Columns
+# the collectors write and parse as text, or the backend decodes as strings,
+# keep CURRENT_TIMESTAMP.
+
+# =========================================================================
+# PLAYER STATS TABLE
+# =========================================================================
+_DDL_PLAYER_STATS = """
+CREATE TABLE IF NOT EXISTS player_stats (
+    player_id INTEGER PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    season TEXT NOT NULL,
+    team_id INTEGER,
+    position TEXT,
+
+    -- Basic stats (per-game averages)
+    points REAL,
+    assists REAL,
+    rebounds REAL,
+    threes_made REAL,
+    threes_attempted REAL,
+    fg_attempted REAL,
+    steals REAL,
+    blocks REAL,
+    turnovers REAL,
+    fouls REAL,
+    ft_attempted REAL,
+
+    -- Combo stats (calculated per-game averages)
+    pts_plus_ast REAL,
+    pts_plus_reb REAL,
+    ast_plus_reb REAL,
+    pts_plus_ast_plus_reb REAL,
+    steals_plus_blocks REAL,
+
+    -- Achievements (totals)
+    double_doubles INTEGER,
+    triple_doubles INTEGER,
+
+    -- Quarter/Half stats (per-game averages)
+    q1_points REAL,
+    q1_assists REAL,
+    q1_rebounds REAL,
+    first_half_points REAL,
+
+    -- Metadata
+    games_played INTEGER,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    player_name_lower TEXT GENERATED ALWAYS AS (LOWER(player_name)) VIRTUAL,
+
+    FOREIGN KEY (team_id) REFERENCES teams(team_id) DEFERRABLE INITIALLY DEFERRED
+);
+
+-- Name search: prefix lookups are range scans on the lowercased name
+CREATE INDEX IF NOT EXISTS idx_player_name_lower ON player_stats(player_name_lower);
+"""
 
 
-def init_database(db_path: str = None) -> None:
-    from src.config import get_db_path
-    if db_path is None:
-        db_path = get_db_path()
+# =========================================================================
+# PLAYER SHOOTING ZONES TABLE (6 zones, excluding Backcourt)
+# =========================================================================
+_DDL_PLAYER_SHOOTING_ZONES = """
+CREATE TABLE IF NOT EXISTS player_shooting_zones (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    zone_name TEXT NOT NULL,
+
+    -- Core shooting stats (per-game averages)
+    fgm REAL,
+    fga REAL,
+    fg_pct REAL,
+    efg_pct REAL,
+
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (player_id, season, zone_name),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED
+) STRICT, WITHOUT ROWID;
+"""
+
+
+# =========================================================================
+# PLAYER ASSIST ZONES TABLE (where assists lead to baskets)
+# =========================================================================
+_DDL_PLAYER_ASSIST_ZONES = """
+CREATE TABLE IF NOT EXISTS player_assist_zones (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    zone_name TEXT NOT NULL,
+    zone_area TEXT DEFAULT '',
+    zone_range TEXT DEFAULT '',
+
+    -- Assist stats by zone (totals, convert to per-game when querying)
+    ast INTEGER DEFAULT 0,
+    fgm INTEGER DEFAULT 0,
+    fga INTEGER DEFAULT 0,
+
+    -- Metadata
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (player_id, season, zone_name),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED
+) STRICT, WITHOUT ROWID;
+"""
+
+
+# =========================================================================
+# PLAYER PLAY TYPES TABLE (Synergy play type statistics)
+# =========================================================================
+_DDL_PLAYER_PLAY_TYPES = """
+CREATE TABLE IF NOT EXISTS player_play_types (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    play_type TEXT NOT NULL,
+
+    -- Scoring stats
+    points REAL,
+    points_per_game REAL,
+
+    -- Possession stats
+    possessions REAL,
+    poss_per_game REAL,
+
+    -- Efficiency stats
+    ppp REAL,
+    fg_pct REAL,
+
+    -- Breakdown
+    pct_of_total_points REAL,
+
+    -- Metadata
+    games_played INTEGER,
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (player_id, season, play_type),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED
+) STRICT, WITHOUT ROWID;
+"""
+
+
+# =========================================================================
+# PLAYER GAME LOGS TABLE (individual game stats)
+# =========================================================================
+_DDL_PLAYER_GAME_LOGS = """
+CREATE TABLE IF NOT EXISTS player_game_logs (
+    game_id TEXT,
+    player_id INTEGER,
+    player_name TEXT,
+    team_id INTEGER,
+    season TEXT,
+    game_date DATE,
+    matchup TEXT,
+    wl TEXT,
+    min REAL,
+    pts INTEGER,
+    reb INTEGER,
+    ast INTEGER,
+    stl INTEGER,
+    blk INTEGER,
+    fgm INTEGER,
+    fga INTEGER,
+    fg_pct REAL,
+    fg3m INTEGER,
+    fg3a INTEGER,
+    fg3_pct REAL,
+    ftm INTEGER,
+    fta INTEGER,
+    ft_pct REAL,
+    tov INTEGER,
+    pf INTEGER,
+    oreb INTEGER,
+    dreb INTEGER,
+    plus_minus INTEGER,
+    is_home INTEGER,
+    opponent_abbr TEXT,
+    days_rest INTEGER,
+    is_back_to_back INTEGER,
+    opponent_days_rest INTEGER,
+    PRIMARY KEY (game_id, player_id),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED,
+    FOREIGN KEY (team_id) REFERENCES teams(team_id) DEFERRABLE INITIALLY DEFERRED
+);
+
+-- Hot box-score columns kept densely packed in a covering index: per-player
+-- date-range reads of these never touch the wide row pages, and its
+-- (player_id, game_date) prefix replaces idx_game_logs_player_date
+DROP INDEX IF EXISTS idx_game_logs_player_date;
+CREATE INDEX IF NOT EXISTS idx_game_logs_covering ON player_game_logs(
+    player_id, game_date, min, pts, reb, ast, fgm, fga, fg3m, plus_minus
+);
+CREATE INDEX IF NOT EXISTS idx_game_logs_game_id ON player_game_logs(game_id);
+DROP INDEX IF EXISTS idx_game_logs_season;
+CREATE INDEX IF NOT EXISTS idx_game_logs_season_player ON player_game_logs(season, player_id);
+CREATE INDEX IF NOT EXISTS idx_game_logs_player_opponent ON player_game_logs(player_id, opponent_abbr);
+-- Matches the rest-days window (PARTITION BY player_id, season ORDER BY
+-- game_date) so it is read in order from the index instead of sorted
+CREATE INDEX IF NOT EXISTS idx_game_logs_player_season_date ON player_game_logs(
+    player_id, season, game_date
+);
+-- Partial index over the rows still missing home/away features; it stays
+-- near-empty, so the incremental matchup UPDATE skips the full table scan
+CREATE INDEX IF NOT EXISTS idx_game_logs_home_away_pending ON player_game_logs(game_id)
+    WHERE is_home IS NULL OR opponent_abbr IS NULL;
+"""
+
+
+# =========================================================================
+# TEAM DEFENSIVE ZONES TABLE (opponent shooting by zone)
+# =========================================================================
+_DDL_TEAM_DEFENSIVE_ZONES = """
+CREATE TABLE IF NOT EXISTS team_defensive_zones (
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    zone_name TEXT NOT NULL,
+    zone_area TEXT DEFAULT '',
+    zone_range TEXT DEFAULT '',
+
+    -- Opponent shooting stats (per-game averages)
+    opp_fgm REAL,
+    opp_fga REAL,
+    -- Derived percentages in integer basis points (45.3% = 4530); readers
+    -- recompute percentages from opp_fgm/opp_fga
+    opp_fg_pct INTEGER,
+    opp_efg_pct INTEGER,
+
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (team_id, season, zone_name)
+) STRICT, WITHOUT ROWID;
+
+-- Tables from older schemas keep REAL columns holding plain percentages
+-- (45.3); rewrite every row in basis points so the units never mix
+UPDATE team_defensive_zones SET
+    opp_fg_pct = CASE WHEN opp_fga > 0 THEN CAST(round(opp_fgm / opp_fga * 10000) AS INTEGER) ELSE 0 END,
+    opp_efg_pct = CASE WHEN opp_fga > 0 THEN CAST(round(opp_fgm / opp_fga * 10000) AS INTEGER) ELSE 0 END;
+"""
+
+
+# =========================================================================
+# TEAM DEFENSIVE PLAY TYPES TABLE
+# =========================================================================
+_DDL_TEAM_DEFENSIVE_PLAY_TYPES = """
+CREATE TABLE IF NOT EXISTS team_defensive_play_types (
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    play_type TEXT NOT NULL,
+
+    -- Possession stats (what opponents do against this team)
+    poss_pct REAL,
+    possessions REAL,
+    poss_per_game REAL,
+
+    -- Efficiency stats (opponent efficiency against this defense)
+    ppp REAL,
+    fg_pct REAL,
+    efg_pct REAL,
+
+    -- Scoring stats
+    points REAL,
+    points_per_game REAL,
+
+    -- Metadata
+    games_played INTEGER,
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (team_id, season, play_type)
+) STRICT, WITHOUT ROWID;
+"""
+
+
+# =========================================================================
+# TEAMS TABLE
+# =========================================================================
+_DDL_TEAMS = """
+CREATE TABLE IF NOT EXISTS teams (
+    team_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    abbreviation TEXT NOT NULL,
+    city TEXT NOT NULL,
+    state TEXT,
+    year_founded INTEGER,
+    -- Text, not an epoch: the backend decodes it (SELECT * FROM teams) as a string
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_teams_abbreviation
+ON teams(abbreviation);
+
+-- Teams seeded while this column briefly defaulted to an epoch
+UPDATE teams SET last_updated = datetime(last_updated, 'unixepoch')
+WHERE typeof(last_updated) = 'integer';
+"""
+
+
+# =========================================================================
+# TEAM PACE TABLE (season-level pace and ratings)
+# =========================================================================
+_DDL_TEAM_PACE = """
+CREATE TABLE IF NOT EXISTS team_pace (
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+
+    -- Pace metrics
+    pace REAL,                    -- Possessions per 48 minutes
+    off_rating REAL,              -- Offensive rating (points per 100 possessions)
+    def_rating REAL,              -- Defensive rating (points allowed per 100 possessions)
+    net_rating REAL,              -- Net rating (off - def)
+
+    -- Additional context
+    games_played INTEGER,
+    wins INTEGER,
+    losses INTEGER,
+
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (team_id, season),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id) DEFERRABLE INITIALLY DEFERRED
+) STRICT, WITHOUT ROWID;
+"""
+
+
+# =========================================================================
+# SCHEDULE TABLE
+# =========================================================================
+_DDL_SCHEDULE = """
+CREATE TABLE IF NOT EXISTS schedule (
+    game_id TEXT PRIMARY KEY,
+    game_date TEXT NOT NULL,
+    game_time TEXT,
+    game_status TEXT,
+    home_team_id INTEGER NOT NULL,
+    home_team_name TEXT,
+    home_team_abbreviation TEXT,
+    home_team_city TEXT,
+    home_score INTEGER,
+    away_team_id INTEGER NOT NULL,
+    away_team_name TEXT,
+    away_team_abbreviation TEXT,
+    away_team_city TEXT,
+    away_score INTEGER,
+    last_updated INTEGER DEFAULT (unixepoch())
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_date ON schedule(game_date);
+CREATE INDEX IF NOT EXISTS idx_schedule_home_team ON schedule(home_team_abbreviation);
+CREATE INDEX IF NOT EXISTS idx_schedule_away_team ON schedule(away_team_abbreviation);
+CREATE INDEX IF NOT EXISTS idx_schedule_home_team_id ON schedule(home_team_id, game_date);
+CREATE INDEX IF NOT EXISTS idx_schedule_away_team_id ON schedule(away_team_id, game_date);
+"""
+
+
+# =========================================================================
+# PLAYER INJURIES TABLE (daily injury status with history)
+# =========================================================================
+_DDL_PLAYER_INJURIES = """
+CREATE TABLE IF NOT EXISTS player_injuries (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    team_id INTEGER,
+    injury_status TEXT NOT NULL,
+    injury_description TEXT,
+    collection_date TEXT NOT NULL,
+    source TEXT,
+    created_at INTEGER DEFAULT (unixepoch()),
+
+    UNIQUE(player_id, collection_date),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED,
+    FOREIGN KEY (team_id) REFERENCES teams(team_id) DEFERRABLE INITIALLY DEFERRED
+);
+
+-- player_id lookups use the UNIQUE(player_id, collection_date) index
+DROP INDEX IF EXISTS idx_injuries_player;
+CREATE INDEX IF NOT EXISTS idx_injuries_date ON player_injuries(collection_date);
+CREATE INDEX IF NOT EXISTS idx_injuries_status ON player_injuries(injury_status);
+"""
+
+
+# =========================================================================
+# ALL PROPS TABLE (unified props from all sources for ML)
+# =========================================================================
+_DDL_ALL_PROPS = """
+CREATE TABLE IF NOT EXISTS all_props (
+    id INTEGER PRIMARY KEY,
+
+    -- Source identification
+    source TEXT NOT NULL,           -- 'underdog', 'prizepicks', 'draftkings', etc.
+
+    -- Player info
+    full_name TEXT NOT NULL,
+    team_name TEXT,
+    opponent_name TEXT,
+    position_name TEXT,
+
+    -- Prop line details
+    stat_name TEXT NOT NULL,        -- Normalized: 'points', 'rebounds', 'assists', etc.
+    stat_value REAL NOT NULL,
+    choice TEXT NOT NULL,           -- 'over' or 'under'
+    prop_type TEXT,                 -- PrizePicks: 'standard', 'goblin', 'demon'
+
+    -- Odds (if available)
+    american_odds INTEGER,
+    decimal_odds REAL,
+
+    -- Game info
+    game_id TEXT,
+    scheduled_at TEXT,
+    game_date TEXT GENERATED ALWAYS AS (DATE(scheduled_at)) VIRTUAL,
+
+    -- Timestamps
+    updated_at TEXT NOT NULL,
+    scraped_at TEXT NOT NULL
+);
+
+-- Unique index: one prop per player/stat/line/choice/source/game. It stays on
+-- the real columns rather than a 64-bit hash: a hash collision would make
+-- INSERT OR REPLACE overwrite a different prop, and rows merged from older
+-- cloud copies or written by other tools would carry no hash to dedup on
+CREATE UNIQUE INDEX IF NOT EXISTS idx_all_props_unique
+ON all_props(source, full_name, stat_name, stat_value, choice, scheduled_at);
+-- source and full_name lookups are served by the leading columns of
+-- idx_all_props_unique and idx_all_props_player_stat
+DROP INDEX IF EXISTS idx_all_props_source;
+DROP INDEX IF EXISTS idx_all_props_player;
+CREATE INDEX IF NOT EXISTS idx_all_props_stat ON all_props(stat_name);
+CREATE INDEX IF NOT EXISTS idx_all_props_scheduled ON all_props(scheduled_at);
+CREATE INDEX IF NOT EXISTS idx_all_props_player_stat ON all_props(full_name, stat_name, scheduled_at);
+-- Plain index on the generated game_date column replaces the DATE() expression index
+DROP INDEX IF EXISTS idx_all_props_game_date;
+CREATE INDEX IF NOT EXISTS idx_all_props_date ON all_props(game_date);
+"""
+
+
+# =========================================================================
+# PER-SOURCE PROPS VIEWS (all_props is the single store for scraped props)
+# =========================================================================
+_DDL_UNDERDOG_PROPS_VIEW = """
+CREATE VIEW IF NOT EXISTS underdog_props AS
+SELECT id, full_name, team_name, opponent_name, position_name,
+       stat_name, stat_value, choice,
+       american_odds AS american_price, decimal_odds AS decimal_price,
+       scheduled_at, updated_at, scraped_at
+FROM all_props
+WHERE source = 'underdog';
+"""
+
+_DDL_PRIZEPICKS_PROPS_VIEW = """
+CREATE VIEW IF NOT EXISTS prizepicks_props AS
+SELECT id, full_name, team_name, opponent_name, position_name,
+       stat_name, stat_value, choice, prop_type,
+       game_id, scheduled_at, updated_at, scraped_at
+FROM all_props
+WHERE source = 'prizepicks';
+"""
+
+# Older databases have the per-source props as real tables that the scrapers
+# no longer write to. Their rows are copied into all_props (skipping any the
+# scrapers already mirrored there) before the table is replaced by its view.
+_LEGACY_PROPS_TABLES = {
+    'underdog_props': (_DDL_UNDERDOG_PROPS_VIEW, """
+        INSERT OR IGNORE INTO all_props (
+            source, full_name, team_name, opponent_name, position_name,
+            stat_name, stat_value, choice, american_odds, decimal_odds,
+            scheduled_at, updated_at, scraped_at
+        )
+        SELECT 'underdog', full_name, team_name, opponent_name, position_name,
+               stat_name, stat_value, choice, american_price, decimal_price,
+               scheduled_at, updated_at, scraped_at
+        FROM underdog_props AS legacy
+        WHERE NOT EXISTS (
+            SELECT 1 FROM all_props AS a
+            WHERE a.source = 'underdog' AND a.full_name = legacy.full_name
+              AND a.stat_name = legacy.stat_name AND a.stat_value = legacy.stat_value
+              AND a.choice = legacy.choice AND a.scheduled_at IS legacy.scheduled_at
+        )
+    """),
+    'prizepicks_props': (_DDL_PRIZEPICKS_PROPS_VIEW, """
+        INSERT OR IGNORE INTO all_props (
+            source, full_name, team_name, opponent_name, position_name,
+            stat_name, stat_value, choice, prop_type, game_id,
+            scheduled_at, updated_at, scraped_at
+        )
+        SELECT 'prizepicks', full_name, team_name, opponent_name, position_name,
+               stat_name, stat_value, choice, prop_type, game_id,
+               scheduled_at, updated_at, scraped_at
+        FROM prizepicks_props AS legacy
+        WHERE NOT EXISTS (
+            SELECT 1 FROM all_props AS a
+            WHERE a.source = 'prizepicks' AND a.full_name = legacy.full_name
+              AND a.stat_name = legacy.stat_name AND a.stat_value = legacy.stat_value
+              AND a.choice = legacy.choice AND a.scheduled_at IS legacy.scheduled_at
+        )
+    """),
+}
+
+
+# =========================================================================
+# PROP OUTCOMES TABLE
+# =========================================================================
+_DDL_PROP_OUTCOMES = """
+CREATE TABLE IF NOT EXISTS prop_outcomes (
+    id INTEGER PRIMARY KEY,
+
+    -- Link to original prop (optional, for traceability)
+    prop_id INTEGER,
+
+    -- Player identification
+    player_name TEXT NOT NULL,
+    player_id INTEGER,
+
+    -- Game identification
+    game_id TEXT,
+    game_date TEXT NOT NULL,
+
+    -- The prop details
+    stat_type TEXT NOT NULL,
+    line REAL NOT NULL,
+
+    -- The outcome
+    actual_value REAL,
+    hit_over INTEGER,           -- 1 if actual > line, 0 otherwise
+    hit_under INTEGER,          -- 1 if actual < line, 0 otherwise
+    is_push INTEGER,            -- 1 if actual == line
+
+    -- Edge analysis
+    edge REAL,                  -- actual - line
+    edge_pct REAL,              -- (actual - line) / line * 100
+
+    -- Context at time of prop (for feature analysis)
+    season_avg REAL,
+    l5_avg REAL,
+    l10_avg REAL,
+
+    -- Metadata
+    created_at INTEGER DEFAULT (unixepoch()),
+
+    UNIQUE(player_name, game_date, stat_type, line)
+);
+
+-- player_name lookups use the UNIQUE(player_name, ...) index
+DROP INDEX IF EXISTS idx_prop_outcomes_player;
+CREATE INDEX IF NOT EXISTS idx_prop_outcomes_date ON prop_outcomes(game_date);
+CREATE INDEX IF NOT EXISTS idx_prop_outcomes_stat ON prop_outcomes(stat_type);
+CREATE INDEX IF NOT EXISTS idx_prop_outcomes_hit_over ON prop_outcomes(hit_over);
+CREATE INDEX IF NOT EXISTS idx_prop_outcomes_hit_under ON prop_outcomes(hit_under);
+"""
+
+
+# =========================================================================
+# PLAYER NAME ALIASES TABLE (for matching prop names to NBA API names)
+# =========================================================================
+_DDL_PLAYER_NAME_ALIASES = """
+CREATE TABLE IF NOT EXISTS player_name_aliases (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL,
+    canonical_name TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    source TEXT DEFAULT 'manual',
+    created_at INTEGER DEFAULT (unixepoch()),
+    UNIQUE(player_id, alias),
+    FOREIGN KEY (player_id) REFERENCES player_stats(player_id) DEFERRABLE INITIALLY DEFERRED
+);
+
+CREATE INDEX IF NOT EXISTS idx_aliases_alias ON player_name_aliases(alias);
+CREATE INDEX IF NOT EXISTS idx_aliases_canonical ON player_name_aliases(canonical_name);
+-- player_id lookups use the UNIQUE(player_id, alias) index
+DROP INDEX IF EXISTS idx_aliases_player_id;
+"""
+
+
+# =========================================================================
+# PLAYER ROLLING STATS TABLE (pre-computed rolling averages for ML)
+# =========================================================================
+_DDL_PLAYER_ROLLING_STATS = """
+CREATE TABLE IF NOT EXISTS player_rolling_stats (
+    player_id INTEGER NOT NULL,
+    game_id TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    season TEXT NOT NULL,
+
+    -- Last 5 games averages (excludes current game)
+    l5_pts REAL, l5_reb REAL, l5_ast REAL, l5_min REAL,
+    l5_stl REAL, l5_blk REAL, l5_tov REAL, l5_fg3m REAL,
+    l5_pra REAL,
+
+    -- Last 10 games averages
+    l10_pts REAL, l10_reb REAL, l10_ast REAL, l10_min REAL,
+    l10_stl REAL, l10_blk REAL, l10_tov REAL, l10_fg3m REAL,
+    l10_pra REAL,
+
+    -- Last 20 games averages
+    l20_pts REAL, l20_reb REAL, l20_ast REAL, l20_min REAL,
+    l20_pra REAL,
+
+    -- Per-36 rates (based on L10)
+    l10_pts_per36 REAL, l10_reb_per36 REAL, l10_ast_per36 REAL,
+
+    -- Trends (L5 - L10, positive = trending up)
+    pts_trend REAL, reb_trend REAL, ast_trend REAL,
+
+    -- Standard deviation (L10)
+    l10_pts_std REAL, l10_reb_std REAL, l10_ast_std REAL,
+
+    -- Minutes projection features
+    minutes_trend_slope REAL,    -- Linear regression slope on L10 minutes
+    minutes_baseline REAL,       -- Weighted average baseline minutes
+
+    -- Injury context features
+    games_since_injury_return INTEGER,  -- Games since returning from 'Out' (0-10, null if healthy)
+    is_currently_dtd INTEGER DEFAULT 0,  -- 1 if listed as Day-To-Day
+
+    -- Games in each window (for validation)
+    games_in_l5 INTEGER, games_in_l10 INTEGER, games_in_l20 INTEGER,
+
+    -- Metadata
+    last_updated INTEGER DEFAULT (unixepoch()),
+
+    PRIMARY KEY (player_id, game_id)
+);
+
+-- Covering index for per-player date-range feature reads: the most-read
+-- points/rebounds/assists features are answered from the index alone, and
+-- its (player_id, game_date) prefix replaces idx_rolling_player_date
+DROP INDEX IF EXISTS idx_rolling_player_date;
+CREATE INDEX IF NOT EXISTS idx_rolling_covering ON player_rolling_stats(
+    player_id, game_date,
+    l5_pts, l10_pts, l10_pts_std, l5_reb, l10_reb, l5_ast, l10_ast
+);
+DROP INDEX IF EXISTS idx_rolling_season;
+CREATE INDEX IF NOT EXISTS idx_rolling_season_date ON player_rolling_stats(season, game_date);
+"""
+
+
+# =========================================================================
+# PLAYER MINUTES CONTEXT TABLE (role classification for minutes projection)
+# =========================================================================
+_DDL_PLAYER_MINUTES_CONTEXT = """
+CREATE TABLE IF NOT EXISTS player_minutes_context (
+    player_id TEXT NOT NULL,
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+
+    -- Role classification
+    role_type TEXT,              -- 'star', 'starter', 'rotation', 'bench', 'end_bench'
+    position_group TEXT,         -- 'guard', 'wing', 'big'
+
+    -- Minutes metrics
+    baseline_minutes REAL,       -- Weighted average baseline
+    ceiling_minutes REAL,        -- Max minutes (season high)
+    floor_minutes REAL,          -- Min non-zero minutes
+    minutes_std REAL,            -- Standard deviation
+    dnp_rate REAL,               -- Rate of DNP games
+
+    -- Metadata
+    last_updated INTEGER DEFAULT (unixepoch()),
+
+    PRIMARY KEY (player_id, team_id, season)
+);
+
+-- player_id lookups use the primary key
+DROP INDEX IF EXISTS idx_minutes_context_player;
+CREATE INDEX IF NOT EXISTS idx_minutes_context_team ON player_minutes_context(team_id, season);
+"""
+
+
+# =========================================================================
+# TEAMMATE INJURY IMPACT TABLE (how injuries affect teammate minutes)
+# =========================================================================
+_DDL_TEAMMATE_INJURY_IMPACT = """
+CREATE TABLE IF NOT EXISTS teammate_injury_impact (
+    player_id TEXT NOT NULL,
+    injured_teammate_id TEXT NOT NULL,
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+
+    -- Impact metrics
+    minutes_impact REAL,         -- Expected minutes change (% difference)
+    sample_games INTEGER,        -- Number of games in sample
+    confidence_score REAL,       -- Confidence in the estimate (0-1)
+
+    -- Metadata
+    last_updated INTEGER DEFAULT (unixepoch()),
+
+    PRIMARY KEY (player_id, injured_teammate_id, season)
+);
+
+-- player_id lookups use the primary key
+DROP INDEX IF EXISTS idx_injury_impact_player;
+CREATE INDEX IF NOT EXISTS idx_injury_impact_teammate ON teammate_injury_impact(injured_teammate_id);
+CREATE INDEX IF NOT EXISTS idx_injury_impact_team ON teammate_injury_impact(team_id, season);
+"""
+
+# Every schema block, in creation order
+_ALL_DDL = (
+    _DDL_PLAYER_STATS,
+    _DDL_PLAYER_SHOOTING_ZONES,
+    _DDL_PLAYER_ASSIST_ZONES,
+    _DDL_PLAYER_PLAY_TYPES,
+    _DDL_PLAYER_GAME_LOGS,
+    _DDL_TEAM_DEFENSIVE_ZONES,
+    _DDL_TEAM_DEFENSIVE_PLAY_TYPES,
+    _DDL_TEAMS,
+    _DDL_TEAM_PACE,
+    _DDL_SCHEDULE,
+    _DDL_PLAYER_INJURIES,
+    _DDL_ALL_PROPS,
+    _DDL_UNDERDOG_PROPS_VIEW,
+    _DDL_PRIZEPICKS_PROPS_VIEW,
+    _DDL_PROP_OUTCOMES,
+    _DDL_PLAYER_NAME_ALIASES,
+    _DDL_PLAYER_ROLLING_STATS,
+    _DDL_PLAYER_MINUTES_CONTEXT,
+    _DDL_TEAMMATE_INJURY_IMPACT,
+)
+
+
+def _join_schema(blocks) -> str:
+    """Join DDL blocks into one script, checking each block is complete SQL."""
+    for block in blocks:
+        if not sqlite3.complete_statement(block):
+            raise ValueError(f"Incomplete schema statement: {block.strip()[:60]}...")
+    return "\n".join(blocks)
+
+
+# Full schema, built once at import and applied as a single script
+_SCHEMA_SQL = _join_schema(_ALL_DDL)
+
+# Stamped into PRAGMA user_version once the schema is applied. Bump it
+# whenever the DDL, column migrations or seed data change so existing
+# databases are brought up to date on their next init.
+_SCHEMA_VERSION = 6
+
+
+# The 30 NBA franchises (teams table seed; static, so no API call is needed)
+_NBA_TEAMS = [
+    (1610612737, 'Hawks', 'Atlanta Hawks', 'ATL', 'Atlanta', 'Georgia', 1949),
+    (1610612738, 'Celtics', 'Boston Celtics', 'BOS', 'Boston', 'Massachusetts', 1946),
+    (1610612739, 'Cavaliers', 'Cleveland Cavaliers', 'CLE', 'Cleveland', 'Ohio', 1970),
+    (1610612740, 'Pelicans', 'New Orleans Pelicans', 'NOP', 'New Orleans', 'Louisiana', 2002),
+    (1610612741, 'Bulls', 'Chicago Bulls', 'CHI', 'Chicago', 'Illinois', 1966),
+    (1610612742, 'Mavericks', 'Dallas Mavericks', 'DAL', 'Dallas', 'Texas', 1980),
+    (1610612743, 'Nuggets', 'Denver Nuggets', 'DEN', 'Denver', 'Colorado', 1976),
+    (1610612744, 'Warriors', 'Golden State Warriors', 'GSW', 'San Francisco', 'California', 1946),
+    (1610612745, 'Rockets', 'Houston Rockets', 'HOU', 'Houston', 'Texas', 1967),
+    (1610612746, 'Clippers', 'Los Angeles Clippers', 'LAC', 'Los Angeles', 'California', 1970),
+    (1610612747, 'Lakers', 'Los Angeles Lakers', 'LAL', 'Los Angeles', 'California', 1948),
+    (1610612748, 'Heat', 'Miami Heat', 'MIA', 'Miami', 'Florida', 1988),
+    (1610612749, 'Bucks', 'Milwaukee Bucks', 'MIL', 'Milwaukee', 'Wisconsin', 1968),
+    (1610612750, 'Timberwolves', 'Minnesota Timberwolves', 'MIN', 'Minnesota', 'Minnesota', 1989),
+    (1610612751, 'Nets', 'Brooklyn Nets', 'BKN', 'Brooklyn', 'New York', 1976),
+    (1610612752, 'Knicks', 'New York Knicks', 'NYK', 'New York', 'New York', 1946),
+    (1610612753, 'Magic', 'Orlando Magic', 'ORL', 'Orlando', 'Florida', 1989),
+    (1610612754, 'Pacers', 'Indiana Pacers', 'IND', 'Indiana', 'Indiana', 1976),
+    (1610612755, '76ers', 'Philadelphia 76ers', 'PHI', 'Philadelphia', 'Pennsylvania', 1949),
+    (1610612756, 'Suns', 'Phoenix Suns', 'PHX', 'Phoenix', 'Arizona', 1968),
+    (1610612757, 'Trail Blazers', 'Portland Trail Blazers', 'POR', 'Portland', 'Oregon', 1970),
+    (1610612758, 'Kings', 'Sacramento Kings', 'SAC', 'Sacramento', 'California', 1948),
+    (1610612759, 'Spurs', 'San Antonio Spurs', 'SAS', 'San Antonio', 'Texas', 1976),
+    (1610612760, 'Thunder', 'Oklahoma City Thunder', 'OKC', 'Oklahoma City', 'Oklahoma', 1967),
+    (1610612761, 'Raptors', 'Toronto Raptors', 'TOR', 'Toronto', 'Ontario', 1995),
+    (1610612762, 'Jazz', 'Utah Jazz', 'UTA', 'Utah', 'Utah', 1974),
+    (1610612763, 'Grizzlies', 'Memphis Grizzlies', 'MEM', 'Memphis', 'Tennessee', 1995),
+    (1610612764, 'Wizards', 'Washington Wizards', 'WAS', 'Washington', 'District of Columbia', 1961),
+    (1610612765, 'Pistons', 'Detroit Pistons', 'DET', 'Detroit', 'Michigan', 1948),
+    (1610612766, 'Hornets', 'Charlotte Hornets', 'CHA', 'Charlotte', 'North Carolina', 1988),
+]
+
+_SEED_TEAMS_SQL = """
+    INSERT OR IGNORE INTO teams (team_id, name, full_name, abbreviation, city, state, year_founded)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns added after their table first shipped. CREATE TABLE IF NOT EXISTS
+# leaves existing tables untouched, so these are added with ALTER TABLE.
+_ADDED_COLUMNS = (
+    ('all_props', 'game_date', "TEXT GENERATED ALWAYS AS (DATE(scheduled_at)) VIRTUAL"),
+    ('all_props', 'prop_type', "TEXT"),
+    ('player_stats', 'player_name_lower', "TEXT GENERATED ALWAYS AS (LOWER(player_name)) VIRTUAL"),
+)
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> None:
+    """Bring tables created by older schema versions up to date."""
+    for table, column, declaration in _ADDED_COLUMNS:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+        if columns and column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+
+def _replace_legacy_props_tables(conn: sqlite3.Connection) -> None:
+    """Fold per-source props tables into all_props and swap in their views."""
+    for table, (view_ddl, copy_sql) in _LEGACY_PROPS_TABLES.items():
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if legacy:
+            conn.execute(copy_sql)
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(view_ddl)
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    """Create or update every table and index on an open connection."""
+    # Already at this schema version: skip re-running every IF NOT EXISTS
+    if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+        return
+
+    _add_missing_columns(conn)
+    try:
+        # executescript() commits any pending transaction first, so the
+        # explicit BEGIN lives in the script: every statement is parsed in one
+        # pass, and the DDL plus the team seed are synced to disk once
+        conn.executescript("BEGIN;\n" + _SCHEMA_SQL)
+        _replace_legacy_props_tables(conn)
+        conn.executemany(_SEED_TEAMS_SQL, _NBA_TEAMS)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+    except sqlite3.Error:
+        # Never leave a half-created schema behind
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+def init_database(db_path: str = None, conn: Optional[sqlite3.Connection] = None) -> None:
     """
     Create all database tables for the NBA Stats Dashboard.
 
@@ -32,647 +883,92 @@ def init_database(db_path: str = None) -> None:
 
     Args:
         db_path: Path to the SQLite database file
+        conn: Existing connection to initialize instead of opening one.
+            It is left open and its PRAGMA settings are not changed.
+
+    Raises:
+        sqlite3.Error: If any DDL statement fails (the schema change is rolled back)
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # =========================================================================
-    # PLAYER STATS TABLE
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_stats (
-            player_id INTEGER PRIMARY KEY,
-            player_name TEXT NOT NULL,
-            season TEXT NOT NULL,
-            team_id INTEGER,
-            position TEXT,
-
-            -- Basic stats (per-game averages)
-            points REAL,
-            assists REAL,
-            rebounds REAL,
-            threes_made REAL,
-            threes_attempted REAL,
-            fg_attempted REAL,
-            steals REAL,
-            blocks REAL,
-            turnovers REAL,
-            fouls REAL,
-            ft_attempted REAL,
-
-            -- Combo stats (calculated per-game averages)
-            pts_plus_ast REAL,
-            pts_plus_reb REAL,
-            ast_plus_reb REAL,
-            pts_plus_ast_plus_reb REAL,
-            steals_plus_blocks REAL,
-
-            -- Achievements (totals)
-            double_doubles INTEGER,
-            triple_doubles INTEGER,
-
-            -- Quarter/Half stats (per-game averages)
-            q1_points REAL,
-            q1_assists REAL,
-            q1_rebounds REAL,
-            first_half_points REAL,
-
-            -- Metadata
-            games_played INTEGER,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            FOREIGN KEY (team_id) REFERENCES teams(team_id)
-        )
-    ''')
-
-    # =========================================================================
-    # PLAYER SHOOTING ZONES TABLE (6 zones, excluding Backcourt)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_shooting_zones (
-            player_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-            zone_name TEXT NOT NULL,
-
-            -- Core shooting stats (per-game averages)
-            fgm REAL,
-            fga REAL,
-            fg_pct REAL,
-            efg_pct REAL,
-
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (player_id, season, zone_name),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id)
-        )
-    ''')
-
-    # =========================================================================
-    # PLAYER ASSIST ZONES TABLE (where assists lead to baskets)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_assist_zones (
-            player_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-            zone_name TEXT NOT NULL,
-            zone_area TEXT DEFAULT '',
-            zone_range TEXT DEFAULT '',
-
-            -- Assist stats by zone (totals, convert to per-game when querying)
-            ast INTEGER DEFAULT 0,
-            fgm INTEGER DEFAULT 0,
-            fga INTEGER DEFAULT 0,
-
-            -- Metadata
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (player_id, season, zone_name),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id)
-        )
-    ''')
-
-    # =========================================================================
-    # PLAYER PLAY TYPES TABLE (Synergy play type statistics)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_play_types (
-            player_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-            play_type TEXT NOT NULL,
-
-            -- Scoring stats
-            points REAL,
-            points_per_game REAL,
-
-            -- Possession stats
-            possessions REAL,
-            poss_per_game REAL,
-
-            -- Efficiency stats
-            ppp REAL,
-            fg_pct REAL,
-
-            -- Breakdown
-            pct_of_total_points REAL,
-
-            -- Metadata
-            games_played INTEGER,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (player_id, season, play_type),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id)
-        )
-    ''')
-
-    # =========================================================================
-    # PLAYER GAME LOGS TABLE (individual game stats)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_game_logs (
-            game_id TEXT,
-            player_id TEXT,
-            player_name TEXT,
-            team_id INTEGER,
-            season TEXT,
-            game_date DATE,
-            matchup TEXT,
-            wl TEXT,
-            min REAL,
-            pts INTEGER,
-            reb INTEGER,
-            ast INTEGER,
-            stl INTEGER,
-            blk INTEGER,
-            fgm INTEGER,
-            fga INTEGER,
-            fg_pct REAL,
-            fg3m INTEGER,
-            fg3a INTEGER,
-            fg3_pct REAL,
-            ftm INTEGER,
-            fta INTEGER,
-            ft_pct REAL,
-            tov INTEGER,
-            pf INTEGER,
-            oreb INTEGER,
-            dreb INTEGER,
-            plus_minus INTEGER,
-            is_home INTEGER,
-            opponent_abbr TEXT,
-            days_rest INTEGER,
-            is_back_to_back INTEGER,
-            opponent_days_rest INTEGER,
-            PRIMARY KEY (game_id, player_id),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id),
-            FOREIGN KEY (team_id) REFERENCES teams(team_id)
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_logs_player_date ON player_game_logs(player_id, game_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_logs_game_id ON player_game_logs(game_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_logs_season ON player_game_logs(season)')
-
-    # =========================================================================
-    # TEAM DEFENSIVE ZONES TABLE (opponent shooting by zone)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS team_defensive_zones (
-            team_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-            zone_name TEXT NOT NULL,
-            zone_area TEXT DEFAULT '',
-            zone_range TEXT DEFAULT '',
-
-            -- Opponent shooting stats (per-game averages)
-            opp_fgm REAL,
-            opp_fga REAL,
-            opp_fg_pct REAL,
-            opp_efg_pct REAL,
-
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (team_id, season, zone_name)
-        )
-    ''')
-
-    # =========================================================================
-    # TEAM DEFENSIVE PLAY TYPES TABLE
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS team_defensive_play_types (
-            team_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-            play_type TEXT NOT NULL,
-
-            -- Possession stats (what opponents do against this team)
-            poss_pct REAL,
-            possessions REAL,
-            poss_per_game REAL,
-
-            -- Efficiency stats (opponent efficiency against this defense)
-            ppp REAL,
-            fg_pct REAL,
-            efg_pct REAL,
-
-            -- Scoring stats
-            points REAL,
-            points_per_game REAL,
-
-            -- Metadata
-            games_played INTEGER,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (team_id, season, play_type)
-        )
-    ''')
-
-    # =========================================================================
-    # TEAMS TABLE
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS teams (
-            team_id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            full_name TEXT NOT NULL,
-            abbreviation TEXT NOT NULL,
-            city TEXT NOT NULL,
-            state TEXT,
-            year_founded INTEGER,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_teams_abbreviation
-        ON teams(abbreviation)
-    ''')
-
-    # =========================================================================
-    # TEAM PACE TABLE (season-level pace and ratings)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS team_pace (
-            team_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-
-            -- Pace metrics
-            pace REAL,                    -- Possessions per 48 minutes
-            off_rating REAL,              -- Offensive rating (points per 100 possessions)
-            def_rating REAL,              -- Defensive rating (points allowed per 100 possessions)
-            net_rating REAL,              -- Net rating (off - def)
-
-            -- Additional context
-            games_played INTEGER,
-            wins INTEGER,
-            losses INTEGER,
-
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (team_id, season),
-            FOREIGN KEY (team_id) REFERENCES teams(team_id)
-        )
-    ''')
-
-    # =========================================================================
-    # SCHEDULE TABLE
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS schedule (
-            game_id TEXT PRIMARY KEY,
-            game_date TEXT NOT NULL,
-            game_time TEXT,
-            game_status TEXT,
-            home_team_id INTEGER NOT NULL,
-            home_team_name TEXT,
-            home_team_abbreviation TEXT,
-            home_team_city TEXT,
-            home_score INTEGER,
-            away_team_id INTEGER NOT NULL,
-            away_team_name TEXT,
-            away_team_abbreviation TEXT,
-            away_team_city TEXT,
-            away_score INTEGER,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_schedule_date ON schedule(game_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_schedule_home_team ON schedule(home_team_abbreviation)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_schedule_away_team ON schedule(away_team_abbreviation)')
-
-    # =========================================================================
-    # PLAYER INJURIES TABLE (daily injury status with history)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_injuries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_id INTEGER NOT NULL,
-            player_name TEXT NOT NULL,
-            team_id INTEGER,
-            injury_status TEXT NOT NULL,
-            injury_description TEXT,
-            collection_date TEXT NOT NULL,
-            source TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            UNIQUE(player_id, collection_date),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id),
-            FOREIGN KEY (team_id) REFERENCES teams(team_id)
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injuries_player ON player_injuries(player_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injuries_date ON player_injuries(collection_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injuries_status ON player_injuries(injury_status)')
-
-    # =========================================================================
-    # UNDERDOG PROPS TABLE (fantasy betting lines with history)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS underdog_props (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-
-            -- Player info
-            full_name TEXT NOT NULL,
-            team_name TEXT,
-            opponent_name TEXT,
-            position_name TEXT,
-
-            -- Prop line details
-            stat_name TEXT NOT NULL,
-            stat_value REAL NOT NULL,
-            choice TEXT NOT NULL,
-
-            -- Odds
-            american_price INTEGER,
-            decimal_price REAL,
-
-            -- Game info
-            scheduled_at TEXT,
-
-            -- Timestamps
-            updated_at TEXT NOT NULL,
-            scraped_at TEXT NOT NULL
-        )
-    ''')
-
-    # Index for fast lookups and duplicate detection
-    cursor.execute('''
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_underdog_props_unique
-        ON underdog_props(full_name, stat_name, choice, updated_at)
-    ''')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_underdog_props_player ON underdog_props(full_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_underdog_props_stat ON underdog_props(stat_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_underdog_props_scheduled ON underdog_props(scheduled_at)')
-
-    # =========================================================================
-    # PRIZEPICKS PROPS TABLE 
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS prizepicks_props (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-
-            -- Player info
-            full_name TEXT NOT NULL,
-            team_name TEXT,
-            opponent_name TEXT,
-            position_name TEXT,
-
-            -- Prop line details
-            stat_name TEXT NOT NULL,
-            stat_value REAL NOT NULL,
-            choice TEXT NOT NULL,
-
-            -- Prop type (standard, goblin, demon)
-            prop_type TEXT,
-
-            -- Game info
-            game_id TEXT,
-            scheduled_at TEXT,
-
-            -- Timestamps
-            updated_at TEXT NOT NULL,
-            scraped_at TEXT NOT NULL
-        )
-    ''')
-
-    # Index for fast lookups and duplicate detection
-    cursor.execute('''
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_prizepicks_props_unique
-        ON prizepicks_props(full_name, stat_name, stat_value, choice, prop_type, scheduled_at)
-    ''')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prizepicks_props_player ON prizepicks_props(full_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prizepicks_props_stat ON prizepicks_props(stat_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prizepicks_props_scheduled ON prizepicks_props(scheduled_at)')
-
-    # =========================================================================
-    # ALL PROPS TABLE (unified props from all sources for ML)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS all_props (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-
-            -- Source identification
-            source TEXT NOT NULL,           -- 'underdog', 'prizepicks', 'draftkings', etc.
-
-            -- Player info
-            full_name TEXT NOT NULL,
-            team_name TEXT,
-            opponent_name TEXT,
-            position_name TEXT,
-
-            -- Prop line details
-            stat_name TEXT NOT NULL,        -- Normalized: 'points', 'rebounds', 'assists', etc.
-            stat_value REAL NOT NULL,
-            choice TEXT NOT NULL,           -- 'over' or 'under'
-
-            -- Odds (if available)
-            american_odds INTEGER,
-            decimal_odds REAL,
-
-            -- Game info
-            game_id TEXT,
-            scheduled_at TEXT,
-
-            -- Timestamps
-            updated_at TEXT NOT NULL,
-            scraped_at TEXT NOT NULL
-        )
-    ''')
-
-    # Unique index: one prop per player/stat/line/choice/source/game
-    cursor.execute('''
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_all_props_unique
-        ON all_props(source, full_name, stat_name, stat_value, choice, scheduled_at)
-    ''')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_all_props_source ON all_props(source)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_all_props_player ON all_props(full_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_all_props_stat ON all_props(stat_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_all_props_scheduled ON all_props(scheduled_at)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_all_props_game_date ON all_props(DATE(scheduled_at))')
-
-    # =========================================================================
-    # PROP OUTCOMES TABLE 
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS prop_outcomes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-
-            -- Link to original prop (optional, for traceability)
-            prop_id INTEGER,
-
-            -- Player identification
-            player_name TEXT NOT NULL,
-            player_id INTEGER,
-
-            -- Game identification
-            game_id TEXT,
-            game_date TEXT NOT NULL,
-
-            -- The prop details
-            stat_type TEXT NOT NULL,
-            line REAL NOT NULL,
-
-            -- The outcome
-            actual_value REAL,
-            hit_over INTEGER,           -- 1 if actual > line, 0 otherwise
-            hit_under INTEGER,          -- 1 if actual < line, 0 otherwise
-            is_push INTEGER,            -- 1 if actual == line
-
-            -- Edge analysis
-            edge REAL,                  -- actual - line
-            edge_pct REAL,              -- (actual - line) / line * 100
-
-            -- Context at time of prop (for feature analysis)
-            season_avg REAL,
-            l5_avg REAL,
-            l10_avg REAL,
-
-            -- Metadata
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            UNIQUE(player_name, game_date, stat_type, line)
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prop_outcomes_player ON prop_outcomes(player_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prop_outcomes_date ON prop_outcomes(game_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prop_outcomes_stat ON prop_outcomes(stat_type)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prop_outcomes_hit_over ON prop_outcomes(hit_over)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_prop_outcomes_hit_under ON prop_outcomes(hit_under)')
-
-    # =========================================================================
-    # PLAYER NAME ALIASES TABLE (for matching prop names to NBA API names)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_name_aliases (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_id INTEGER NOT NULL,
-            canonical_name TEXT NOT NULL,
-            alias TEXT NOT NULL,
-            source TEXT DEFAULT 'manual',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(player_id, alias),
-            FOREIGN KEY (player_id) REFERENCES player_stats(player_id)
-        )
-    ''')
+    if conn is not None:
+        _apply_schema(conn)
+        return
+
+    from src.config import get_db_path
+    if db_path is None:
+        db_path = get_db_path()
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        for pragma in _INIT_PRAGMAS:
+            conn.execute(pragma)
+        _apply_schema(conn)
 
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_aliases_alias ON player_name_aliases(alias)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_aliases_canonical ON player_name_aliases(canonical_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_aliases_player_id ON player_name_aliases(player_id)')
 
-    # =========================================================================
-    # PLAYER ROLLING STATS TABLE (pre-computed rolling averages for ML)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_rolling_stats (
-            player_id TEXT NOT NULL,
-            game_id TEXT NOT NULL,
-            game_date TEXT NOT NULL,
-            season TEXT NOT NULL,
+@contextmanager
+def bulk_insert(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block of writes as one explicit write transaction.
 
-            -- Last 5 games averages (excludes current game)
-            l5_pts REAL, l5_reb REAL, l5_ast REAL, l5_min REAL,
-            l5_stl REAL, l5_blk REAL, l5_tov REAL, l5_fg3m REAL,
-            l5_pra REAL,
+    The write lock is taken up front (BEGIN IMMEDIATE) and the whole block is
+    committed with a single sync, instead of one autocommit per statement.
+    Any exception rolls the block back and is re-raised.
 
-            -- Last 10 games averages
-            l10_pts REAL, l10_reb REAL, l10_ast REAL, l10_min REAL,
-            l10_stl REAL, l10_blk REAL, l10_tov REAL, l10_fg3m REAL,
-            l10_pra REAL,
+    Args:
+        conn: Connection with no transaction in progress
 
-            -- Last 20 games averages
-            l20_pts REAL, l20_reb REAL, l20_ast REAL, l20_min REAL,
-            l20_pra REAL,
+    Example:
+        with bulk_insert(conn):
+            conn.executemany(sql, rows)
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
 
-            -- Per-36 rates (based on L10)
-            l10_pts_per36 REAL, l10_reb_per36 REAL, l10_ast_per36 REAL,
 
-            -- Trends (L5 - L10, positive = trending up)
-            pts_trend REAL, reb_trend REAL, ast_trend REAL,
+def insert_many(conn: sqlite3.Connection, sql: str, rows: Sequence[tuple], batch_size: int = 5000) -> None:
+    """
+    Insert rows with executemany, batch by batch, in one transaction.
 
-            -- Standard deviation (L10)
-            l10_pts_std REAL, l10_reb_std REAL, l10_ast_std REAL,
+    The import is atomic: if any batch fails, every row is rolled back and
+    the error is re-raised.
 
-            -- Minutes projection features
-            minutes_trend_slope REAL,    -- Linear regression slope on L10 minutes
-            minutes_baseline REAL,       -- Weighted average baseline minutes
+    Args:
+        conn: Connection with no transaction in progress
+        sql: Parameterized INSERT statement
+        rows: Parameter tuples, one per row
+        batch_size: Rows per executemany call
+    """
+    with bulk_insert(conn):
+        for start in range(0, len(rows), batch_size):
+            conn.executemany(sql, rows[start:start + batch_size])
 
-            -- Injury context features
-            games_since_injury_return INTEGER,  -- Games since returning from 'Out' (0-10, null if healthy)
-            is_currently_dtd INTEGER DEFAULT 0,  -- 1 if listed as Day-To-Day
 
-            -- Games in each window (for validation)
-            games_in_l5 INTEGER, games_in_l10 INTEGER, games_in_l20 INTEGER,
+def vacuum_and_analyze(db_path: str = None, vacuum: bool = True) -> None:
+    """
+    Compact the database and refresh the query planner's statistics.
 
-            -- Metadata
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    A new or freshly loaded database has no sqlite_stat1 data, so the planner
+    guesses index selectivity. Run this once after the initial data load (and
+    after large deletes); PRAGMA optimize is cheap enough to run routinely.
 
-            PRIMARY KEY (player_id, game_id)
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_rolling_player_date ON player_rolling_stats(player_id, game_date)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_rolling_season ON player_rolling_stats(season)')
-
-    # =========================================================================
-    # PLAYER MINUTES CONTEXT TABLE (role classification for minutes projection)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS player_minutes_context (
-            player_id TEXT NOT NULL,
-            team_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-
-            -- Role classification
-            role_type TEXT,              -- 'star', 'starter', 'rotation', 'bench', 'end_bench'
-            position_group TEXT,         -- 'guard', 'wing', 'big'
-
-            -- Minutes metrics
-            baseline_minutes REAL,       -- Weighted average baseline
-            ceiling_minutes REAL,        -- Max minutes (season high)
-            floor_minutes REAL,          -- Min non-zero minutes
-            minutes_std REAL,            -- Standard deviation
-            dnp_rate REAL,               -- Rate of DNP games
-
-            -- Metadata
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (player_id, team_id, season)
-        )
-    ''')
-
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_minutes_context_player ON player_minutes_context(player_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_minutes_context_team ON player_minutes_context(team_id, season)')
-
-    # =========================================================================
-    # TEAMMATE INJURY IMPACT TABLE (how injuries affect teammate minutes)
-    # =========================================================================
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS teammate_injury_impact (
-            player_id TEXT NOT NULL,
-            injured_teammate_id TEXT NOT NULL,
-            team_id INTEGER NOT NULL,
-            season TEXT NOT NULL,
-
-            -- Impact metrics
-            minutes_impact REAL,         -- Expected minutes change (% difference)
-            sample_games INTEGER,        -- Number of games in sample
-            confidence_score REAL,       -- Confidence in the estimate (0-1)
-
-            -- Metadata
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-            PRIMARY KEY (player_id, injured_teammate_id, season)
-        )
-    ''')
+    Args:
+        db_path: Path to the SQLite database file
+        vacuum: Also rebuild the file to reclaim free pages
+    """
+    from src.config import get_db_path
+    if db_path is None:
+        db_path = get_db_path()
 
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injury_impact_player ON teammate_injury_impact(player_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injury_impact_teammate ON teammate_injury_impact(injured_teammate_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_injury_impact_team ON teammate_injury_impact(team_id, season)')
+    with closing(sqlite3.connect(db_path)) as conn:
+        if vacuum:
+            conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
 
-    conn.commit()
-    conn.close()
 
 if __name__ == '__main__':
-    init_database()
\ No newline at end of file
+    init_database()
+    vacuum_and_analyze()
@@ -1,10 +1,111 @@
 import sqlite3
 from abc import abstractmethod
-from typing import Optional, List
-from .base import BaseRepository
+from dataclasses import fields
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, Optional, List, Set, Tuple
+from .base import BaseRepository, ThreadLocalConnectionMixin
 from ..models.player import PlayerStats, PlayerInfo
 
 
+# Keep IN (...) lists under SQLite's default host-parameter limit (999)
+_MAX_IN_PARAMS = 900
+
+# Statement text is kept constant so each connection's prepared-statement
+# cache hits on every call
+_SELECT_BY_ID_SQL = "SELECT * FROM player_stats WHERE player_id = ?"
+_SELECT_ALL_SQL = "SELECT * FROM player_stats"
+_SELECT_GAMES_PLAYED_SQL = "SELECT games_played FROM player_stats WHERE player_id = ?"
+_SELECT_BY_NAME_PREFIX_SQL = (
+    "SELECT * FROM player_stats WHERE player_name_lower >= ? AND player_name_lower < ? LIMIT 1"
+)
+_SELECT_BY_NAME_LIKE_SQL = "SELECT * FROM player_stats WHERE player_name LIKE ?"
+_EXISTS_SQL = "SELECT 1 FROM player_stats WHERE player_id = ?"
+_DELETE_SQL = "DELETE FROM player_stats WHERE player_id = ?"
+
+# A missing position keeps the stored one (the collectors don't always know it)
+_UPSERT_PLAYER_STATS_SQL = """
+    INSERT OR REPLACE INTO player_stats (
+        player_id, player_name, season, team_id, position,
+        points, assists, rebounds, threes_made, threes_attempted, fg_attempted,
+        steals, blocks, turnovers, fouls, ft_attempted,
+        pts_plus_ast, pts_plus_reb, ast_plus_reb, pts_plus_ast_plus_reb, steals_plus_blocks,
+        double_doubles, triple_doubles,
+        q1_points, q1_assists, q1_rebounds, first_half_points,
+        games_played, last_updated
+    ) VALUES (
+        ?, ?, ?, ?,
+        COALESCE(NULLIF(?, ''), (SELECT position FROM player_stats WHERE player_id = ?)),
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?,
+        ?, ?,
+        ?, ?, ?, ?,
+        ?, CURRENT_TIMESTAMP
+    )
+"""
+
+
+def _stats_params(stats: PlayerStats) -> tuple:
+    return (
+        stats.player_id, stats.player_name, stats.season, stats.team_id,
+        stats.position, stats.player_id,
+        stats.points, stats.assists, stats.rebounds, stats.threes_made, stats.threes_attempted, stats.fg_attempted,
+        stats.steals, stats.blocks, stats.turnovers, stats.fouls, stats.ft_attempted,
+        stats.pts_plus_ast, stats.pts_plus_reb, stats.ast_plus_reb, stats.pts_plus_ast_plus_reb, stats.steals_plus_blocks,
+        stats.double_doubles, stats.triple_doubles,
+        stats.q1_points, stats.q1_assists, stats.q1_rebounds, stats.first_half_points,
+        stats.games_played,
+    )
+
+
+# NULLs in these columns read as zero
+_ZERO_IF_NULL_COLUMNS = (
+    ('games_played', 0), ('points', 0.0), ('assists', 0.0), ('rebounds', 0.0),
+    ('steals', 0.0), ('blocks', 0.0), ('turnovers', 0.0),
+)
+
+# Columns older databases may lack, with the value used when absent
+_OPTIONAL_COLUMNS = (
+    ('fouls', 0.0), ('ft_attempted', 0.0),
+    ('threes_made', 0.0), ('threes_attempted', 0.0), ('fg_attempted', 0.0),
+    ('pts_plus_ast', None), ('pts_plus_reb', None), ('ast_plus_reb', None),
+    ('pts_plus_ast_plus_reb', None), ('steals_plus_blocks', None),
+    ('double_doubles', 0), ('triple_doubles', 0),
+    ('q1_points', None), ('q1_assists', None), ('q1_rebounds', None), ('first_half_points', None),
+    ('team_id', None), ('position', None),
+)
+
+
+# PlayerStats fields filled from a row, in constructor order; last_updated
+# is trailing and left at its default
+_READ_FIELDS = tuple(f.name for f in fields(PlayerStats) if f.name != 'last_updated')
+
+
+@lru_cache(maxsize=8)
+def _stats_reader(columns: Tuple[str, ...]) -> Callable[[tuple], PlayerStats]:
+    """Build a row -> PlayerStats converter specialized to one column layout.
+
+    Values are produced in field order and passed positionally, which avoids
+    building a kwargs dict and binding keywords for every row.
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    zero_if_null = dict(_ZERO_IF_NULL_COLUMNS)
+    optional = dict(_OPTIONAL_COLUMNS)
+    plan = tuple(
+        (index.get(name) if name in optional else index[name],
+         zero_if_null.get(name, optional.get(name)), name in zero_if_null)
+        for name in _READ_FIELDS
+    )
+
+    def to_stats(row) -> PlayerStats:
+        return PlayerStats(*[
+            default if i is None else (row[i] or default) if coalesce else row[i]
+            for i, default, coalesce in plan
+        ])
+
+    return to_stats
+
+
 class PlayerRepository(BaseRepository[PlayerStats]):
     """Abstract interface for player data access."""
 
@@ -13,167 +114,110 @@ class PlayerRepository(BaseRepository[PlayerStats]):
         """Check if player has new games since last update."""
         pass
 
+    @abstractmethod
+    def needs_update_many(self, current_games: Dict[int, int]) -> Set[int]:
+        """Return the IDs of players with new games since their last update."""
+        pass
+
     @abstractmethod
     def get_by_name(self, player_name: str) -> Optional[PlayerStats]:
         """Find player by name (fuzzy match)."""
         pass
 
+    @abstractmethod
+    def save_many(self, stats_list: List[PlayerStats]) -> None:
+        """Save multiple players' stats in a single transaction."""
+        pass
 
-class SQLitePlayerRepository(PlayerRepository):
-    """SQLite implementation of PlayerRepository."""
 
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+class SQLitePlayerRepository(ThreadLocalConnectionMixin, PlayerRepository):
+    """SQLite implementation of PlayerRepository."""
 
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = super()._open_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
         return conn
 
     def get_by_id(self, player_id: int) -> Optional[PlayerStats]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM player_stats WHERE player_id = ?",
-                (player_id,)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_stats(row)
-        finally:
-            conn.close()
+        cursor = self._get_connection().execute(_SELECT_BY_ID_SQL, (player_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return self._row_to_stats(row)
 
     def _row_to_stats(self, row) -> PlayerStats:
         """Convert database row to PlayerStats dataclass."""
-        keys = row.keys()
-        return PlayerStats(
-            player_id=row['player_id'],
-            player_name=row['player_name'],
-            season=row['season'],
-            games_played=row['games_played'] or 0,
-            points=row['points'] or 0.0,
-            assists=row['assists'] or 0.0,
-            rebounds=row['rebounds'] or 0.0,
-            steals=row['steals'] or 0.0,
-            blocks=row['blocks'] or 0.0,
-            turnovers=row['turnovers'] or 0.0,
-            fouls=row['fouls'] if 'fouls' in keys else 0.0,
-            ft_attempted=row['ft_attempted'] if 'ft_attempted' in keys else 0.0,
-            threes_made=row['threes_made'] if 'threes_made' in keys else 0.0,
-            threes_attempted=row['threes_attempted'] if 'threes_attempted' in keys else 0.0,
-            fg_attempted=row['fg_attempted'] if 'fg_attempted' in keys else 0.0,
-            pts_plus_ast=row['pts_plus_ast'] if 'pts_plus_ast' in keys else None,
-            pts_plus_reb=row['pts_plus_reb'] if 'pts_plus_reb' in keys else None,
-            ast_plus_reb=row['ast_plus_reb'] if 'ast_plus_reb' in keys else None,
-            pts_plus_ast_plus_reb=row['pts_plus_ast_plus_reb'] if 'pts_plus_ast_plus_reb' in keys else None,
-            steals_plus_blocks=row['steals_plus_blocks'] if 'steals_plus_blocks' in keys else None,
-            double_doubles=row['double_doubles'] if 'double_doubles' in keys else 0,
-            triple_doubles=row['triple_doubles'] if 'triple_doubles' in keys else 0,
-            q1_points=row['q1_points'] if 'q1_points' in keys else None,
-            q1_assists=row['q1_assists'] if 'q1_assists' in keys else None,
-            q1_rebounds=row['q1_rebounds'] if 'q1_rebounds' in keys else None,
-            first_half_points=row['first_half_points'] if 'first_half_points' in keys else None,
-            team_id=row['team_id'] if 'team_id' in keys else None,
-            position=row['position'] if 'position' in keys else None,
-        )
+        return _stats_reader(tuple(row.keys()))(row)
 
     def save(self, stats: PlayerStats) -> None:
         """Save player stats to database"""
+        self.save_many([stats])
+
+    def save_many(self, stats_list: List[PlayerStats]) -> None:
+        """Save many players' stats in a single transaction."""
+        if not stats_list:
+            return
         conn = self._get_connection()
-        try:
-            # First, get existing position if player exists
-            cursor = conn.execute(
-                "SELECT position FROM player_stats WHERE player_id = ?",
-                (stats.player_id,)
-            )
-            row = cursor.fetchone()
-            existing_position = row[0] if row else None
-
-            # Use provided position, or preserve existing, or None for new players
-            position = stats.position if stats.position else existing_position
-
-            conn.execute("""
-                INSERT OR REPLACE INTO player_stats (
-                    player_id, player_name, season, team_id, position,
-                    points, assists, rebounds, threes_made, threes_attempted, fg_attempted,
-                    steals, blocks, turnovers, fouls, ft_attempted,
-                    pts_plus_ast, pts_plus_reb, ast_plus_reb, pts_plus_ast_plus_reb, steals_plus_blocks,
-                    double_doubles, triple_doubles,
-                    q1_points, q1_assists, q1_rebounds, first_half_points,
-                    games_played, last_updated
-                ) VALUES (
-                    ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?,
-                    ?, ?,
-                    ?, ?, ?, ?,
-                    ?, CURRENT_TIMESTAMP
-                )
-            """, (
-                stats.player_id, stats.player_name, stats.season, stats.team_id, position,
-                stats.points, stats.assists, stats.rebounds, stats.threes_made, stats.threes_attempted, stats.fg_attempted,
-                stats.steals, stats.blocks, stats.turnovers, stats.fouls, stats.ft_attempted,
-                stats.pts_plus_ast, stats.pts_plus_reb, stats.ast_plus_reb, stats.pts_plus_ast_plus_reb, stats.steals_plus_blocks,
-                stats.double_doubles, stats.triple_doubles,
-                stats.q1_points, stats.q1_assists, stats.q1_rebounds, stats.first_half_points,
-                stats.games_played,
-            ))
-            conn.commit()
-        finally:
-            conn.close()
+        with conn:
+            conn.executemany(_UPSERT_PLAYER_STATS_SQL, [_stats_params(stats) for stats in stats_list])
 
     def needs_update(self, player_id: int, current_games: int) -> bool:
         """Check if player has played more games since last update."""
-        existing = self.get_by_id(player_id)
-        if existing is None:
+        row = self._get_connection().execute(_SELECT_GAMES_PLAYED_SQL, (player_id,)).fetchone()
+        if row is None:
             return True  # Never collected, needs update
-        return current_games > existing.games_played
+        return current_games > (row[0] or 0)
 
-    def get_all(self) -> List[PlayerStats]:
+    def needs_update_many(self, current_games: Dict[int, int]) -> Set[int]:
+        """Check many players at once with one query per chunk of IDs."""
+        stored: Dict[int, int] = {}
+        ids = list(current_games)
         conn = self._get_connection()
-        try:
-            cursor = conn.execute("SELECT * FROM player_stats")
-            return [self._row_to_stats(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        for start in range(0, len(ids), _MAX_IN_PARAMS):
+            chunk = ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT player_id, games_played FROM player_stats WHERE player_id IN ({placeholders})",
+                chunk
+            )
+            stored.update((player_id, games or 0) for player_id, games in cursor)
+        return {
+            player_id for player_id, games in current_games.items()
+            if player_id not in stored or games > stored[player_id]
+        }
+
+    def get_all(self) -> List[PlayerStats]:
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[PlayerStats]:
+        """Yield every player's stats straight from the cursor."""
+        cursor = self._get_connection().execute(_SELECT_ALL_SQL)
+        to_stats = _stats_reader(tuple(column[0] for column in cursor.description))
+        for row in cursor:
+            yield to_stats(row)
 
     def delete(self, player_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "DELETE FROM player_stats WHERE player_id = ?",
-                (player_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        with conn:
+            cursor = conn.execute(_DELETE_SQL, (player_id,))
+        return cursor.rowcount > 0
 
     def exists(self, player_id: int) -> bool:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM player_stats WHERE player_id = ?",
-                (player_id,)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor = self._get_connection().execute(_EXISTS_SQL, (player_id,))
+        return cursor.fetchone() is not None
 
     def get_by_name(self, player_name: str) -> Optional[PlayerStats]:
         conn = self._get_connection()
-        try:
+        # Names starting with the query: a range scan on idx_player_name_lower
+        prefix = player_name.lower()
+        row = conn.execute(_SELECT_BY_NAME_PREFIX_SQL, (prefix, prefix + '\U0010ffff')).fetchone()
+        if row is None:
             # Fuzzy match using LIKE
-            cursor = conn.execute(
-                "SELECT * FROM player_stats WHERE player_name LIKE ?",
-                (f"%{player_name}%",)
-            )
-            row = cursor.fetchone()
-            return self._row_to_stats(row) if row else None
-        finally:
-            conn.close()
+            row = conn.execute(_SELECT_BY_NAME_LIKE_SQL, (f"%{player_name}%",)).fetchone()
+        return self._row_to_stats(row) if row else None
 
 
 class MockPlayerRepository(PlayerRepository):
@@ -181,6 +225,7 @@ class MockPlayerRepository(PlayerRepository):
 
     def __init__(self):
         self.data: dict[int, PlayerStats] = {}
+        self._lower_names: dict[int, str] = {}
         self._needs_update_response = True
 
     def get_by_id(self, player_id: int) -> Optional[PlayerStats]:
@@ -188,10 +233,18 @@ class MockPlayerRepository(PlayerRepository):
 
     def save(self, stats: PlayerStats) -> None:
         self.data[stats.player_id] = stats
+        self._lower_names[stats.player_id] = stats.player_name.lower()
+
+    def save_many(self, stats_list: List[PlayerStats]) -> None:
+        for stats in stats_list:
+            self.save(stats)
 
     def needs_update(self, player_id: int, current_games: int) -> bool:
         return self._needs_update_response
 
+    def needs_update_many(self, current_games: Dict[int, int]) -> Set[int]:
+        return {player_id for player_id in current_games if self._needs_update_response}
+
     def set_needs_update(self, value: bool) -> None:
         """Test helper to control needs_update response."""
         self._needs_update_response = value
@@ -202,6 +255,7 @@ class MockPlayerRepository(PlayerRepository):
     def delete(self, player_id: int) -> bool:
         if player_id in self.data:
             del self.data[player_id]
+            self._lower_names.pop(player_id, None)
             return True
         return False
 
@@ -209,7 +263,12 @@ class MockPlayerRepository(PlayerRepository):
         return player_id in self.data
 
     def get_by_name(self, player_name: str) -> Optional[PlayerStats]:
-        for stats in self.data.values():
-            if player_name.lower() in stats.player_name.lower():
-                return stats
+        # Same precedence as SQLitePlayerRepository: prefix, then substring
+        needle = player_name.lower()
+        for player_id, name in self._lower_names.items():
+            if name.startswith(needle):
+                return self.data[player_id]
+        for player_id, name in self._lower_names.items():
+            if needle in name:
+                return self.data[player_id]
         return None
@@ -5,17 +5,21 @@ Merges cloud-managed tables into the local DB without overwriting
 local-only tables (shooting zones, assist zones, play types, etc.).
 """
 
+import gzip
 import json
 import logging
 import shutil
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import google.auth
 from google.cloud import storage as gcs
+from google.cloud.storage import transfer_manager
 from google.oauth2 import credentials as oauth2_credentials
 
 from src.config import get_db_path
@@ -24,6 +28,34 @@ logger = logging.getLogger(__name__)
 
 GCS_BUCKET = "nba-stats-pipeline-data"
 
+# Model files download in parallel; each is a separate HTTPS request
+_MODEL_DOWNLOAD_WORKERS = 8
+
+# The pushed DB is uploaded as concurrent multipart chunks; a failed chunk is
+# retried on its own instead of restarting the whole transfer
+_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+_UPLOAD_WORKERS = 8
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Reader connections used to scan table sizes concurrently
+_COUNT_WORKERS = 4
+
+# Applied to the local connection before merging: WAL with relaxed fsync,
+# and a large page cache so the merge's index updates stay in memory
+_MERGE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-262144",  # 256 MB
+    "PRAGMA mmap_size=1073741824",  # 1 GB, read pages without copying into the cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Applied once the cloud DB is attached; pragmas on 'main' don't carry over
+_CLOUD_PRAGMAS = (
+    "PRAGMA cloud.cache_size=-131072",  # 128 MB
+    "PRAGMA cloud.mmap_size=1073741824",
+)
+
 # Tables managed by the cloud pipeline and their merge strategy.
 # "replace" = INSERT OR REPLACE (cloud wins on PK match)
 # "ignore"  = INSERT OR IGNORE  (dedup via UNIQUE constraint, exclude id)
@@ -36,23 +68,67 @@ CLOUD_TABLES: dict[str, str] = {
     # AUTOINCREMENT tables
     "player_injuries": "ignore",
     "all_props": "ignore",
-    "underdog_props": "ignore",
-    "prizepicks_props": "ignore",
     "odds_api_props": "ignore",
     "prop_outcomes": "ignore",
     "paper_trades": "ignore",
     "prediction_log": "ignore",
 }
 
+# "ignore" tables only ever gain rows (merging can't pick up in-place edits
+# anyway), so an unchanged row count, max rowid and latest insert stamp mean
+# nothing new to merge
+_APPEND_ONLY_TABLES = frozenset(t for t, strategy in CLOUD_TABLES.items() if strategy == "ignore")
+
+# Timestamp each append-only table stamps on insert. Without AUTOINCREMENT a
+# cloud copy that deletes its trailing rows and inserts as many new ones
+# reuses their rowids, leaving the count and max rowid unchanged; the latest
+# stamp still moves.
+_INSERT_STAMP_COLUMNS = {
+    "player_injuries": "created_at",
+    "all_props": "scraped_at",
+    "odds_api_props": "scraped_at",
+    "prop_outcomes": "created_at",
+    "paper_trades": "logged_at",
+    "prediction_log": "created_at",
+}
+
+# Latest insert stamp as a unix epoch: older schemas stored some stamps as
+# text and newer ones as integers, and MAX() alone ranks any text above any
+# integer
+_MAX_STAMP_SQL = "MAX(CASE typeof([{0}]) WHEN 'text' THEN unixepoch([{0}]) ELSE [{0}] END)"
+
+# Cloud (row count, max rowid, latest insert stamp) of each append-only
+# table at its last merge
+_CHECKPOINTS_DDL = """
+    CREATE TABLE IF NOT EXISTS sync_checkpoints (
+        table_name TEXT PRIMARY KEY,
+        cloud_row_count INTEGER NOT NULL,
+        cloud_max_rowid INTEGER,
+        cloud_max_stamp INTEGER
+    )
+"""
+_SAVE_CHECKPOINT_SQL = "INSERT OR REPLACE INTO sync_checkpoints VALUES (?, ?, ?, ?)"
+
+# Append-only merges expected to add more rows than this rebuild their
+# secondary indexes once afterwards instead of updating them per row
+_INDEX_REBUILD_MIN_ROWS = 10_000
 
-@dataclass
+
+@dataclass(slots=True)
 class MergeResult:
+    """Outcome of merging one table.
+
+    new_rows counts rows the merge added locally; replaced_rows counts
+    existing rows a "replace" table overwrote. local_before/local_after are
+    counted by the dry-run preview and by "replace" merges.
+    """
     table: str
     strategy: str
     cloud_rows: int = 0
     local_before: int = 0
     local_after: int = 0
     new_rows: int = 0
+    replaced_rows: int = 0
     skipped_columns: list[str] = field(default_factory=list)
     error: Optional[str] = None
 
@@ -65,7 +141,7 @@ class MergeResult:
         return "OK"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncReport:
     results: list[MergeResult] = field(default_factory=list)
     backup_path: Optional[str] = None
@@ -134,29 +210,34 @@ class DatabaseSyncer:
         self.project_root = Path(__file__).resolve().parent.parent.parent
         self.backup_dir = self.project_root / "data" / "backups"
         self.data_dir = self.project_root / "data"
+        self._gcs_bucket: Optional[gcs.Bucket] = None
 
     def pull(self, dry_run: bool = False, skip_models: bool = False) -> SyncReport:
         """Download cloud DB and merge cloud-managed tables into local."""
         report = SyncReport(started_at=datetime.now(), dry_run=dry_run)
 
-        # Download cloud DB to temp file
+        # Download cloud DB (reused as-is when the cloud copy hasn't changed)
         cloud_db_path = self._download_from_gcs()
         report.cloud_db_path = str(cloud_db_path)
 
-        if dry_run:
-            report.results = self._preview_merge(cloud_db_path)
-        else:
-            # Backup local DB first
-            report.backup_path = self._backup_local_db()
-            report.results = self._merge_tables(cloud_db_path)
+        try:
+            if dry_run:
+                report.results = self._preview_merge(cloud_db_path)
+            else:
+                # Trained models download in the background while the merge runs
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    models = None if skip_models else executor.submit(self._sync_models)
 
-        # Clean up temp cloud DB
-        if cloud_db_path.exists():
-            cloud_db_path.unlink()
+                    # Backup local DB first
+                    report.backup_path = self._backup_local_db()
+                    report.results = self._merge_tables(cloud_db_path)
 
-        # Sync trained models
-        if not dry_run and not skip_models:
-            self._sync_models()
+                if models is not None:
+                    models.result()
+        except BaseException:
+            # Don't trust a cached copy that a failed merge may have choked on
+            self._discard_cloud_cache()
+            raise
 
         report.finished_at = datetime.now()
         return report
@@ -168,12 +249,36 @@ class DatabaseSyncer:
 
         self.pull()
 
-        client = _get_gcs_client()
-        bucket = client.bucket(GCS_BUCKET)
-        blob = bucket.blob("nba_stats.db")
+        blob = self._bucket().blob("nba_stats.db")
 
-        logger.info("Uploading %s to gs://%s/nba_stats.db", self.db_path, GCS_BUCKET)
-        blob.upload_from_filename(self.db_path)
+        # Upload a compacted, consistent snapshot rather than the live file
+        snapshot_path = self.data_dir / "push_nba_stats.db"
+        compressed_path = self.data_dir / "push_nba_stats.db.gz"
+        snapshot_path.unlink(missing_ok=True)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                conn.execute("VACUUM INTO ?", (str(snapshot_path),))
+
+            # Stored gzip-encoded under the same name: GCS decompresses it for
+            # readers that don't accept gzip (gsutil in the Cloud Run jobs),
+            # while the Python client transfers the compressed bytes
+            with open(snapshot_path, "rb") as src, gzip.open(compressed_path, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+            blob.content_encoding = "gzip"
+            blob.content_type = "application/x-sqlite3"
+
+            logger.info("Uploading %s (%s, %s compressed) to gs://%s/nba_stats.db",
+                        self.db_path, _human_size(snapshot_path), _human_size(compressed_path), GCS_BUCKET)
+            transfer_manager.upload_chunks_concurrently(
+                str(compressed_path), blob,
+                chunk_size=_UPLOAD_CHUNK_SIZE,
+                max_workers=_UPLOAD_WORKERS,
+                worker_type=transfer_manager.THREAD,
+            )
+        finally:
+            snapshot_path.unlink(missing_ok=True)
+            compressed_path.unlink(missing_ok=True)
         logger.info("Upload complete")
 
     def status(self) -> dict[str, int]:
@@ -203,87 +308,129 @@ class DatabaseSyncer:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _bucket(self) -> gcs.Bucket:
+        """Return the pipeline bucket, creating the GCS client on first use."""
+        if self._gcs_bucket is None:
+            self._gcs_bucket = _get_gcs_client().bucket(GCS_BUCKET)
+        return self._gcs_bucket
+
     def _merge_tables(self, cloud_db_path: Path) -> list[MergeResult]:
         """Attach cloud DB and merge each cloud-managed table."""
         results = []
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("ATTACH DATABASE ? AS cloud", (str(cloud_db_path),))
-
-        # Get tables that exist in the cloud DB
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM cloud.sqlite_master WHERE type='table'")
-        cloud_tables = {row[0] for row in cursor.fetchall()}
-
-        # Get tables that exist in the local DB
-        cursor.execute("SELECT name FROM main.sqlite_master WHERE type='table'")
-        local_tables = {row[0] for row in cursor.fetchall()}
-
-        for table, strategy in CLOUD_TABLES.items():
-            result = MergeResult(table=table, strategy=strategy)
-
-            if table not in cloud_tables:
-                result.error = "not in cloud DB"
-                results.append(result)
-                continue
-
-            if table not in local_tables:
-                result.error = "not in local DB"
-                results.append(result)
-                continue
-
+        with closing(sqlite3.connect(self.db_path, uri=True)) as conn:
+            for pragma in _MERGE_PRAGMAS:
+                conn.execute(pragma)
+            _attach_cloud(conn, cloud_db_path)
+            for pragma in _CLOUD_PRAGMAS:
+                conn.execute(pragma)
+
+            # Columns of the cloud-managed tables that exist on each side
+            cursor = conn.cursor()
+            cloud_tables = _table_columns(cursor, "cloud")
+            local_tables = _table_columns(cursor, "main")
+
+            shared_tables = [t for t in CLOUD_TABLES if t in cloud_tables and t in local_tables]
+            cloud_sizes = _table_sizes(_cloud_uri(cloud_db_path), shared_tables, cloud_tables)
+
+            checkpoints = _load_checkpoints(cursor)
+
+            # All tables merge in one write transaction (one sync to disk); a
+            # failing INSERT only undoes its own statement
+            conn.execute("BEGIN IMMEDIATE")
             try:
-                # Count rows before
-                cursor.execute(f"SELECT COUNT(*) FROM main.[{table}]")
-                result.local_before = cursor.fetchone()[0]
-
-                cursor.execute(f"SELECT COUNT(*) FROM cloud.[{table}]")
-                result.cloud_rows = cursor.fetchone()[0]
-
-                # Get column intersection
-                cols, skipped = self._get_column_intersection(cursor, table, strategy)
-                result.skipped_columns = skipped
-
-                if not cols:
-                    result.error = "no overlapping columns"
+                for table, strategy in CLOUD_TABLES.items():
+                    result = MergeResult(table=table, strategy=strategy)
+                    if table not in cloud_tables:
+                        result.error = "not in cloud DB"
+                    elif table not in local_tables:
+                        result.error = "not in local DB"
+                    else:
+                        self._merge_table(
+                            cursor, result, local_tables[table], cloud_tables[table],
+                            cloud_sizes[table], checkpoints.get(table),
+                        )
                     results.append(result)
-                    continue
+            except BaseException:
+                # Never commit a partial merge or leave the database locked
+                conn.rollback()
+                raise
+            conn.commit()
+            conn.execute("DETACH DATABASE cloud")
 
-                col_list = ", ".join(f"[{c}]" for c in cols)
-                verb = "OR REPLACE" if strategy == "replace" else "OR IGNORE"
+        return results
 
+    def _merge_table(
+        self,
+        cursor: sqlite3.Cursor,
+        result: MergeResult,
+        local_cols: frozenset[str],
+        cloud_cols: frozenset[str],
+        size: Union[tuple, sqlite3.Error],
+        checkpoint: Optional[tuple],
+    ) -> None:
+        """Merge one table inside the open transaction, recording the outcome on result."""
+        table, strategy = result.table, result.strategy
+        try:
+            size = _size_result(size)
+            result.cloud_rows = size[0]
+
+            # Get column intersection
+            cols, skipped = self._get_column_intersection(table, strategy, local_cols, cloud_cols)
+            result.skipped_columns = skipped
+
+            if not cols:
+                result.error = "no overlapping columns"
+                return
+
+            if table in _APPEND_ONLY_TABLES and checkpoint == size:
+                # Unchanged since the last merge: skip the full scan
+                return
+
+            col_list = ", ".join(f"[{c}]" for c in cols)
+            verb = "OR REPLACE" if strategy == "replace" else "OR IGNORE"
+
+            rebuild_indexes = (
+                table in _APPEND_ONLY_TABLES
+                and _expected_new_rows(cursor, table, size, checkpoint) > _INDEX_REBUILD_MIN_ROWS
+            )
+            if strategy == "replace":
+                result.local_before = _local_row_count(cursor, table)
+            with _secondary_indexes_dropped(cursor, table, rebuild_indexes):
                 cursor.execute(
                     f"INSERT {verb} INTO main.[{table}] ({col_list}) "
                     f"SELECT {col_list} FROM cloud.[{table}]"
                 )
-
-                # Count rows after
-                cursor.execute(f"SELECT COUNT(*) FROM main.[{table}]")
-                result.local_after = cursor.fetchone()[0]
+                # Rows the statement wrote (sqlite3_changes)
+                written = cursor.rowcount
+            if strategy == "replace":
+                # REPLACE counts overwritten rows as written too; only the
+                # growth of the table is new
+                result.local_after = _local_row_count(cursor, table)
                 result.new_rows = result.local_after - result.local_before
+                result.replaced_rows = written - result.new_rows
+            else:
+                # OR IGNORE only writes rows that weren't there, so no
+                # before/after COUNT(*) scans are needed
+                result.new_rows = written
+            if table in _APPEND_ONLY_TABLES:
+                cursor.execute(_SAVE_CHECKPOINT_SQL, (table, *size))
 
-            except Exception as e:
-                result.error = str(e)
-
-            results.append(result)
-
-        conn.commit()
-        conn.execute("DETACH DATABASE cloud")
-        conn.close()
-
-        return results
+        except Exception as e:
+            result.error = str(e)
 
     def _preview_merge(self, cloud_db_path: Path) -> list[MergeResult]:
         """Dry-run: attach cloud DB, count rows, no writes."""
         results = []
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("ATTACH DATABASE ? AS cloud", (str(cloud_db_path),))
+        conn = sqlite3.connect(self.db_path, uri=True)
+        _attach_cloud(conn, cloud_db_path)
 
         cursor = conn.cursor()
-        cursor.execute("SELECT name FROM cloud.sqlite_master WHERE type='table'")
-        cloud_tables = {row[0] for row in cursor.fetchall()}
+        cloud_tables = _table_columns(cursor, "cloud")
+        local_tables = _table_columns(cursor, "main")
 
-        cursor.execute("SELECT name FROM main.sqlite_master WHERE type='table'")
-        local_tables = {row[0] for row in cursor.fetchall()}
+        shared_tables = [t for t in CLOUD_TABLES if t in cloud_tables and t in local_tables]
+        local_sizes = _table_sizes(self.db_path, shared_tables)
+        cloud_sizes = _table_sizes(_cloud_uri(cloud_db_path), shared_tables)
 
         for table, strategy in CLOUD_TABLES.items():
             result = MergeResult(table=table, strategy=strategy)
@@ -299,14 +446,13 @@ class DatabaseSyncer:
                 continue
 
             try:
-                cursor.execute(f"SELECT COUNT(*) FROM main.[{table}]")
-                result.local_before = cursor.fetchone()[0]
+                result.local_before = _size_result(local_sizes[table])[0]
                 result.local_after = result.local_before  # unchanged in dry-run
+                result.cloud_rows = _size_result(cloud_sizes[table])[0]
 
-                cursor.execute(f"SELECT COUNT(*) FROM cloud.[{table}]")
-                result.cloud_rows = cursor.fetchone()[0]
-
-                _, skipped = self._get_column_intersection(cursor, table, strategy)
+                _, skipped = self._get_column_intersection(
+                    table, strategy, local_tables[table], cloud_tables[table]
+                )
                 result.skipped_columns = skipped
 
             except Exception as e:
@@ -318,21 +464,16 @@ class DatabaseSyncer:
         conn.close()
         return results
 
+    @staticmethod
     def _get_column_intersection(
-        self, cursor: sqlite3.Cursor, table: str, strategy: str
+        table: str, strategy: str, local_cols: frozenset[str], cloud_cols: frozenset[str]
     ) -> tuple[list[str], list[str]]:
         """Return (shared_columns, skipped_columns) for a table.
 
         For 'ignore' strategy, the 'id' column is excluded so that
         AUTOINCREMENT tables dedup via their UNIQUE constraints.
         """
-        cursor.execute(f"PRAGMA main.table_info([{table}])")
-        local_cols = {row[1] for row in cursor.fetchall()}
-
-        cursor.execute(f"PRAGMA cloud.table_info([{table}])")
-        cloud_cols = {row[1] for row in cursor.fetchall()}
-
-        shared = local_cols & cloud_cols
+        shared = set(local_cols & cloud_cols)
 
         # For autoincrement tables, exclude the id column
         if strategy == "ignore":
@@ -354,9 +495,20 @@ class DatabaseSyncer:
             return None
 
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        # Nothing written since the newest backup (WAL included): reuse it
+        backups = sorted(self.backup_dir.glob("nba_stats_*.db"), reverse=True)
+        db_files = [Path(self.db_path), Path(f"{self.db_path}-wal")]
+        last_write = max(p.stat().st_mtime for p in db_files if p.exists())
+        if backups and backups[0].stat().st_mtime >= last_write:
+            logger.info("Local DB unchanged since %s, skipping backup", backups[0])
+            return str(backups[0])
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"nba_stats_{timestamp}.db"
-        shutil.copy2(self.db_path, backup_path)
+        # Online backup API: a consistent snapshot even mid-write, WAL included
+        with closing(sqlite3.connect(self.db_path)) as src, closing(sqlite3.connect(backup_path)) as dst:
+            src.backup(dst)
         logger.info("Backed up to %s", backup_path)
 
         # Prune old backups
@@ -367,26 +519,55 @@ class DatabaseSyncer:
 
         return str(backup_path)
 
+    def _cloud_cache_paths(self) -> tuple[Path, Path]:
+        """Return (cached cloud DB, file holding its GCS generation)."""
+        cache_path = self.data_dir / "cloud_nba_stats.db"
+        return cache_path, cache_path.with_name(cache_path.name + ".generation")
+
+    def _discard_cloud_cache(self) -> None:
+        for path in self._cloud_cache_paths():
+            path.unlink(missing_ok=True)
+
     def _download_from_gcs(self) -> Path:
-        """Download cloud DB to a temp file in data/."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        tmp_path = self.data_dir / "cloud_nba_stats.db"
+        """Return a local copy of the cloud DB, downloading it only if it changed.
+
+        The copy is kept in data/ with the blob generation it was downloaded
+        at, so a pull against an unchanged cloud DB costs one metadata request.
+        """
+        cache_path, generation_path = self._cloud_cache_paths()
 
-        client = _get_gcs_client()
-        bucket = client.bucket(GCS_BUCKET)
-        blob = bucket.blob("nba_stats.db")
+        blob = self._bucket().blob("nba_stats.db")
+        blob.reload()
+        generation = str(blob.generation)
+
+        if (
+            cache_path.exists() and generation_path.exists()
+            and generation_path.read_text().strip() == generation
+        ):
+            logger.info("Cloud DB unchanged (generation %s), reusing %s", generation, cache_path)
+            return cache_path
+
+        self._discard_cloud_cache()
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_name(cache_path.name + ".part")
 
         logger.info("Downloading gs://%s/nba_stats.db ...", GCS_BUCKET)
-        blob.download_to_filename(str(tmp_path))
-        logger.info("Downloaded cloud DB (%s)", _human_size(tmp_path))
-        return tmp_path
+        try:
+            # Pin the generation so the copy matches the recorded one
+            blob.download_to_filename(str(partial_path), if_generation_match=blob.generation)
+            partial_path.replace(cache_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        generation_path.write_text(generation)
+        logger.info("Downloaded cloud DB (%s)", _human_size(cache_path))
+        return cache_path
 
     def _sync_models(self) -> None:
         """Sync trained model files from GCS."""
         models_dir = self.project_root / "trained_models"
 
-        client = _get_gcs_client()
-        bucket = client.bucket(GCS_BUCKET)
+        bucket = self._bucket()
 
         # List model blobs in the cloud
         blobs = list(bucket.list_blobs(prefix="trained_models/"))
@@ -399,16 +580,156 @@ class DatabaseSyncer:
         models_dir.mkdir(parents=True, exist_ok=True)
         logger.info("Syncing %d trained models...", len(model_blobs))
 
-        for blob in model_blobs:
+        def download(blob) -> None:
             # blob.name is "trained_models/foo.joblib" — extract filename
             filename = Path(blob.name).name
             local_path = models_dir / filename
             blob.download_to_filename(str(local_path))
             logger.debug("Downloaded %s", filename)
 
+        # The storage client is thread-safe; downloads overlap their latency
+        with ThreadPoolExecutor(max_workers=_MODEL_DOWNLOAD_WORKERS) as executor:
+            list(executor.map(download, model_blobs))
+
         logger.info("Models synced")
 
 
+def _cloud_uri(cloud_db_path: Path) -> str:
+    """URI opening the downloaded cloud DB read-only.
+
+    immutable=1 tells SQLite nothing else will touch the file, so reads skip
+    locking and change detection.
+    """
+    return f"{cloud_db_path.resolve().as_uri()}?mode=ro&immutable=1"
+
+
+def _attach_cloud(conn: sqlite3.Connection, cloud_db_path: Path) -> None:
+    """Attach the downloaded cloud DB as 'cloud'. The connection must be opened with uri=True."""
+    conn.execute("ATTACH DATABASE ? AS cloud", (_cloud_uri(cloud_db_path),))
+
+
+def _table_sizes(
+    database: str,
+    tables: list[str],
+    columns: Optional[dict[str, frozenset[str]]] = None,
+) -> dict[str, Union[tuple, sqlite3.Error]]:
+    """Scan several tables concurrently, one reader connection per table.
+
+    Each table maps to (row count, max rowid, latest insert stamp); the last
+    two only for append-only tables, and the stamp only when columns lists
+    the table's stamp column. sqlite3 releases the GIL while a query runs, so
+    the full-table COUNT(*) scans overlap. A table whose scan fails maps to its error.
+    """
+    def scan(table: str) -> tuple[str, Union[tuple, sqlite3.Error]]:
+        max_rowid = max_stamp = "NULL"
+        if table in _APPEND_ONLY_TABLES:
+            max_rowid = "MAX(rowid)"
+            stamp = _INSERT_STAMP_COLUMNS.get(table)
+            if columns and stamp in columns.get(table, ()):
+                max_stamp = _MAX_STAMP_SQL.format(stamp)
+        try:
+            with closing(sqlite3.connect(database, uri=True)) as conn:
+                return table, conn.execute(
+                    f"SELECT COUNT(*), {max_rowid}, {max_stamp} FROM [{table}]"
+                ).fetchone()
+        except sqlite3.Error as e:
+            return table, e
+
+    with ThreadPoolExecutor(max_workers=_COUNT_WORKERS) as executor:
+        return dict(executor.map(scan, tables))
+
+
+def _load_checkpoints(cursor: sqlite3.Cursor) -> dict[str, tuple]:
+    """Read the append-only merge checkpoints, creating the table if needed.
+
+    Checkpoints saved before the insert stamp was tracked are dropped, so
+    those tables are merged in full once.
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA main.table_info(sync_checkpoints)")}
+    if columns and "cloud_max_stamp" not in columns:
+        cursor.execute("DROP TABLE main.sync_checkpoints")
+    cursor.execute(_CHECKPOINTS_DDL)
+    return {
+        table: (row_count, max_rowid, max_stamp)
+        for table, row_count, max_rowid, max_stamp in cursor.execute("SELECT * FROM sync_checkpoints")
+    }
+
+
+def _expected_new_rows(
+    cursor: sqlite3.Cursor,
+    table: str,
+    size: tuple,
+    checkpoint: Optional[tuple],
+) -> int:
+    """Estimate how many rows an append-only merge will add locally.
+
+    With a checkpoint this is what the cloud gained since the last merge.
+    Without one (first merge, or reset checkpoints) it is how far the local
+    table trails the cloud, so an already-populated local copy doesn't
+    count the whole cloud table as new.
+    """
+    if checkpoint:
+        return size[0] - checkpoint[0]
+    if size[0] <= _INDEX_REBUILD_MIN_ROWS:
+        # Below the threshold either way: skip the local COUNT(*)
+        return size[0]
+    return size[0] - _local_row_count(cursor, table)
+
+
+def _local_row_count(cursor: sqlite3.Cursor, table: str) -> int:
+    return cursor.execute(f"SELECT COUNT(*) FROM main.[{table}]").fetchone()[0]
+
+
+def _size_result(size: Union[tuple, sqlite3.Error]) -> tuple:
+    if isinstance(size, sqlite3.Error):
+        raise size
+    return size
+
+
+@contextmanager
+def _secondary_indexes_dropped(cursor: sqlite3.Cursor, table: str, enabled: bool = True):
+    """Drop a local table's plain secondary indexes for the block, then rebuild them.
+
+    Building an index once over the finished table is cheaper than updating
+    it for every inserted row. UNIQUE indexes stay, since "ignore" merges
+    dedup through them. The indexes are recreated even if the block raises.
+    """
+    if not enabled:
+        yield
+        return
+
+    cursor.execute(
+        "SELECT m.name, m.sql FROM pragma_index_list(?, 'main') AS il "
+        "JOIN main.sqlite_master AS m ON m.type = 'index' AND m.name = il.name "
+        "WHERE il.origin = 'c' AND NOT il.[unique]",
+        (table,)
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f"DROP INDEX main.[{name}]")
+    try:
+        yield
+    finally:
+        for _, sql in indexes:
+            cursor.execute(sql)
+
+
+def _table_columns(cursor: sqlite3.Cursor, schema: str) -> dict[str, frozenset[str]]:
+    """Map each cloud-managed table present in an attached schema to its columns."""
+    # One statement for every table instead of a PRAGMA table_info per table
+    placeholders = ", ".join("?" * len(CLOUD_TABLES))
+    cursor.execute(
+        f"SELECT m.name, c.name FROM {schema}.sqlite_master AS m "
+        f"JOIN pragma_table_info(m.name, '{schema}') AS c "
+        f"WHERE m.type = 'table' AND m.name IN ({placeholders})",
+        tuple(CLOUD_TABLES)
+    )
+    columns: dict[str, set[str]] = {}
+    for table, column in cursor:
+        columns.setdefault(table, set()).add(column)
+    return {table: frozenset(cols) for table, cols in columns.items()}
+
+
 def _human_size(path: Path) -> str:
     """Return human-readable file size."""
     size = path.stat().st_size
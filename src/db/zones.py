@@ -2,14 +2,96 @@
 
 import sqlite3
 from abc import abstractmethod
-from typing import Optional, List, Set
-from .base import BaseRepository
+from itertools import groupby, repeat
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Optional, List, Set, Tuple
+
+import numpy as np
+from .base import BaseRepository, ThreadLocalConnectionMixin
 from ..models.zones import (
     ShootingZone, AssistZone, TeamDefenseZone,
     PlayerZones, TeamDefenseZones
 )
 
 
+# Applied to every connection: WAL so readers don't block on a writer,
+# commits without a per-transaction fsync, and a 64 MB page cache
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Write statements are kept constant so each connection's prepared-statement
+# cache hits on every save
+_INSERT_SHOOTING_ZONES_SQL = """
+    INSERT INTO player_shooting_zones
+    (player_id, season, zone_name, fgm, fga, fg_pct, efg_pct, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_INSERT_ASSIST_ZONES_SQL = """
+    INSERT INTO player_assist_zones
+    (player_id, season, zone_name, zone_area, zone_range, ast, fgm, fga, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_ACCUMULATE_ASSIST_ZONES_SQL = """
+    INSERT INTO player_assist_zones
+    (player_id, season, zone_name, zone_area, zone_range, ast, fgm, fga, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(player_id, season, zone_name) DO UPDATE SET
+        ast = ast + excluded.ast,
+        fgm = fgm + excluded.fgm,
+        fga = fga + excluded.fga,
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+_INSERT_DEFENSE_ZONES_SQL = """
+    INSERT INTO team_defensive_zones
+    (team_id, season, zone_name, zone_area, zone_range, opp_fgm, opp_fga, opp_fg_pct, opp_efg_pct)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Team defense zones with the team's name joined in, so callers need no
+# second lookup per team
+_SELECT_DEFENSE_ZONES_SQL = """
+    SELECT z.*, t.full_name AS team_name
+    FROM team_defensive_zones z
+    LEFT JOIN teams t ON t.team_id = z.team_id
+"""
+
+
+def _group_by_key(rows: Iterable, key: str, convert: Callable) -> Iterator[Tuple[Any, list]]:
+    """Group rows already sorted by `key` into (key, converted rows) pairs."""
+    for value, group in groupby(rows, key=itemgetter(key)):
+        yield value, [convert(row) for row in group]
+
+
+def _ordered_lookup(groups: Iterator[Tuple[Any, list]]) -> Callable[[Any], list]:
+    """Look up groups sorted by key with a sequence of ascending keys.
+
+    Returns take(key), which skips groups below key and returns the group's
+    items, or [] if it has none. Each group is read from `groups` once.
+    """
+    current = next(groups, None)
+
+    def take(key) -> list:
+        nonlocal current
+        while current is not None and current[0] < key:
+            current = next(groups, None)
+        if current is None or current[0] != key:
+            return []
+        items = current[1]
+        current = next(groups, None)
+        return items
+
+    return take
+
+
 class ZoneRepository(BaseRepository[PlayerZones]):
     """Abstract interface for player zone data access."""
 
@@ -28,6 +110,13 @@ class ZoneRepository(BaseRepository[PlayerZones]):
         """Save shooting zones for a player."""
         pass
 
+    @abstractmethod
+    def save_shooting_zones_bulk(
+        self, player_id: int, season: str, names: np.ndarray, fgm: np.ndarray, fga: np.ndarray
+    ) -> None:
+        """Save shooting zones for a player from parallel column arrays."""
+        pass
+
     @abstractmethod
     def save_assist_zones(self, player_id: int, season: str, zones: List[AssistZone]) -> None:
         """Save assist zones for a player."""
@@ -60,15 +149,13 @@ class TeamDefenseZoneRepository(BaseRepository[TeamDefenseZones]):
         pass
 
 
-class SQLiteZoneRepository(ZoneRepository):
+class SQLiteZoneRepository(ThreadLocalConnectionMixin, ZoneRepository):
     """SQLite implementation of ZoneRepository."""
 
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = super()._open_connection()
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
     def get_by_id(self, player_id: int) -> Optional[PlayerZones]:
@@ -88,15 +175,12 @@ class SQLiteZoneRepository(ZoneRepository):
 
     def get_shooting_zones(self, player_id: int, season: str) -> List[ShootingZone]:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM player_shooting_zones
-                   WHERE player_id = ? AND season = ?""",
-                (player_id, season)
-            )
-            return [self._row_to_shooting_zone(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            """SELECT * FROM player_shooting_zones
+               WHERE player_id = ? AND season = ?""",
+            (player_id, season)
+        )
+        return [self._row_to_shooting_zone(row) for row in cursor.fetchall()]
 
     def _row_to_shooting_zone(self, row) -> ShootingZone:
         """Convert database row to ShootingZone dataclass."""
@@ -108,15 +192,12 @@ class SQLiteZoneRepository(ZoneRepository):
 
     def get_assist_zones(self, player_id: int, season: str) -> List[AssistZone]:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM player_assist_zones
-                   WHERE player_id = ? AND season = ?""",
-                (player_id, season)
-            )
-            return [self._row_to_assist_zone(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            """SELECT * FROM player_assist_zones
+               WHERE player_id = ? AND season = ?""",
+            (player_id, season)
+        )
+        return [self._row_to_assist_zone(row) for row in cursor.fetchall()]
 
     def _row_to_assist_zone(self, row) -> AssistZone:
         """Convert database row to AssistZone dataclass."""
@@ -131,16 +212,36 @@ class SQLiteZoneRepository(ZoneRepository):
         )
 
     def get_all(self) -> List[PlayerZones]:
-        """Get zones for all players."""
+        """Get zones for all players (current season)."""
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[PlayerZones]:
+        """Yield each player's current-season zones as the rows stream in.
+
+        Both zone tables are read in player_id order and merged with the
+        player list, so only one player's zones are held at a time.
+        """
+        season = "2025-26"
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT DISTINCT player_id FROM player_shooting_zones"
-            )
-            player_ids = [row['player_id'] for row in cursor.fetchall()]
-            return [self.get_by_id(pid) for pid in player_ids if self.get_by_id(pid)]
-        finally:
-            conn.close()
+        shooting = _ordered_lookup(_group_by_key(
+            conn.execute("SELECT * FROM player_shooting_zones WHERE season = ? ORDER BY player_id", (season,)),
+            'player_id', self._row_to_shooting_zone,
+        ))
+        assists = _ordered_lookup(_group_by_key(
+            conn.execute("SELECT * FROM player_assist_zones WHERE season = ? ORDER BY player_id", (season,)),
+            'player_id', self._row_to_assist_zone,
+        ))
+
+        for (player_id,) in conn.execute("SELECT DISTINCT player_id FROM player_shooting_zones ORDER BY player_id"):
+            shooting_zones = shooting(player_id)
+            assist_zones = assists(player_id)
+            if shooting_zones or assist_zones:
+                yield PlayerZones(
+                    player_id=player_id,
+                    season=season,
+                    shooting_zones=shooting_zones,
+                    assist_zones=assist_zones,
+                )
 
     def save(self, zones: PlayerZones) -> None:
         """Save all zones for a player."""
@@ -148,31 +249,54 @@ class SQLiteZoneRepository(ZoneRepository):
         self.save_assist_zones(zones.player_id, zones.season, zones.assist_zones)
 
     def save_shooting_zones(self, player_id: int, season: str, zones: List[ShootingZone]) -> None:
+        self.save_shooting_zones_bulk(
+            player_id,
+            season,
+            np.array([zone.zone_name for zone in zones], dtype=object),
+            np.array([zone.fgm for zone in zones], dtype=np.int64),
+            np.array([zone.fga for zone in zones], dtype=np.int64),
+        )
+
+    def save_shooting_zones_bulk(
+        self, player_id: int, season: str, names: np.ndarray, fgm: np.ndarray, fga: np.ndarray
+    ) -> None:
+        """
+        Replace a player's shooting zones from column arrays.
+
+        Percentages are computed for all zones at once and rows are written
+        with a single executemany, so no ShootingZone objects are needed.
+
+        Args:
+            player_id: NBA player ID
+            season: Season string (e.g., "2025-26")
+            names: Zone names
+            fgm: Field goals made per zone
+            fga: Field goals attempted per zone
+        """
+        zone_names = [str(name) for name in names]
+        fgm = np.asarray(fgm, dtype=np.int64)
+        fga = np.asarray(fga, dtype=np.int64)
+
+        # efg_pct assumes all shots in zones named with a "3" are threes
+        three_weight = np.array([1.5 if '3' in name else 1.0 for name in zone_names])
+        safe_fga = np.where(fga > 0, fga, 1)
+        fg_pct = np.where(fga > 0, fgm / safe_fga * 100, 0.0)
+        efg_pct = np.where(fga > 0, fgm * three_weight / safe_fga * 100, 0.0)
+
+        # tolist() converts every column to Python scalars in one C pass
+        rows = list(zip(
+            repeat(player_id), repeat(season), zone_names,
+            fgm.tolist(), fga.tolist(), fg_pct.tolist(), efg_pct.tolist(),
+        ))
+
         conn = self._get_connection()
-        try:
+        with conn:
             # Clear existing zones for this player/season
             conn.execute(
                 "DELETE FROM player_shooting_zones WHERE player_id = ? AND season = ?",
                 (player_id, season)
             )
-            # Insert new zones with calculated fg_pct
-            for zone in zones:
-                fg_pct = zone.fg_pct  # Computed property
-                # Calculate efg_pct (assumes all shots in corner 3 and above break are 3s)
-                is_three = '3' in zone.zone_name
-                if zone.fga > 0:
-                    efg_pct = (zone.fgm + (0.5 * zone.fgm if is_three else 0)) / zone.fga * 100
-                else:
-                    efg_pct = 0.0
-
-                conn.execute("""
-                    INSERT INTO player_shooting_zones
-                    (player_id, season, zone_name, fgm, fga, fg_pct, efg_pct, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (player_id, season, zone.zone_name, zone.fgm, zone.fga, fg_pct, efg_pct))
-            conn.commit()
-        finally:
-            conn.close()
+            conn.executemany(_INSERT_SHOOTING_ZONES_SQL, rows)
 
     def save_assist_zones(self, player_id: int, season: str, zones: List[AssistZone]) -> None:
         """
@@ -184,30 +308,23 @@ class SQLiteZoneRepository(ZoneRepository):
         if not zones:
             return  # Don't delete existing data if collection returned empty
 
+        rows = [
+            (player_id, season, zone.zone_name, zone.zone_area, zone.zone_range, zone.ast, zone.fgm, zone.fga)
+            for zone in zones
+        ]
+
         conn = self._get_connection()
-        try:
+        with conn:
             # Clear existing zones for this player/season (safe because we have new data)
             conn.execute(
                 "DELETE FROM player_assist_zones WHERE player_id = ? AND season = ?",
                 (player_id, season)
             )
-            # Insert new zones
-            for zone in zones:
-                conn.execute("""
-                    INSERT INTO player_assist_zones
-                    (player_id, season, zone_name, zone_area, zone_range, ast, fgm, fga, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    player_id, season, zone.zone_name, zone.zone_area,
-                    zone.zone_range, zone.ast, zone.fgm, zone.fga
-                ))
-            conn.commit()
-        finally:
-            conn.close()
+            conn.executemany(_INSERT_ASSIST_ZONES_SQL, rows)
 
     def delete(self, player_id: int) -> bool:
         conn = self._get_connection()
-        try:
+        with conn:
             cursor1 = conn.execute(
                 "DELETE FROM player_shooting_zones WHERE player_id = ?",
                 (player_id,)
@@ -216,41 +333,32 @@ class SQLiteZoneRepository(ZoneRepository):
                 "DELETE FROM player_assist_zones WHERE player_id = ?",
                 (player_id,)
             )
-            conn.commit()
-            return cursor1.rowcount > 0 or cursor2.rowcount > 0
-        finally:
-            conn.close()
+        return cursor1.rowcount > 0 or cursor2.rowcount > 0
 
     def exists(self, player_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM player_shooting_zones WHERE player_id = ?",
-                (player_id,)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "SELECT 1 FROM player_shooting_zones WHERE player_id = ?",
+            (player_id,)
+        )
+        return cursor.fetchone() is not None
 
     def get_completed_game_ids(self, player_id: int, season: str) -> Set[str]:
         """Get game IDs already processed for this player's assist zones."""
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT game_id FROM assist_zones_checkpoint
-                   WHERE player_id = ? AND season = ? AND status = 'completed'""",
-                (player_id, season)
-            )
-            return {row['game_id'] for row in cursor.fetchall()}
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            """SELECT game_id FROM assist_zones_checkpoint
+               WHERE player_id = ? AND season = ? AND status = 'completed'""",
+            (player_id, season)
+        )
+        return {row['game_id'] for row in cursor.fetchall()}
 
     def mark_game_completed(
         self, player_id: int, season: str, game_id: str, game_date: str, assists_found: int
     ) -> None:
         """Mark a game as processed in the checkpoint table."""
         conn = self._get_connection()
-        try:
+        with conn:
             conn.execute("""
                 INSERT INTO assist_zones_checkpoint
                 (player_id, season, game_id, game_date, status, assists_found, completed_at)
@@ -260,45 +368,29 @@ class SQLiteZoneRepository(ZoneRepository):
                     assists_found = excluded.assists_found,
                     completed_at = CURRENT_TIMESTAMP
             """, (player_id, season, game_id, game_date, assists_found))
-            conn.commit()
-        finally:
-            conn.close()
 
     def accumulate_assist_zones(self, player_id: int, season: str, zones: List[AssistZone]) -> None:
         """Add assists to existing zone totals (incremental update)."""
         if not zones:
             return
 
+        rows = [
+            (player_id, season, zone.zone_name, zone.zone_area, zone.zone_range, zone.ast, zone.fgm, zone.fga)
+            for zone in zones
+        ]
+
         conn = self._get_connection()
-        try:
-            for zone in zones:
-                conn.execute("""
-                    INSERT INTO player_assist_zones
-                    (player_id, season, zone_name, zone_area, zone_range, ast, fgm, fga, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ON CONFLICT(player_id, season, zone_name) DO UPDATE SET
-                        ast = ast + excluded.ast,
-                        fgm = fgm + excluded.fgm,
-                        fga = fga + excluded.fga,
-                        last_updated = CURRENT_TIMESTAMP
-                """, (
-                    player_id, season, zone.zone_name, zone.zone_area,
-                    zone.zone_range, zone.ast, zone.fgm, zone.fga
-                ))
-            conn.commit()
-        finally:
-            conn.close()
-
-
-class SQLiteTeamDefenseZoneRepository(TeamDefenseZoneRepository):
-    """SQLite implementation of TeamDefenseZoneRepository."""
+        with conn:
+            conn.executemany(_ACCUMULATE_ASSIST_ZONES_SQL, rows)
+
 
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+class SQLiteTeamDefenseZoneRepository(ThreadLocalConnectionMixin, TeamDefenseZoneRepository):
+    """SQLite implementation of TeamDefenseZoneRepository."""
 
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = super()._open_connection()
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
     def get_by_id(self, team_id: int) -> Optional[TeamDefenseZones]:
@@ -307,34 +399,19 @@ class SQLiteTeamDefenseZoneRepository(TeamDefenseZoneRepository):
 
     def get_by_team(self, team_id: int, season: str) -> Optional[TeamDefenseZones]:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """SELECT * FROM team_defensive_zones
-                   WHERE team_id = ? AND season = ?""",
-                (team_id, season)
-            )
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            zones = [self._row_to_defense_zone(row) for row in rows]
+        rows = conn.execute(
+            _SELECT_DEFENSE_ZONES_SQL + " WHERE z.team_id = ? AND z.season = ?",
+            (team_id, season)
+        ).fetchall()
 
-            # Get team name
-            team_cursor = conn.execute(
-                "SELECT team_name FROM teams WHERE team_id = ?",
-                (team_id,)
-            )
-            team_row = team_cursor.fetchone()
-            team_name = team_row['team_name'] if team_row else ''
-
-            return TeamDefenseZones(
-                team_id=team_id,
-                team_name=team_name,
-                season=season,
-                zones=zones,
-            )
-        finally:
-            conn.close()
+        if not rows:
+            return None
+        return TeamDefenseZones(
+            team_id=team_id,
+            team_name=rows[0]['team_name'] or '',
+            season=season,
+            zones=[self._row_to_defense_zone(row) for row in rows],
+        )
 
     def _row_to_defense_zone(self, row) -> TeamDefenseZone:
         """Convert database row to TeamDefenseZone dataclass."""
@@ -348,59 +425,58 @@ class SQLiteTeamDefenseZoneRepository(TeamDefenseZoneRepository):
         )
 
     def get_all(self) -> List[TeamDefenseZones]:
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT DISTINCT team_id FROM team_defensive_zones"
+        """Get defensive zones for all teams (current season)."""
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[TeamDefenseZones]:
+        """Yield each team's current-season defensive zones as the rows stream in."""
+        season = "2025-26"
+        cursor = self._get_connection().execute(
+            _SELECT_DEFENSE_ZONES_SQL + " WHERE z.season = ? ORDER BY z.team_id",
+            (season,)
+        )
+        for _, rows in groupby(cursor, key=itemgetter('team_id')):
+            first = next(rows)
+            yield TeamDefenseZones(
+                team_id=first['team_id'],
+                team_name=first['team_name'] or '',
+                season=season,
+                zones=[self._row_to_defense_zone(first)] + [self._row_to_defense_zone(row) for row in rows],
             )
-            team_ids = [row['team_id'] for row in cursor.fetchall()]
-            return [self.get_by_id(tid) for tid in team_ids if self.get_by_id(tid)]
-        finally:
-            conn.close()
 
     def save(self, defense: TeamDefenseZones) -> None:
+        # Computed percentages are stored as basis points
+        rows = []
+        for zone in defense.zones:
+            opp_fg_pct = round(zone.opp_fgm / zone.opp_fga * 10000) if zone.opp_fga > 0 else 0
+            rows.append((
+                defense.team_id, defense.season, zone.zone_name,
+                zone.zone_area, zone.zone_range, zone.opp_fgm, zone.opp_fga,
+                opp_fg_pct, opp_fg_pct
+            ))
+
         conn = self._get_connection()
-        try:
+        with conn:
             # Clear existing zones for this team/season
             conn.execute(
                 "DELETE FROM team_defensive_zones WHERE team_id = ? AND season = ?",
                 (defense.team_id, defense.season)
             )
-            # Insert new zones with computed percentages
-            for zone in defense.zones:
-                opp_fg_pct = (zone.opp_fgm / zone.opp_fga * 100) if zone.opp_fga > 0 else 0.0
-                conn.execute("""
-                    INSERT INTO team_defensive_zones
-                    (team_id, season, zone_name, zone_area, zone_range, opp_fgm, opp_fga, opp_fg_pct, opp_efg_pct)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    defense.team_id, defense.season, zone.zone_name,
-                    zone.zone_area, zone.zone_range, zone.opp_fgm, zone.opp_fga,
-                    opp_fg_pct, opp_fg_pct
-                ))
-            conn.commit()
-        finally:
-            conn.close()
+            conn.executemany(_INSERT_DEFENSE_ZONES_SQL, rows)
 
     def delete(self, team_id: int) -> bool:
         conn = self._get_connection()
-        try:
+        with conn:
             cursor = conn.execute(
                 "DELETE FROM team_defensive_zones WHERE team_id = ?",
                 (team_id,)
             )
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        return cursor.rowcount > 0
 
     def exists(self, team_id: int) -> bool:
         conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT 1 FROM team_defensive_zones WHERE team_id = ?",
-                (team_id,)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor = conn.execute(
+            "SELECT 1 FROM team_defensive_zones WHERE team_id = ?",
+            (team_id,)
+        )
+        return cursor.fetchone() is not None
@@ -1,16 +1,27 @@
 """Helpers - Pure utility functions with no side effects."""
 
-from .combo_stats import calculate_combo_stats, ComboStats
+from .combo_stats import (
+    calculate_combo_stats,
+    calculate_combo_stats_batch,
+    calculate_fantasy_points_batch,
+    ComboStats,
+)
 from .zone_mapper import (
+    count_zones_from_coordinates,
     get_zone_from_coordinates,
+    get_zone_ids_from_coordinates,
     normalize_zone_name,
     ZONE_NAMES,
 )
 
 __all__ = [
     'calculate_combo_stats',
+    'calculate_combo_stats_batch',
+    'calculate_fantasy_points_batch',
     'ComboStats',
+    'count_zones_from_coordinates',
     'get_zone_from_coordinates',
+    'get_zone_ids_from_coordinates',
     'normalize_zone_name',
     'ZONE_NAMES',
 ]
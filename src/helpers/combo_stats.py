@@ -2,6 +2,10 @@
 
 from dataclasses import dataclass
 from typing import Union
+
+import numpy as np
+import pandas as pd
+
 from ..models.player import PlayerStats
 from ..models.game import GameLog
 
@@ -17,6 +21,27 @@ class ComboStats:
     blks_plus_stls: float  # alias for stocks
 
 
+# Standard DFS scoring
+DEFAULT_FANTASY_SCORING = {
+    'points': 1.0,
+    'rebounds': 1.25,
+    'assists': 1.5,
+    'steals': 2.0,
+    'blocks': 2.0,
+    'turnovers': -0.5,
+}
+
+# Game log column for each scoring stat
+_FANTASY_COLUMNS = {
+    'points': 'pts',
+    'rebounds': 'reb',
+    'assists': 'ast',
+    'steals': 'stl',
+    'blocks': 'blk',
+    'turnovers': 'tov',
+}
+
+
 def calculate_combo_stats(stats: Union[PlayerStats, GameLog]) -> ComboStats:
     """
     Calculate all combo stats from player stats or game log.
@@ -66,26 +91,70 @@ def calculate_fantasy_points(
         Total fantasy points
     """
     if scoring is None:
-        scoring = {
-            'points': 1.0,
-            'rebounds': 1.25,
-            'assists': 1.5,
-            'steals': 2.0,
-            'blocks': 2.0,
-            'turnovers': -0.5,
-        }
+        scoring = DEFAULT_FANTASY_SCORING
 
     total = 0.0
-    total += stats.points * scoring.get('points', 1.0)
-    total += stats.rebounds * scoring.get('rebounds', 1.25)
-    total += stats.assists * scoring.get('assists', 1.5)
-    total += stats.steals * scoring.get('steals', 2.0)
-    total += stats.blocks * scoring.get('blocks', 2.0)
-    total += stats.turnovers * scoring.get('turnovers', -0.5)
+    for stat, default in DEFAULT_FANTASY_SCORING.items():
+        total += getattr(stats, stat) * scoring.get(stat, default)
 
     return total
 
 
+def calculate_combo_stats_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate combo stats for every row of a game log DataFrame.
+
+    Columnar counterpart of calculate_combo_stats for scoring many
+    players at once.
+
+    Args:
+        df: DataFrame with pts, reb, ast, stl and blk columns
+
+    Returns:
+        DataFrame indexed like df with one column per ComboStats field
+    """
+    stocks = df['stl'] + df['blk']
+
+    return pd.DataFrame({
+        'pts_plus_ast': df['pts'] + df['ast'],
+        'pts_plus_reb': df['pts'] + df['reb'],
+        'ast_plus_reb': df['ast'] + df['reb'],
+        'pts_reb_ast': df['pts'] + df['reb'] + df['ast'],
+        'stocks': stocks,
+        'blks_plus_stls': stocks,
+    }, index=df.index)
+
+
+def calculate_fantasy_points_batch(
+    df: pd.DataFrame,
+    scoring: dict = None,
+) -> pd.Series:
+    """
+    Calculate fantasy points for every row of a game log DataFrame.
+
+    Columnar counterpart of calculate_fantasy_points: the stat columns
+    are stacked into one matrix and scored with a single dot product.
+
+    Args:
+        df: DataFrame with pts, reb, ast, stl, blk and tov columns
+        scoring: Dictionary with point values for each stat.
+                 Defaults to standard DFS scoring.
+
+    Returns:
+        Series of total fantasy points indexed like df
+    """
+    if scoring is None:
+        scoring = DEFAULT_FANTASY_SCORING
+
+    weights = np.array([
+        scoring.get(stat, DEFAULT_FANTASY_SCORING[stat])
+        for stat in _FANTASY_COLUMNS
+    ])
+    stats = df[list(_FANTASY_COLUMNS.values())].to_numpy(dtype=np.float64)
+
+    return pd.Series(stats @ weights, index=df.index, name='fantasy_points')
+
+
 def per_36_stats(
     stats: Union[PlayerStats, GameLog],
     minutes: float = None,
@@ -1,5 +1,9 @@
 """Zone Mapper - Pure functions for mapping shot coordinates to zones."""
 
+from functools import lru_cache
+
+import numpy as np
+
 # Standard zone names used throughout the application
 ZONE_NAMES = [
     'Restricted Area',
@@ -25,12 +29,25 @@ ZONE_BOUNDARIES = {
 THREE_POINT_DISTANCE = 237.5
 CORNER_THREE_DISTANCE = 220
 
+# Squared radii, so classifiers compare x*x + y*y without a square root
+THREE_POINT_DISTANCE_SQ = THREE_POINT_DISTANCE ** 2
+RESTRICTED_AREA_RADIUS_SQ = ZONE_BOUNDARIES['Restricted Area']['radius'] ** 2
+
+# Coordinate window covered by the precomputed zone lookup table
+# (sideline to sideline, baseline to half court). Points outside it are
+# classified directly with the vectorized branch tree.
+ZONE_LUT_X_RANGE = (-250, 250)
+ZONE_LUT_Y_RANGE = (-50, 470)
+
 
+@lru_cache(maxsize=1 << 16)
 def get_zone_from_coordinates(x: int, y: int) -> str:
     """
     Map shot coordinates to zone name.
 
     This is a PURE FUNCTION - easy to test with known coordinates.
+    Results are memoized per (x, y) since shot coordinates are integers
+    in a bounded range and repeat often (especially around the rim).
 
     Args:
         x: X coordinate (negative = left, positive = right)
@@ -39,19 +56,19 @@ def get_zone_from_coordinates(x: int, y: int) -> str:
     Returns:
         Zone name string
     """
-    # Distance from basket
-    distance = (x**2 + y**2) ** 0.5
+    # Squared distance from basket (compared against squared radii, no sqrt)
+    dist_sq = x * x + y * y
 
     # Check corner 3s first (corners have shorter 3pt distance)
     if abs(x) >= 220 and y < 90:
         return 'Left Corner 3' if x < 0 else 'Right Corner 3'
 
     # Check if beyond 3-point arc
-    if distance > THREE_POINT_DISTANCE:
+    if dist_sq > THREE_POINT_DISTANCE_SQ:
         return 'Above the Break 3'
 
     # Check restricted area (within 4 feet of basket)
-    if distance <= 40:
+    if dist_sq <= RESTRICTED_AREA_RADIUS_SQ:
         return 'Restricted Area'
 
     # Check paint (non-restricted area)
@@ -62,6 +79,117 @@ def get_zone_from_coordinates(x: int, y: int) -> str:
     return 'Mid-Range'
 
 
+def _classify_zone_ids(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Vectorized form of get_zone_from_coordinates returning ZONE_NAMES indices."""
+    dist_sq = x * x + y * y
+    conditions = [
+        (np.abs(x) >= 220) & (y < 90) & (x < 0),
+        (np.abs(x) >= 220) & (y < 90),
+        dist_sq > THREE_POINT_DISTANCE_SQ,
+        dist_sq <= RESTRICTED_AREA_RADIUS_SQ,
+        (np.abs(x) <= 80) & (y <= 140),
+    ]
+    choices = [
+        ZONE_NAMES.index('Left Corner 3'),
+        ZONE_NAMES.index('Right Corner 3'),
+        ZONE_NAMES.index('Above the Break 3'),
+        ZONE_NAMES.index('Restricted Area'),
+        ZONE_NAMES.index('Paint (Non-RA)'),
+    ]
+    return np.select(conditions, choices, default=ZONE_NAMES.index('Mid-Range')).astype(np.int8)
+
+
+@lru_cache(maxsize=1)
+def _zone_lut() -> np.ndarray:
+    """Zone-id lookup table indexed by [x - x_min, y - y_min]."""
+    x_min, x_max = ZONE_LUT_X_RANGE
+    y_min, y_max = ZONE_LUT_Y_RANGE
+    x, y = np.meshgrid(
+        np.arange(x_min, x_max + 1, dtype=np.int64),
+        np.arange(y_min, y_max + 1, dtype=np.int64),
+        indexing='ij',
+    )
+    return _classify_zone_ids(x, y)
+
+
+def get_zone_ids_from_coordinates(x, y) -> np.ndarray:
+    """
+    Map arrays of shot coordinates to zone ids (indices into ZONE_NAMES).
+
+    Vectorized counterpart of get_zone_from_coordinates: in-court points are
+    resolved with a single lookup-table gather instead of a Python call per shot.
+
+    Args:
+        x: Array-like of X coordinates (truncated to int)
+        y: Array-like of Y coordinates (truncated to int)
+
+    Returns:
+        int8 array of zone ids, same length as the inputs
+    """
+    x = np.asarray(x, dtype=np.float64).astype(np.int64)
+    y = np.asarray(y, dtype=np.float64).astype(np.int64)
+
+    x_min, x_max = ZONE_LUT_X_RANGE
+    y_min, y_max = ZONE_LUT_Y_RANGE
+    in_lut = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+
+    if in_lut.all():
+        return _zone_lut()[x - x_min, y - y_min]
+
+    zone_ids = np.empty(x.shape, dtype=np.int8)
+    zone_ids[in_lut] = _zone_lut()[x[in_lut] - x_min, y[in_lut] - y_min]
+    zone_ids[~in_lut] = _classify_zone_ids(x[~in_lut], y[~in_lut])
+    return zone_ids
+
+
+def count_zones_from_coordinates(x, y) -> np.ndarray:
+    """
+    Count shots per zone for arrays of shot coordinates.
+
+    Args:
+        x: Array-like of X coordinates (truncated to int)
+        y: Array-like of Y coordinates (truncated to int)
+
+    Returns:
+        int64 array of length len(ZONE_NAMES) with the shot count per zone
+    """
+    return np.bincount(get_zone_ids_from_coordinates(x, y), minlength=len(ZONE_NAMES))
+
+
+# Lower-cased API zone names -> standard zone names, plus the standard names
+# themselves so already-normalized input is a single lookup
+_ZONE_NAME_MAP = {
+    # NBA API variants
+    'restricted area': 'Restricted Area',
+    'in the paint (non-ra)': 'Paint (Non-RA)',
+    'in the paint': 'Paint (Non-RA)',
+    'paint': 'Paint (Non-RA)',
+    'mid-range': 'Mid-Range',
+    'midrange': 'Mid-Range',
+    'mid range': 'Mid-Range',
+    'left corner 3': 'Left Corner 3',
+    'left corner': 'Left Corner 3',
+    'right corner 3': 'Right Corner 3',
+    'right corner': 'Right Corner 3',
+    'above the break 3': 'Above the Break 3',
+    'above break 3': 'Above the Break 3',
+    'arc 3': 'Above the Break 3',
+    'backcourt': 'Above the Break 3',
+}
+_ZONE_NAME_MAP.update((name, name) for name in ZONE_NAMES)
+
+# Rough expected values based on league averages
+_ZONE_VALUES = {
+    'Restricted Area': 1.30,  # ~65% FG% * 2 points
+    'Paint (Non-RA)': 0.82,   # ~41% FG% * 2 points
+    'Mid-Range': 0.80,        # ~40% FG% * 2 points
+    'Left Corner 3': 1.17,    # ~39% FG% * 3 points
+    'Right Corner 3': 1.17,   # ~39% FG% * 3 points
+    'Above the Break 3': 1.08, # ~36% FG% * 3 points
+}
+_PAINT_ZONES = frozenset({'Restricted Area', 'Paint (Non-RA)'})
+
+
 def normalize_zone_name(raw_name: str) -> str:
     """
     Standardize zone names from different sources.
@@ -75,26 +203,8 @@ def normalize_zone_name(raw_name: str) -> str:
     Returns:
         Standardized zone name
     """
-    mappings = {
-        # NBA API variants
-        'restricted area': 'Restricted Area',
-        'in the paint (non-ra)': 'Paint (Non-RA)',
-        'in the paint': 'Paint (Non-RA)',
-        'paint': 'Paint (Non-RA)',
-        'mid-range': 'Mid-Range',
-        'midrange': 'Mid-Range',
-        'mid range': 'Mid-Range',
-        'left corner 3': 'Left Corner 3',
-        'left corner': 'Left Corner 3',
-        'right corner 3': 'Right Corner 3',
-        'right corner': 'Right Corner 3',
-        'above the break 3': 'Above the Break 3',
-        'above break 3': 'Above the Break 3',
-        'arc 3': 'Above the Break 3',
-        'backcourt': 'Above the Break 3',
-    }
-
-    normalized = mappings.get(raw_name.lower().strip())
+    # Canonical names (and exact-case keys) resolve without lower()/strip()
+    normalized = _ZONE_NAME_MAP.get(raw_name) or _ZONE_NAME_MAP.get(raw_name.lower().strip())
     if normalized:
         return normalized
 
@@ -112,24 +222,15 @@ def get_zone_value(zone_name: str) -> float:
     Returns:
         Expected points per shot (considering 2 vs 3 pointers)
     """
-    # These are rough expected values based on league averages
-    zone_values = {
-        'Restricted Area': 1.30,  # ~65% FG% * 2 points
-        'Paint (Non-RA)': 0.82,   # ~41% FG% * 2 points
-        'Mid-Range': 0.80,        # ~40% FG% * 2 points
-        'Left Corner 3': 1.17,    # ~39% FG% * 3 points
-        'Right Corner 3': 1.17,   # ~39% FG% * 3 points
-        'Above the Break 3': 1.08, # ~36% FG% * 3 points
-    }
-
-    return zone_values.get(zone_name, 1.0)
+    return _ZONE_VALUES.get(zone_name, 1.0)
 
 
+@lru_cache(maxsize=64)
 def is_three_pointer(zone_name: str) -> bool:
-    """Check if zone is a 3-point zone."""
+    """Check if zone is a 3-point zone (any name containing '3', including raw API names)."""
     return '3' in zone_name
 
 
 def is_paint(zone_name: str) -> bool:
     """Check if zone is in the paint (restricted area or non-RA paint)."""
-    return zone_name in ['Restricted Area', 'Paint (Non-RA)']
+    return zone_name in _PAINT_ZONES
@@ -183,21 +183,23 @@ class PropDataLoader:
             -- Underdog props
             SELECT
                 up.full_name as player_name,
-                DATE(up.scheduled_at) as game_date,
+                up.game_date,
                 up.stat_name as stat_type,
                 up.stat_value as line,
                 'underdog' as source,
-                up.american_price as over_odds,
-                (SELECT up2.american_price
-                 FROM underdog_props up2
+                up.american_odds as over_odds,
+                (SELECT up2.american_odds
+                 FROM all_props up2
                  WHERE up2.full_name = up.full_name
                  AND up2.stat_name = up.stat_name
                  AND up2.stat_value = up.stat_value
-                 AND DATE(up2.scheduled_at) = DATE(up.scheduled_at)
+                 AND up2.source = 'underdog'
+                 AND up2.game_date = up.game_date
                  AND up2.choice = 'under'
                  LIMIT 1) as under_odds
-            FROM underdog_props up
-            WHERE up.stat_name = ?
+            FROM all_props up
+            WHERE up.source = 'underdog'
+            AND up.stat_name = ?
             AND DATE(up.scheduled_at, 'localtime') = DATE('now', 'localtime')
             AND up.choice = 'over'
 
@@ -206,17 +208,18 @@ class PropDataLoader:
             -- PrizePicks props
             SELECT
                 pp.full_name as player_name,
-                DATE(pp.scheduled_at) as game_date,
+                pp.game_date,
                 pp.stat_name as stat_type,
                 pp.stat_value as line,
                 'prizepicks' as source,
                 NULL as over_odds,
                 NULL as under_odds
-            FROM prizepicks_props pp
-            WHERE pp.stat_name = ?
+            FROM all_props pp
+            WHERE pp.source = 'prizepicks'
+            AND pp.stat_name = ?
             AND DATE(pp.scheduled_at, 'localtime') = DATE('now', 'localtime')
             AND pp.choice = 'over'
-            AND pp.prop_type = 'standard'
+            AND COALESCE(pp.prop_type, 'standard') = 'standard'
 
             UNION ALL
 
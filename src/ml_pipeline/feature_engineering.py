@@ -16,7 +16,8 @@ Usage:
 import sqlite3
 import argparse
 from typing import Dict
-import re
+
+import pandas as pd
 
 
 def add_derived_columns(db_path: str = 'data/nba_stats.db') -> None:
@@ -69,39 +70,63 @@ def parse_matchup(matchup: str) -> tuple:
     return None, None
 
 
+# parse_matchup in SQL: " vs. " (home) is checked before " @ " (away), and
+# the opponent is the trimmed text after the separator. instr() keeps the
+# match case-sensitive like the Python version; rows with neither separator
+# are left untouched.
+_HOME_AWAY_UPDATE_SQL = """
+    UPDATE player_game_logs SET
+        is_home = CASE WHEN instr(matchup, ' vs. ') > 0 THEN 1 ELSE 0 END,
+        opponent_abbr = CASE
+            WHEN instr(matchup, ' vs. ') > 0 THEN trim(substr(matchup, instr(matchup, ' vs. ') + 5))
+            ELSE trim(substr(matchup, instr(matchup, ' @ ') + 3))
+        END
+    WHERE (is_home IS NULL OR opponent_abbr IS NULL)
+      AND (instr(matchup, ' vs. ') > 0 OR instr(matchup, ' @ ') > 0)
+"""
+
+
 def compute_home_away_features(db_path: str = 'data/nba_stats.db') -> Dict[str, int]:
     """
     Compute is_home and opponent_abbr from matchup string.
 
+    Runs parse_matchup's rules as one set-based UPDATE instead of a
+    Python round-trip per row.
+
     Returns:
         Dict with update counts
     """
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Get all rows that need updating
-    cursor.execute('''
-        SELECT rowid, matchup FROM player_game_logs
-        WHERE is_home IS NULL OR opponent_abbr IS NULL
-    ''')
-    rows = cursor.fetchall()
-
-    updated = 0
-    for rowid, matchup in rows:
-        is_home, opponent_abbr = parse_matchup(matchup)
-
-        if is_home is not None:
-            cursor.execute('''
-                UPDATE player_game_logs
-                SET is_home = ?, opponent_abbr = ?
-                WHERE rowid = ?
-            ''', (is_home, opponent_abbr, rowid))
-            updated += 1
-
-    conn.commit()
-    conn.close()
-
-    return {'updated': updated}
+    try:
+        with conn:
+            cursor = conn.execute(_HOME_AWAY_UPDATE_SQL)
+        return {'updated': cursor.rowcount}
+    finally:
+        conn.close()
+
+
+# Days between each game and the player's previous game that season.
+# substr() drops any "T00:00:00" suffix; a malformed date has no julianday,
+# so neither it nor the game after it gets a value.
+_REST_DAYS_UPDATE_SQL = """
+    WITH rest AS (
+        SELECT
+            rowid AS game_rowid,
+            CAST(
+                julianday(substr(game_date, 1, 10))
+                - LAG(julianday(substr(game_date, 1, 10))) OVER (
+                    PARTITION BY player_id, season ORDER BY game_date
+                )
+            AS INTEGER) AS days_rest
+        FROM player_game_logs
+        WHERE game_date IS NOT NULL AND game_date != ''
+    )
+    UPDATE player_game_logs SET
+        days_rest = rest.days_rest,
+        is_back_to_back = rest.days_rest <= 1
+    FROM rest
+    WHERE player_game_logs.rowid = rest.game_rowid AND rest.days_rest IS NOT NULL
+"""
 
 
 def compute_rest_days_features(db_path: str = 'data/nba_stats.db') -> Dict[str, int]:
@@ -111,60 +136,36 @@ def compute_rest_days_features(db_path: str = 'data/nba_stats.db') -> Dict[str,
     days_rest = days since player's previous game (NULL for first game of season)
     is_back_to_back = 1 if days_rest <= 1, else 0
 
+    Computed in one UPDATE with a LAG() window over each player's season.
+
     Returns:
         Dict with update counts
     """
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Get all games ordered by player and date
-    cursor.execute('''
-        SELECT rowid, player_id, game_date, season
-        FROM player_game_logs
-        ORDER BY player_id, season, game_date
-    ''')
-    rows = cursor.fetchall()
-
-    # Track previous game date per player per season
-    prev_game = {}  # (player_id, season) -> game_date
-    updates = []
-
-    for rowid, player_id, game_date, season in rows:
-        key = (player_id, season)
-
-        # Extract just the date part (handle both "2025-12-25" and "2025-12-25T00:00:00")
-        current_date = game_date.split('T')[0] if game_date else None
-
-        if current_date and key in prev_game:
-            prev_date = prev_game[key]
-
-            # Calculate days between games
-            try:
-                from datetime import datetime
-                curr = datetime.strptime(current_date, '%Y-%m-%d')
-                prev = datetime.strptime(prev_date, '%Y-%m-%d')
-                days_rest = (curr - prev).days
-                is_b2b = 1 if days_rest <= 1 else 0
-
-                updates.append((days_rest, is_b2b, rowid))
-            except ValueError:
-                pass
-
-        # Update previous game for this player/season
-        if current_date:
-            prev_game[key] = current_date
-
-    # Batch update
-    cursor.executemany('''
-        UPDATE player_game_logs
-        SET days_rest = ?, is_back_to_back = ?
-        WHERE rowid = ?
-    ''', updates)
-
-    conn.commit()
-    conn.close()
-
-    return {'updated': len(updates)}
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    try:
+        with conn:
+            conn.execute(_REST_DAYS_UPDATE_SQL)
+            # cursor.rowcount isn't reported for statements starting with WITH
+            updated = conn.execute("SELECT changes()").fetchone()[0]
+        return {'updated': updated}
+    finally:
+        conn.close()
+
+
+# Rows of player_game_logs read per opponent-rest batch
+_OPPONENT_REST_BATCH_SIZE = 10_000
+
+_OPPONENT_REST_BATCH_SQL = """
+    SELECT rowid AS game_rowid, substr(game_date, 1, 10) AS game_day, opponent_abbr AS team_abbr
+    FROM player_game_logs
+    WHERE opponent_abbr IS NOT NULL
+      AND opponent_days_rest IS NULL
+      AND rowid > ?
+    ORDER BY rowid
+    LIMIT ?
+"""
 
 
 def compute_opponent_rest_features(db_path: str = 'data/nba_stats.db') -> Dict[str, int]:
@@ -172,93 +173,60 @@ def compute_opponent_rest_features(db_path: str = 'data/nba_stats.db') -> Dict[s
     Compute opponent team's rest days for each player-game.
 
     For each game, looks up the opponent's previous game date from the schedule
-    table and calculates how many days of rest the opponent had.
+    table and calculates how many days of rest the opponent had. The lookup
+    is an as-of join over batches of games instead of a per-row scan.
 
     Returns:
         Dict with update counts
     """
-    from datetime import datetime
-
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Build a lookup of each team's game dates from the schedule table
-    # Format: {team_abbr: [sorted list of game_dates]}
-    cursor.execute('''
-        SELECT game_date, home_team_abbreviation, away_team_abbreviation
-        FROM schedule
-        WHERE game_date IS NOT NULL
-        ORDER BY game_date
-    ''')
-    schedule_rows = cursor.fetchall()
-
-    team_games = {}  # team_abbr -> list of game_dates (sorted)
-    for game_date, home_abbr, away_abbr in schedule_rows:
-        # Extract just the date part
-        date_str = game_date.split('T')[0] if game_date else None
-        if not date_str:
-            continue
-
-        if home_abbr:
-            if home_abbr not in team_games:
-                team_games[home_abbr] = []
-            team_games[home_abbr].append(date_str)
-
-        if away_abbr:
-            if away_abbr not in team_games:
-                team_games[away_abbr] = []
-            team_games[away_abbr].append(date_str)
-
-    # Sort and deduplicate game dates for each team
-    for team_abbr in team_games:
-        team_games[team_abbr] = sorted(set(team_games[team_abbr]))
-
-    # Get all player_game_logs rows that need updating
-    cursor.execute('''
-        SELECT rowid, game_date, opponent_abbr
-        FROM player_game_logs
-        WHERE opponent_abbr IS NOT NULL
-        AND opponent_days_rest IS NULL
-    ''')
-    rows = cursor.fetchall()
-
-    updates = []
-    for rowid, game_date, opponent_abbr in rows:
-        # Extract just the date part
-        current_date = game_date.split('T')[0] if game_date else None
-        if not current_date or opponent_abbr not in team_games:
-            continue
-
-        opp_game_dates = team_games[opponent_abbr]
-
-        # Find opponent's previous game before this date
-        prev_game_date = None
-        for gd in opp_game_dates:
-            if gd < current_date:
-                prev_game_date = gd
-            else:
-                break
-
-        if prev_game_date:
-            try:
-                curr = datetime.strptime(current_date, '%Y-%m-%d')
-                prev = datetime.strptime(prev_game_date, '%Y-%m-%d')
-                opponent_days_rest = (curr - prev).days
-                updates.append((opponent_days_rest, rowid))
-            except ValueError:
-                pass
-
-    # Batch update
-    cursor.executemany('''
-        UPDATE player_game_logs
-        SET opponent_days_rest = ?
-        WHERE rowid = ?
-    ''', updates)
-
-    conn.commit()
-    conn.close()
+    try:
+        # Each team's distinct game days, from both sides of the schedule
+        team_games = pd.read_sql_query('''
+            SELECT DISTINCT substr(game_date, 1, 10) AS game_day, team_abbr FROM (
+                SELECT game_date, home_team_abbreviation AS team_abbr FROM schedule
+                UNION ALL
+                SELECT game_date, away_team_abbreviation FROM schedule
+            )
+            WHERE game_date IS NOT NULL AND game_date != '' AND team_abbr IS NOT NULL AND team_abbr != ''
+        ''', conn)
+
+        team_games['prev_date'] = pd.to_datetime(team_games['game_day'], format='%Y-%m-%d', errors='coerce')
+        team_games = team_games.dropna(subset=['prev_date']).sort_values('prev_date')[['prev_date', 'team_abbr']]
+
+        updated = 0
+        last_rowid = 0
+        with conn:
+            while True:
+                # Next batch of rows needing an update, paged by rowid so the
+                # whole table is never held in memory at once
+                games = pd.read_sql_query(
+                    _OPPONENT_REST_BATCH_SQL, conn, params=(last_rowid, _OPPONENT_REST_BATCH_SIZE)
+                )
+                if games.empty:
+                    break
+                last_rowid = int(games['game_rowid'].iloc[-1])
+
+                games['date'] = pd.to_datetime(games['game_day'], format='%Y-%m-%d', errors='coerce')
+                games = games.dropna(subset=['date']).sort_values('date')
+
+                # Opponent's latest game strictly before this one
+                matched = pd.merge_asof(
+                    games, team_games,
+                    left_on='date', right_on='prev_date', by='team_abbr',
+                    allow_exact_matches=False, direction='backward',
+                ).dropna(subset=['prev_date'])
+
+                days_rest = (matched['date'] - matched['prev_date']).dt.days
+                conn.executemany(
+                    "UPDATE player_game_logs SET opponent_days_rest = ? WHERE rowid = ?",
+                    zip(days_rest.tolist(), matched['game_rowid'].tolist()),
+                )
+                updated += len(matched)
+    finally:
+        conn.close()
 
-    return {'updated': len(updates)}
+    return {'updated': updated}
 
 
 def get_feature_statistics(db_path: str = 'data/nba_stats.db') -> Dict:
@@ -506,11 +506,11 @@ class PropOutcomeTracker:
                  AND ap2.stat_name = ap.stat_name
                  AND ap2.stat_value = ap.stat_value
                  AND ap2.source = ap.source
-                 AND DATE(ap2.scheduled_at) = DATE(ap.scheduled_at)
+                 AND ap2.game_date = ap.game_date
                  AND ap2.choice = 'under'
                  LIMIT 1) as under_odds
             FROM all_props ap
-            WHERE DATE(ap.scheduled_at) = DATE(?)
+            WHERE ap.game_date = DATE(?)
             AND ap.choice = 'over'
             AND NOT EXISTS (
                 SELECT 1 FROM prop_outcomes po
@@ -622,9 +622,9 @@ class PropOutcomeTracker:
 
         # Get all unique game dates with props from all sources
         cursor.execute('''
-            SELECT DISTINCT DATE(scheduled_at) as game_date
+            SELECT DISTINCT game_date
             FROM all_props
-            WHERE scheduled_at IS NOT NULL
+            WHERE game_date IS NOT NULL
             ORDER BY game_date
         ''')
 
@@ -401,7 +401,7 @@ class PaperTrader:
                 ap.stat_name as stat_type,
                 ap.stat_value as line,
                 ap.source as sportsbook,
-                DATE(ap.scheduled_at) as game_date,
+                ap.game_date,
                 ap.american_odds as over_odds,
                 NULL as under_odds,
                 -- Map team names to abbreviations using teams table
@@ -411,7 +411,7 @@ class PaperTrader:
             LEFT JOIN teams pt ON LOWER(pt.full_name) = LOWER(ap.team_name)
             LEFT JOIN teams ot ON LOWER(ot.full_name) = LOWER(ap.opponent_name)
             WHERE ap.stat_name = ?
-            AND DATE(ap.scheduled_at) = ?
+            AND ap.game_date = ?
             AND ap.choice = 'over'
         )
         SELECT DISTINCT
@@ -3,7 +3,7 @@ from typing import Optional
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class GameLog:
     """A player's performance in one game."""
     player_id: int
@@ -58,7 +58,7 @@ class GameLog:
         return self.points + self.rebounds + self.assists
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """A scheduled or completed game."""
     game_id: str
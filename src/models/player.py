@@ -3,7 +3,7 @@ from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     """Complete player season statistics."""
     player_id: int
@@ -9,6 +9,7 @@ import requests
 import sqlite3
 import time
 import os
+from contextlib import closing
 from datetime import datetime, timezone
 from typing import List, Dict, Tuple
 
@@ -293,6 +294,39 @@ class PrizePicksScraper:
 
         return parsed_props
 
+    def _validate_prop(self, prop: Dict) -> bool:
+        """
+        Validate a parsed prop before database insertion.
+
+        Args:
+            prop: Prop dictionary from parse_projections
+
+        Returns:
+            True if valid, False otherwise
+        """
+        # Required (NOT NULL) fields for a valid prop
+        for field in ('full_name', 'stat_name', 'stat_value', 'choice'):
+            value = prop.get(field)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                logger.debug("Missing required field %s for prop", field)
+                return False
+
+        # Validate stat_value is a valid, non-negative number
+        try:
+            stat_value = float(prop['stat_value'])
+        except (TypeError, ValueError):
+            logger.debug("Cannot convert stat_value to float: %s", prop.get('stat_value'))
+            return False
+        if not stat_value >= 0:
+            logger.debug("Invalid stat_value %s for prop", stat_value)
+            return False
+
+        if prop['choice'] not in ('over', 'under'):
+            logger.debug("Invalid choice value: %s", prop['choice'])
+            return False
+
+        return True
+
     def scrape(self, db_path: str = None) -> List[Dict]:
         from src.config import get_db_path
         if db_path is None:
@@ -314,57 +348,31 @@ class PrizePicksScraper:
             return []
 
         # Initialize database (creates table if not exists)
-        from src.db.init_db import init_database
+        from src.db.init_db import init_database, insert_many
         init_database(db_path)
 
         # Add timestamps
         scraped_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         updated_at = scraped_at
 
+        # Drop props that would violate all_props constraints, so one bad
+        # prop can't abort the whole batch
+        valid_props = [prop for prop in props if self._validate_prop(prop)]
+        skipped = len(props) - len(valid_props)
+        if skipped > 0:
+            logger.info("Skipped %d invalid props", skipped)
+
         # Save to SQLite
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        with closing(sqlite3.connect(db_path)) as conn:
+            cursor = conn.cursor()
 
-        # Get counts before insert
-        cursor.execute('SELECT COUNT(*) FROM prizepicks_props')
-        pp_count_before = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('prizepicks',))
-        all_count_before = cursor.fetchone()[0]
+            # Get counts before insert
+            cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('prizepicks',))
+            all_count_before = cursor.fetchone()[0]
 
-        # Insert props into both tables
-        for prop in props:
-            try:
-                # Insert into prizepicks_props (source-specific table)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO prizepicks_props (
-                        full_name, team_name, opponent_name, position_name,
-                        stat_name, stat_value, choice, prop_type,
-                        game_id, scheduled_at, updated_at, scraped_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    prop['full_name'],
-                    prop.get('team_name'),
-                    prop.get('opponent_name'),
-                    prop.get('position_name'),
-                    prop['stat_name'],
-                    prop['stat_value'],
-                    prop['choice'],
-                    prop.get('prop_type'),
-                    prop.get('game_id'),
-                    prop.get('scheduled_at'),
-                    updated_at,
-                    scraped_at
-                ))
-
-                # Insert into all_props (unified table for ML)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO all_props (
-                        source, full_name, team_name, opponent_name, position_name,
-                        stat_name, stat_value, choice,
-                        american_odds, decimal_odds,
-                        game_id, scheduled_at, updated_at, scraped_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            # Insert props into all_props (prizepicks_props is a view over it)
+            rows = [
+                (
                     'prizepicks',
                     prop['full_name'],
                     prop.get('team_name'),
@@ -373,30 +381,31 @@ class PrizePicksScraper:
                     prop['stat_name'],
                     prop['stat_value'],
                     prop['choice'],
+                    prop.get('prop_type'),
                     None,  # PrizePicks doesn't provide odds
                     None,
                     prop.get('game_id'),
                     prop.get('scheduled_at'),
                     updated_at,
                     scraped_at
-                ))
-            except Exception as e:
-                logger.warning("Error inserting prop: %s", e)
-                continue
-
-        conn.commit()
-
-        # Get counts after insert
-        cursor.execute('SELECT COUNT(*) FROM prizepicks_props')
-        pp_count_after = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('prizepicks',))
-        all_count_after = cursor.fetchone()[0]
-        conn.close()
+                )
+                for prop in valid_props
+            ]
+            insert_many(conn, '''
+                INSERT OR REPLACE INTO all_props (
+                    source, full_name, team_name, opponent_name, position_name,
+                    stat_name, stat_value, choice, prop_type,
+                    american_odds, decimal_odds,
+                    game_id, scheduled_at, updated_at, scraped_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+            # Get counts after insert
+            cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('prizepicks',))
+            all_count_after = cursor.fetchone()[0]
 
-        pp_new = pp_count_after - pp_count_before
         all_new = all_count_after - all_count_before
-        logger.info("prizepicks_props: +%d (total: %d)", pp_new, pp_count_after)
-        logger.info("all_props: +%d (total: %d)", all_new, all_count_after)
+        logger.info("all_props (prizepicks): +%d (total: %d)", all_new, all_count_after)
 
         return props
 
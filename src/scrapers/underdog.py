@@ -291,6 +291,7 @@ class UnderdogScraper:
         if db_path is None:
             db_path = get_db_path()
         import sqlite3
+        from contextlib import closing
         from datetime import datetime, timezone
 
         all_pickem_data = self.fetch_data()
@@ -303,65 +304,30 @@ class UnderdogScraper:
         self.underdog_props['scraped_at'] = scraped_at
 
         # Initialize database (creates table if not exists)
-        from src.db.init_db import init_database
+        from src.db.init_db import init_database, insert_many
         init_database(db_path)
 
         # Save to SQLite
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Get count before insert
-        cursor.execute('SELECT COUNT(*) FROM underdog_props')
-        count_before = cursor.fetchone()[0]
-
-        # Get all_props count before insert
-        cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('underdog',))
-        all_count_before = cursor.fetchone()[0]
-
-        # Insert or update rows (unique index on full_name, stat_name, stat_value, choice, game_date)
-        inserted = 0
-        skipped = 0
-        for _, row in self.underdog_props.iterrows():
-            # Validate prop before insertion
-            if not self._validate_prop(row):
-                skipped += 1
-                continue
-
-            # Normalize stat_name to lowercase for consistency
-            stat_name_normalized = row['stat_name'].lower().replace(' ', '_') if row['stat_name'] else row['stat_name']
-
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO underdog_props (
-                        full_name, team_name, opponent_name, position_name,
-                        stat_name, stat_value, choice,
-                        american_price, decimal_price,
-                        scheduled_at, updated_at, scraped_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row['full_name'],
-                    row.get('team_name'),
-                    row.get('opponent_name'),
-                    row.get('position_name'),
-                    row['stat_name'],
-                    row['stat_value'],
-                    row['choice'],
-                    row.get('american_price'),
-                    row.get('decimal_price'),
-                    row.get('scheduled_at'),
-                    row['updated_at'],
-                    row['scraped_at']
-                ))
+        with closing(sqlite3.connect(db_path)) as conn:
+            cursor = conn.cursor()
+
+            # Get all_props count before insert
+            cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('underdog',))
+            all_count_before = cursor.fetchone()[0]
+
+            # Insert or update rows (unique index on full_name, stat_name, stat_value, choice, game_date)
+            rows = []
+            skipped = 0
+            for _, row in self.underdog_props.iterrows():
+                # Validate prop before insertion
+                if not self._validate_prop(row):
+                    skipped += 1
+                    continue
+
+                # Normalize stat_name to lowercase for consistency
+                stat_name_normalized = row['stat_name'].lower().replace(' ', '_') if row['stat_name'] else row['stat_name']
 
-                # Also insert into unified all_props table for ML
-                cursor.execute('''
-                    INSERT OR REPLACE INTO all_props (
-                        source, full_name, team_name, opponent_name, position_name,
-                        stat_name, stat_value, choice,
-                        american_odds, decimal_odds,
-                        game_id, scheduled_at, updated_at, scraped_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     'underdog',
                     row['full_name'],
                     row.get('team_name'),
@@ -377,27 +343,26 @@ class UnderdogScraper:
                     row['updated_at'],
                     row['scraped_at']
                 ))
-                inserted += 1
-            except Exception as e:
-                logger.warning("Error inserting prop for %s: %s", row.get('full_name'), e)
-                skipped += 1
 
-        if skipped > 0:
-            logger.info("Skipped %d invalid props", skipped)
+            # Unified all_props table (underdog_props is a view over it)
+            insert_many(conn, '''
+                INSERT OR REPLACE INTO all_props (
+                    source, full_name, team_name, opponent_name, position_name,
+                    stat_name, stat_value, choice,
+                    american_odds, decimal_odds,
+                    game_id, scheduled_at, updated_at, scraped_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
 
-        conn.commit()
+            if skipped > 0:
+                logger.info("Skipped %d invalid props", skipped)
 
-        # Get counts after insert
-        cursor.execute('SELECT COUNT(*) FROM underdog_props')
-        count_after = cursor.fetchone()[0]
-        cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('underdog',))
-        all_count_after = cursor.fetchone()[0]
-        conn.close()
+            # Get counts after insert
+            cursor.execute('SELECT COUNT(*) FROM all_props WHERE source = ?', ('underdog',))
+            all_count_after = cursor.fetchone()[0]
 
-        new_rows = count_after - count_before
         all_new = all_count_after - all_count_before
-        logger.info("underdog_props: +%d (total: %d)", new_rows, count_after)
-        logger.info("all_props: +%d (total: %d)", all_new, all_count_after)
+        logger.info("all_props (underdog): +%d (total: %d)", all_new, all_count_after)
 
 # Usage example:
 if __name__ == "__main__":
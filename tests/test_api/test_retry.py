@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-from src.api.retry import RetryStrategy, ThrottleDetector, with_retry
+from src.api.retry import RetryStrategy, ThrottleDetector, TokenBucket, with_retry
 
 
 # RetryStrategy._calculate_delay
@@ -226,3 +226,33 @@ class TestThrottleDetector:
         assert throttle.record_failure() == 120.0  # escalation 2
         throttle.record_success()
         assert throttle.record_failure() == 60.0   # reset to escalation 1
+
+
+class TestTokenBucket:
+    def test_burst_up_to_capacity_without_waiting(self):
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        with patch('src.api.retry.threading.Condition.wait') as mock_wait:
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+        mock_wait.assert_not_called()
+
+    def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        clock = iter([0.0, 0.0, 1.0])
+        with patch('src.api.retry.time.monotonic', side_effect=lambda: next(clock)):
+            bucket._updated = 0.0
+            with patch('src.api.retry.threading.Condition.wait') as mock_wait:
+                bucket.acquire()  # takes the initial token
+                bucket.acquire()  # empty: waits ~1s, then refills
+        mock_wait.assert_called_once_with(1.0)
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket.from_delay(0)
+        for _ in range(100):
+            bucket.acquire()
+
+    def test_from_delay_rate(self):
+        bucket = TokenBucket.from_delay(0.5, capacity=2)
+        assert bucket.rate == 2.0
+        assert bucket.capacity == 2
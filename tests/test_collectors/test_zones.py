@@ -0,0 +1,302 @@
+"""Tests for zone collectors."""
+
+import pytest
+import pandas as pd
+from src.api.retry import RetryStrategy
+from src.collectors.zones import ShootingZoneCollector, AssistZoneCollector, ASSIST_EVENT_COLUMNS
+
+
+@pytest.fixture(autouse=True)
+def clear_assist_events_cache():
+    """Keep the shared play-by-play cache from leaking between tests."""
+    AssistZoneCollector.clear_events_cache()
+    yield
+    AssistZoneCollector.clear_events_cache()
+
+
+class TestShootingZoneTransform:
+    """Tests for ShootingZoneCollector._transform_to_zones."""
+
+    def test_transform_skips_backcourt(self, mock_api):
+        """Test that rows are mapped to zones and backcourt heaves are dropped."""
+        collector = ShootingZoneCollector(repository=None, api_client=mock_api, season="2025-26")
+        df = pd.DataFrame([
+            {'GROUP_VALUE': 'Restricted Area', 'FGM': 5.0, 'FGA': 8.0},
+            {'GROUP_VALUE': 'Backcourt', 'FGM': 0.0, 'FGA': 1.0},
+            {'GROUP_VALUE': 'Mid-Range', 'FGM': 2.0, 'FGA': 6.0},
+        ])
+
+        zones = collector._transform_to_zones(df)
+
+        assert [z.zone_name for z in zones] == ['Restricted Area', 'Mid-Range']
+        assert zones[0].fgm == 5 and zones[0].fga == 8
+        assert isinstance(zones[1].fga, int)
+
+    def test_collect_saves_zones_in_bulk(self, mock_api, test_db):
+        """Test that collected zones are written from column arrays with percentages."""
+        import sqlite3
+        from src.db.zones import SQLiteZoneRepository
+
+        repository = SQLiteZoneRepository(test_db)
+        mock_api.set_response("shooting_2544_2025-26", pd.DataFrame([
+            {'GROUP_VALUE': 'Restricted Area', 'FGM': 5.0, 'FGA': 8.0},
+            {'GROUP_VALUE': 'Backcourt', 'FGM': 0.0, 'FGA': 1.0},
+            {'GROUP_VALUE': 'Above the Break 3', 'FGM': 2.0, 'FGA': 4.0},
+            {'GROUP_VALUE': 'Mid-Range', 'FGM': 0.0, 'FGA': 0.0},
+        ]))
+        collector = ShootingZoneCollector(repository=repository, api_client=mock_api, season="2025-26")
+
+        result = collector.collect(2544)
+
+        assert result.is_success
+        assert [z.zone_name for z in result.data] == ['Restricted Area', 'Above the Break 3', 'Mid-Range']
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute(
+            "SELECT zone_name, fgm, fga, fg_pct, efg_pct FROM player_shooting_zones ORDER BY zone_name"
+        ).fetchall()
+        conn.close()
+        assert rows == [
+            ('Above the Break 3', 2, 4, 50.0, 75.0),
+            ('Mid-Range', 0, 0, 0.0, 0.0),
+            ('Restricted Area', 5, 8, 62.5, 62.5),
+        ]
+
+
+class TestAssistPattern:
+    """Tests for AssistZoneCollector.ASSIST_PATTERN."""
+
+    @pytest.mark.parametrize("description,shooter,distance,shot_type,passer", [
+        ("Ayton 3' Dunk (6 PTS) (L. James 1 AST)", "Ayton", "3", "Dunk", "L. James"),
+        ("Ayton Alley Oop Dunk (10 PTS) (L. James 3 AST)", "Ayton", None, "Alley Oop Dunk", "L. James"),
+        ("O'Neale 25' 3PT Pullup Jump Shot (3 PTS) (Booker 1 AST)",
+         "O'Neale", "25", "3PT Pullup Jump Shot", "Booker"),
+        ("Jokić 26' 3PT Jump Shot (12 PTS) (Murray 2 AST)", "Jokić", "26", "3PT Jump Shot", "Murray"),
+        ("Porter Jr. 1' Layup (2 PTS) (Jokić 5 AST)", "Porter", None, "Jr. 1' Layup", "Jokić"),
+        ("Gilgeous-Alexander 14' Step Back Jump Shot (21 PTS) (Williams 3 AST)",
+         "Gilgeous-Alexander", "14", "Step Back Jump Shot", "Williams"),
+    ])
+    def test_matches_assisted_shots(self, description, shooter, distance, shot_type, passer):
+        """Test that assisted made shots are parsed into named groups."""
+        match = AssistZoneCollector.ASSIST_PATTERN.search(description)
+
+        assert match is not None
+        assert match.group('shooter') == shooter
+        assert match.group('distance') == distance
+        assert match.group('shot_type') == shot_type
+        assert match.group('passer') == passer
+
+    @pytest.mark.parametrize("description", [
+        "MISS Ayton 3' Dunk",
+        "Ayton 3' Dunk (6 PTS)",
+        "Ayton Free Throw 1 of 2 (6 PTS)",
+    ])
+    def test_rejects_unassisted_descriptions(self, description):
+        """Test that descriptions without an assist do not match."""
+        assert AssistZoneCollector.ASSIST_PATTERN.search(description) is None
+
+    def test_malformed_description_fails_fast(self):
+        """Test that a long near-miss description is rejected without heavy backtracking."""
+        import time
+
+        description = "A " * 400 + "(2 PTS) (" + "B " * 400 + "AST)"
+        start = time.perf_counter()
+        assert AssistZoneCollector.ASSIST_PATTERN.search(description) is None
+        assert time.perf_counter() - start < 1.0
+
+
+class TestParseAssistDescription:
+    """Tests for AssistZoneCollector._parse_assist_description."""
+
+    @pytest.mark.parametrize("description", [
+        "Ayton 3' Dunk (6 PTS) (L. James 1 AST)",
+        "Ayton Alley Oop Dunk (10 PTS) (L. James 3 AST)",
+        "Porter Jr. 1' Layup (2 PTS) (Jokić 5 AST)",
+        "Ayton  3' Dunk (6 PTS) (L. James 1 AST)",
+        "Ayton 3' Dunk (6 PTS)  (L. James 1 AST)",
+        "Ayton 3' Dunk (6 PTS) (L. James 1 AST) [replay]",
+        "Ayton (2 PTS) (L. James 1 AST)",
+        "Ayton 3' Dunk (6 PTS)",
+    ])
+    def test_agrees_with_pattern(self, description):
+        """Test that the string fast path and the regex fallback give the same names."""
+        match = AssistZoneCollector.ASSIST_PATTERN.search(description)
+        expected = (match.group('shooter').strip(), match.group('passer').strip()) if match else None
+
+        assert AssistZoneCollector._parse_assist_description(description) == expected
+
+
+class TestGetGameAssistEvents:
+    """Tests for AssistZoneCollector._get_game_assist_events."""
+
+    @pytest.fixture
+    def collector(self, mock_api):
+        return AssistZoneCollector(
+            repository=None,
+            api_client=mock_api,
+            season="2025-26",
+            retry_strategy=None,
+            delay=0,
+        )
+
+    @pytest.fixture
+    def sample_pbp(self):
+        return pd.DataFrame([
+            {'shotResult': 'Made', 'description': "Ayton 3' Dunk (6 PTS) (L. James 1 AST)",
+             'xLegacy': 5, 'yLegacy': 10, 'period': 1, 'teamId': 1},
+            {'shotResult': 'Missed', 'description': "MISS Ayton 3' Dunk",
+             'xLegacy': 5, 'yLegacy': 10, 'period': 1, 'teamId': 1},
+            {'shotResult': 'Made', 'description': "Reaves 25' 3PT Jump Shot (3 PTS)",
+             'xLegacy': 240, 'yLegacy': 20, 'period': 2, 'teamId': 1},
+            {'shotResult': 'Made', 'description': None,
+             'xLegacy': 0, 'yLegacy': 0, 'period': 2, 'teamId': 1},
+            {'shotResult': 'Made', 'description': "Reaves 26' 3PT Jump Shot (6 PTS) (L. James 2 AST)",
+             'xLegacy': -30, 'yLegacy': 260, 'period': 3, 'teamId': 1},
+        ])
+
+    def test_extracts_only_assisted_makes(self, collector, mock_api, sample_pbp):
+        """Test that only made shots with an assist credit are returned."""
+        mock_api.set_response("pbp_001", sample_pbp)
+
+        assists = collector._get_game_assist_events("001")
+
+        assert assists['shooter_name'].tolist() == ['Ayton', 'Reaves']
+        assert (assists['passer_name'] == 'L. James').all()
+        assert (assists['passer_name_lc'] == 'l. james').all()
+        assert assists[['x', 'y']].values.tolist() == [[5, 10], [-30, 260]]
+
+    def test_empty_play_by_play(self, collector):
+        """Test that a game without play-by-play data yields no assists."""
+        assists = collector._get_game_assist_events("missing")
+        assert assists.empty
+        assert list(assists.columns) == ASSIST_EVENT_COLUMNS
+
+    def test_every_attempt_takes_a_token(self, mock_api, sample_pbp):
+        """Test that retried play-by-play requests are rate limited like the first attempt."""
+        class CountingLimiter:
+            acquired = 0
+
+            def acquire(self):
+                self.acquired += 1
+
+        calls = []
+
+        def flaky_play_by_play(game_id):
+            calls.append(game_id)
+            if len(calls) < 3:
+                raise ConnectionError("throttled")
+            return sample_pbp
+
+        mock_api.get_play_by_play = flaky_play_by_play
+        limiter = CountingLimiter()
+        collector = AssistZoneCollector(
+            repository=None,
+            api_client=mock_api,
+            season="2025-26",
+            retry_strategy=RetryStrategy(max_retries=3, base_delay=0),
+            rate_limiter=limiter,
+        )
+
+        collector._fetch_game_assist_events("001")
+
+        assert len(calls) == 3
+        assert limiter.acquired == 3
+
+    def test_aggregate_skips_ambiguous_last_name(self, collector):
+        """Test that a bare last name shared with another passer format is not credited."""
+        assists = pd.DataFrame([
+            ('G1', 'A', 'L. James', 'l. james', 0, 10, 1, 1, ''),
+            ('G1', 'B', 'James', 'james', 0, 260, 1, 1, ''),
+            ('G1', 'C', 'B. James', 'b. james', 0, 10, 1, 2, ''),
+        ], columns=ASSIST_EVENT_COLUMNS)
+
+        zone_stats = collector._aggregate_assists_by_zone(2544, 'LeBron James', assists, team_id=1)
+
+        assert zone_stats == {'Restricted Area': {'assists': 1, 'ast_fgm': 1, 'ast_fga': 0}}
+
+    def test_aggregate_uses_team_to_resolve_last_name(self, collector):
+        """Test that bare last names on several teams are credited only for the player's team."""
+        assists = pd.DataFrame([
+            ('G1', 'A', 'James', 'james', 0, 10, 1, 1, ''),
+            ('G1', 'B', 'James', 'james', 0, 260, 1, 2, ''),
+        ], columns=ASSIST_EVENT_COLUMNS)
+
+        zone_stats = collector._aggregate_assists_by_zone(2544, 'LeBron James', assists, team_id=1)
+
+        assert zone_stats == {'Restricted Area': {'assists': 1, 'ast_fgm': 1, 'ast_fga': 0}}
+
+
+class TestAssistZoneCollect:
+    """Tests for AssistZoneCollector.collect."""
+
+    @pytest.fixture
+    def repository(self, test_db):
+        import sqlite3
+        from src.db.zones import SQLiteZoneRepository
+
+        # Checkpoint table is managed outside init_database
+        conn = sqlite3.connect(test_db)
+        conn.execute("""
+            CREATE TABLE assist_zones_checkpoint (
+                player_id INTEGER, season TEXT, game_id TEXT, game_date TEXT,
+                status TEXT, assists_found INTEGER, completed_at TIMESTAMP,
+                UNIQUE(player_id, season, game_id)
+            )
+        """)
+        conn.commit()
+        conn.close()
+        return SQLiteZoneRepository(test_db)
+
+    def test_collect_processes_new_games(self, mock_api, repository):
+        """Test that play-by-play for every new game is aggregated and checkpointed."""
+
+        mock_api.set_response("gamelogs_2544_2025-26", pd.DataFrame([
+            {'Game_ID': 'G1', 'GAME_DATE': 'OCT 22, 2025', 'AST': 2},
+            {'Game_ID': 'G2', 'GAME_DATE': 'OCT 24, 2025', 'AST': 1},
+            {'Game_ID': 'G3', 'GAME_DATE': 'OCT 26, 2025', 'AST': 0},
+        ]))
+        mock_api.set_response("pbp_G1", pd.DataFrame([
+            {'shotResult': 'Made', 'description': "Ayton 1' Dunk (2 PTS) (L. James 1 AST)",
+             'xLegacy': 0, 'yLegacy': 10, 'period': 1, 'teamId': 1},
+            {'shotResult': 'Made', 'description': "Reaves 25' 3PT Jump Shot (3 PTS) (L. James 2 AST)",
+             'xLegacy': 0, 'yLegacy': 250, 'period': 2, 'teamId': 1},
+        ]))
+        mock_api.set_response("pbp_G2", pd.DataFrame([
+            {'shotResult': 'Made', 'description': "Ayton 2' Layup (4 PTS) (L. James 3 AST)",
+             'xLegacy': 5, 'yLegacy': 5, 'period': 1, 'teamId': 1},
+        ]))
+
+        collector = AssistZoneCollector(
+            repository=repository, api_client=mock_api, season="2025-26", delay=0, max_workers=4
+        )
+        result = collector.collect(2544, player_name="LeBron James", team_id=1)
+
+        assert result.is_success
+        assert result.data == {'games_processed': 2, 'assists_added': 3}
+        assert repository.get_completed_game_ids(2544, "2025-26") == {'G1', 'G2', 'G3'}
+        zones = {z.zone_name: z.ast for z in repository.get_assist_zones(2544, "2025-26")}
+        assert zones == {'Restricted Area': 2.0, 'Above the Break 3': 1.0}
+
+    def test_teammates_share_play_by_play(self, mock_api, repository):
+        """Test that a second player in the same game reuses the parsed play-by-play."""
+        mock_api.set_response("gamelogs_1_2025-26", pd.DataFrame([
+            {'Game_ID': 'G1', 'GAME_DATE': 'OCT 22, 2025', 'AST': 1},
+        ]))
+        mock_api.set_response("gamelogs_2_2025-26", pd.DataFrame([
+            {'Game_ID': 'G1', 'GAME_DATE': 'OCT 22, 2025', 'AST': 1},
+        ]))
+        mock_api.set_response("pbp_G1", pd.DataFrame([
+            {'shotResult': 'Made', 'description': "Ayton 1' Dunk (2 PTS) (L. James 1 AST)",
+             'xLegacy': 0, 'yLegacy': 10, 'period': 1, 'teamId': 1},
+            {'shotResult': 'Made', 'description': "James 1' Dunk (2 PTS) (D. Ayton 1 AST)",
+             'xLegacy': 0, 'yLegacy': 10, 'period': 1, 'teamId': 1},
+        ]))
+
+        collector = AssistZoneCollector(repository=repository, api_client=mock_api, season="2025-26", delay=0)
+        first = collector.collect(1, player_name="LeBron James")
+        calls_after_first = mock_api.call_count
+        second = collector.collect(2, player_name="Deandre Ayton")
+
+        assert first.data['assists_added'] == 1
+        assert second.data['assists_added'] == 1
+        # Only the second player's game log is fetched; play-by-play comes from cache
+        assert mock_api.call_count == calls_after_first + 1
@@ -0,0 +1,172 @@
+"""Tests for game and game log repositories."""
+
+import sqlite3
+from datetime import date
+
+import pytest
+from src.db.game import SQLiteGameRepository, SQLiteGameLogRepository, _game_log_reader
+from src.models.game import GameLog
+
+
+def make_game_log(game_id: str, game_date: date, points: int = 20, player_id: int = 12345) -> GameLog:
+    return GameLog(
+        player_id=player_id, player_name='Test Player', game_id=game_id, game_date=game_date,
+        team_id=1610612744, team_abbr='GSW', opponent_id=0, opponent_abbr='LAL',
+        is_home=False, minutes=34.0, points=points, rebounds=5, assists=6,
+        steals=1, blocks=0, turnovers=2, fgm=8, fga=16, fg3m=3, fg3a=7, ftm=1, fta=2,
+    )
+
+
+class TestSQLiteGameLogRepository:
+    """Tests for SQLiteGameLogRepository."""
+
+    def test_save_many_persists_all_logs(self, test_db):
+        """Test that a batch save writes every log."""
+        repository = SQLiteGameLogRepository(test_db)
+        logs = [make_game_log(f'00224000{i:02d}', date(2024, 12, i + 1)) for i in range(10)]
+
+        repository.save_many(logs)
+
+        conn = sqlite3.connect(test_db)
+        count = conn.execute("SELECT COUNT(*) FROM player_game_logs").fetchone()[0]
+        conn.close()
+        assert count == 10
+
+    def test_get_all_reads_across_fetch_batches(self, test_db, monkeypatch):
+        """Test that results spanning several fetchmany batches are all returned in order."""
+        monkeypatch.setattr('src.db.game._FETCH_BATCH_SIZE', 3)
+        repository = SQLiteGameLogRepository(test_db)
+        repository.save_many([make_game_log(f'00224000{i:02d}', date(2024, 12, i + 1)) for i in range(10)])
+
+        logs = repository.get_all()
+
+        assert [log.game_date.day for log in logs] == list(range(10, 0, -1))
+        repository.close()
+
+    def test_save_many_replaces_existing(self, test_db):
+        """Test that re-saving a game log replaces it instead of duplicating."""
+        repository = SQLiteGameLogRepository(test_db)
+        repository.save(make_game_log('0022400001', date(2024, 12, 20), points=20))
+
+        repository.save_many([make_game_log('0022400001', date(2024, 12, 20), points=31)])
+
+        logs = repository.get_by_player(12345)
+        assert len(logs) == 1
+        assert logs[0].points == 31
+
+    def test_get_by_players_groups_by_player(self, test_db, monkeypatch):
+        """Test that a bulk read returns each player's logs, chunking large ID lists."""
+        monkeypatch.setattr('src.db.game._MAX_IN_PARAMS', 2)
+        repository = SQLiteGameLogRepository(test_db)
+        repository.save_many([
+            make_game_log('0022400001', date(2024, 12, 1), player_id=1),
+            make_game_log('0022400002', date(2024, 12, 5), player_id=1),
+            make_game_log('0022400001', date(2024, 12, 1), player_id=2),
+            make_game_log('0022400003', date(2024, 12, 8), player_id=3),
+        ])
+
+        logs = repository.get_by_players([1, 2, 3, 4], since=date(2024, 12, 2))
+
+        assert {pid: [log.game_id for log in player_logs] for pid, player_logs in logs.items()} == {
+            1: ['0022400002'],
+            3: ['0022400003'],
+        }
+        assert repository.get_by_players([]) == {}
+        repository.close()
+
+    def test_save_many_empty(self, test_db):
+        """Test that an empty batch is a no-op."""
+        SQLiteGameLogRepository(test_db).save_many([])
+
+    def test_connection_reused_until_close(self, test_db):
+        """Test that repository calls share one connection per thread."""
+        repository = SQLiteGameLogRepository(test_db)
+        first = repository._get_connection()
+        repository.get_by_player(12345)
+
+        assert repository._get_connection() is first
+
+        repository.close()
+        assert repository._get_connection() is not first
+        repository.close()
+
+    def test_fields_mapped_from_schema_columns(self, test_db):
+        """Test that rows read back through the column-layout reader keep every field."""
+        repository = SQLiteGameLogRepository(test_db)
+        repository.save(make_game_log('0022400001', date(2024, 12, 20), points=27))
+
+        log = repository.get_by_player_and_date(12345, date(2024, 12, 20))
+
+        assert log.game_id == '0022400001'
+        assert log.game_date == date(2024, 12, 20)
+        assert log.opponent_abbr == 'LAL'
+        assert log.is_home is False
+        assert (log.minutes, log.points, log.rebounds, log.assists) == (34.0, 27, 5, 6)
+        assert (log.fgm, log.fga, log.fg3m, log.fg3a, log.ftm, log.fta) == (8, 16, 3, 7, 1, 2)
+        repository.close()
+
+    def test_reader_accepts_legacy_column_names(self):
+        """Test that the reader falls back to long stat column names."""
+        columns = ('player_id', 'game_id', 'game_date', 'team_id', 'minutes', 'points',
+                   'rebounds', 'assists', 'fgm', 'fga', 'fg3m', 'fg3a', 'ftm', 'fta')
+        row = (1, 'G1', '2024-12-20', 10, 30.5, 18, 4, None, 7, 15, 2, 5, 2, 2)
+
+        log = _game_log_reader(columns)(row)
+
+        assert (log.minutes, log.points, log.rebounds, log.assists) == (30.5, 18, 4, 0)
+        assert (log.steals, log.opponent_id, log.player_name) == (0, 0, '')
+
+
+class TestSQLiteGameRepository:
+    """Tests for SQLiteGameRepository."""
+
+    def test_get_by_id_reads_schedule_row(self, test_db):
+        """Test that schedule rows missing optional columns use defaults."""
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            "INSERT INTO schedule (game_id, game_date, home_team_id, away_team_id, home_score, away_score) "
+            "VALUES ('0022400001', '2024-12-20', 1, 2, 110, 104)"
+        )
+        conn.commit()
+        conn.close()
+        repository = SQLiteGameRepository(test_db)
+
+        game = repository.get_by_id('0022400001')
+
+        assert game.game_date == date(2024, 12, 20)
+        assert (game.home_score, game.away_score) == (110, 104)
+        assert game.status == 'scheduled'
+        assert repository.get_by_id('missing') is None
+        repository.close()
+
+
+def test_game_models_use_slots():
+    """Test that hot read models carry no per-instance __dict__."""
+    log = make_game_log('0022400001', date(2024, 12, 20))
+    assert not hasattr(log, '__dict__')
+    with pytest.raises(AttributeError):
+        log.unknown_field = 1
+
+
+@pytest.mark.parametrize("sql,params,index", [
+    ("SELECT * FROM player_game_logs WHERE player_id = ? ORDER BY game_date DESC LIMIT 10",
+     (1,), 'idx_game_logs_covering'),
+    ("SELECT * FROM player_game_logs WHERE player_id = ? AND opponent_abbr = ?",
+     (1, 'LAL'), 'idx_game_logs_player_opponent'),
+    ("SELECT * FROM schedule WHERE home_team_id = ? OR away_team_id = ? ORDER BY game_date DESC",
+     (1, 1), 'idx_schedule_home_team_id'),
+])
+def test_hot_reads_use_indexes(test_db, sql, params, index):
+    """Test that repository read paths are served by an index rather than a table scan."""
+    conn = sqlite3.connect(test_db)
+    plan = ' '.join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+    conn.close()
+    assert index in plan
+
+
+def test_repository_connections_are_memory_mapped(test_db):
+    """Test that long-lived repository connections read through a memory map."""
+    repository = SQLiteGameLogRepository(test_db)
+    mmap_size = repository._get_connection().execute("PRAGMA mmap_size").fetchone()[0]
+    repository.close()
+    assert mmap_size == 268435456
@@ -0,0 +1,441 @@
+"""Tests for database initialization."""
+
+import sqlite3
+
+import pytest
+
+from src.db.init_db import bulk_insert, init_database, insert_many, vacuum_and_analyze
+
+
+def table_names(db_path: str) -> set:
+    conn = sqlite3.connect(db_path)
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    conn.close()
+    return names
+
+
+class TestInitDatabase:
+    """Tests for init_database."""
+
+    def test_creates_schema(self, test_db):
+        """Test that the core tables are created."""
+        assert {
+            'player_stats', 'player_game_logs', 'player_shooting_zones', 'teams',
+            'schedule', 'all_props', 'prop_outcomes', 'player_rolling_stats',
+        } <= table_names(test_db)
+
+    def test_is_idempotent(self, test_db):
+        """Test that re-running on an existing database keeps its data."""
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            "INSERT INTO player_stats (player_id, player_name, season) VALUES (1, 'Test Player', '2025-26')"
+        )
+        conn.commit()
+        conn.close()
+
+        init_database(test_db)
+
+        conn = sqlite3.connect(test_db)
+        assert conn.execute("SELECT COUNT(*) FROM player_stats").fetchone()[0] == 1
+        conn.close()
+
+    def test_enables_wal(self, test_db):
+        """Test that the database is switched to WAL journaling."""
+        conn = sqlite3.connect(test_db)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        conn.close()
+
+    def test_composite_indexes_serve_range_queries(self, test_db):
+        """Test that season and player/stat lookups seek on composite indexes."""
+        conn = sqlite3.connect(test_db)
+        queries = {
+            "SELECT * FROM player_game_logs WHERE season = ? AND player_id > ?":
+                'idx_game_logs_season_player',
+            "SELECT * FROM player_game_logs WHERE player_id = ? AND season = ?":
+                'idx_game_logs_player_season_date',
+            "SELECT * FROM player_rolling_stats WHERE season = ? AND game_date >= ?":
+                'idx_rolling_season_date',
+            "SELECT * FROM all_props WHERE full_name = ? AND stat_name = ?":
+                'idx_all_props_player_stat',
+        }
+        for sql, index in queries.items():
+            plan = ' '.join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", ('a', 'b')))
+            assert index in plan, plan
+        conn.close()
+
+    def test_surrogate_ids_are_plain_rowids(self, test_db):
+        """Test that surrogate-id tables do not use AUTOINCREMENT bookkeeping."""
+        conn = sqlite3.connect(test_db)
+        conn.execute("""
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, updated_at, scraped_at)
+            VALUES ('underdog', 'Test Player', 'points', 20.5, 'over', 'now', 'now')
+        """)
+        conn.commit()
+        has_sequence = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'"
+        ).fetchone()
+        conn.close()
+        assert has_sequence is None
+
+    def test_prefix_lookups_use_wider_indexes(self, test_db):
+        """Test that single-column lookups are served without dedicated prefix indexes."""
+        conn = sqlite3.connect(test_db)
+        for sql in (
+            "SELECT id FROM underdog_props WHERE full_name = ?",
+            "SELECT id FROM prizepicks_props WHERE full_name = ?",
+            "SELECT id FROM all_props WHERE full_name = ?",
+            "SELECT COUNT(*) FROM all_props WHERE source = ?",
+        ):
+            plan = ' '.join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", ('a',)))
+            assert 'INDEX' in plan, plan
+        conn.close()
+
+    def test_all_props_game_date_column(self, test_db):
+        """Test that game_date is derived from scheduled_at and indexed."""
+        conn = sqlite3.connect(test_db)
+        conn.execute("""
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, scheduled_at,
+                                   updated_at, scraped_at)
+            VALUES ('underdog', 'Test Player', 'points', 20.5, 'over', '2024-12-20T03:00:00Z', 'now', 'now')
+        """)
+        assert conn.execute("SELECT game_date FROM all_props").fetchone()[0] == '2024-12-20'
+        plan = ' '.join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM all_props WHERE game_date = ?", ('2024-12-20',)
+        ))
+        assert 'idx_all_props_date' in plan
+        conn.close()
+
+    def test_adds_game_date_to_existing_all_props(self, tmp_path):
+        """Test that an all_props table from an older schema gains the game_date column."""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE all_props (
+                id INTEGER PRIMARY KEY, source TEXT NOT NULL, full_name TEXT NOT NULL,
+                team_name TEXT, opponent_name TEXT, position_name TEXT,
+                stat_name TEXT NOT NULL, stat_value REAL NOT NULL, choice TEXT NOT NULL,
+                american_odds INTEGER, decimal_odds REAL, game_id TEXT, scheduled_at TEXT,
+                updated_at TEXT NOT NULL, scraped_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX idx_all_props_game_date ON all_props(DATE(scheduled_at))")
+        conn.commit()
+        conn.close()
+
+        init_database(db_path)
+
+        conn = sqlite3.connect(db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(all_props)")}
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(all_props)")}
+        conn.close()
+        assert 'game_date' in columns
+        assert 'idx_all_props_date' in indexes
+        assert 'idx_all_props_game_date' not in indexes
+
+    def test_replaces_legacy_props_tables_with_views(self, tmp_path):
+        """Test that per-source props tables from an older schema are folded into all_props."""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE all_props (
+                id INTEGER PRIMARY KEY, source TEXT NOT NULL, full_name TEXT NOT NULL,
+                team_name TEXT, opponent_name TEXT, position_name TEXT,
+                stat_name TEXT NOT NULL, stat_value REAL NOT NULL, choice TEXT NOT NULL,
+                american_odds INTEGER, decimal_odds REAL, game_id TEXT, scheduled_at TEXT,
+                updated_at TEXT NOT NULL, scraped_at TEXT NOT NULL
+            );
+            CREATE TABLE underdog_props (
+                id INTEGER PRIMARY KEY, full_name TEXT NOT NULL, team_name TEXT,
+                opponent_name TEXT, position_name TEXT, stat_name TEXT NOT NULL,
+                stat_value REAL NOT NULL, choice TEXT NOT NULL, american_price INTEGER,
+                decimal_price REAL, scheduled_at TEXT, updated_at TEXT NOT NULL, scraped_at TEXT NOT NULL
+            );
+            CREATE TABLE prizepicks_props (
+                id INTEGER PRIMARY KEY, full_name TEXT NOT NULL, team_name TEXT,
+                opponent_name TEXT, position_name TEXT, stat_name TEXT NOT NULL,
+                stat_value REAL NOT NULL, choice TEXT NOT NULL, prop_type TEXT, game_id TEXT,
+                scheduled_at TEXT, updated_at TEXT NOT NULL, scraped_at TEXT NOT NULL
+            );
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, american_odds,
+                                   scheduled_at, updated_at, scraped_at)
+            VALUES ('underdog', 'Test Player', 'points', 20.5, 'over', -115, NULL, 'u1', 's1');
+            INSERT INTO underdog_props (full_name, stat_name, stat_value, choice, american_price,
+                                        scheduled_at, updated_at, scraped_at)
+            VALUES ('Test Player', 'points', 20.5, 'over', -115, NULL, 'u1', 's1'),
+                   ('Test Player', 'rebounds', 7.5, 'over', -110, NULL, 'u1', 's1');
+            INSERT INTO prizepicks_props (full_name, stat_name, stat_value, choice, prop_type,
+                                          scheduled_at, updated_at, scraped_at)
+            VALUES ('Test Player', 'points', 21.5, 'over', 'standard', NULL, 'u1', 's1');
+        """)
+        conn.close()
+
+        init_database(db_path)
+
+        conn = sqlite3.connect(db_path)
+        types = dict(conn.execute(
+            "SELECT name, type FROM sqlite_master WHERE name IN ('underdog_props', 'prizepicks_props')"
+        ))
+        underdog = conn.execute(
+            "SELECT stat_name, american_price FROM underdog_props ORDER BY stat_name"
+        ).fetchall()
+        prizepicks = conn.execute("SELECT stat_name, prop_type FROM prizepicks_props").fetchall()
+        conn.close()
+        assert types == {'underdog_props': 'view', 'prizepicks_props': 'view'}
+        # The points row was already mirrored into all_props and is not copied twice
+        assert underdog == [('points', -115), ('rebounds', -110)]
+        assert prizepicks == [('points', 'standard')]
+
+    def test_converts_legacy_defense_percentages_to_basis_points(self, tmp_path):
+        """Test that team defense percentages from an older schema are rewritten in basis points."""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE team_defensive_zones (
+                team_id INTEGER NOT NULL, season TEXT NOT NULL, zone_name TEXT NOT NULL,
+                zone_area TEXT DEFAULT '', zone_range TEXT DEFAULT '',
+                opp_fgm REAL, opp_fga REAL, opp_fg_pct REAL, opp_efg_pct REAL,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (team_id, season, zone_name)
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO team_defensive_zones (team_id, season, zone_name, opp_fgm, opp_fga, opp_fg_pct, opp_efg_pct) "
+            "VALUES (1610612744, '2024-25', ?, ?, ?, ?, ?)",
+            [('Mid-Range', 4.53, 10.0, 45.3, 45.3), ('Backcourt', 0.0, 0.0, 0.0, 0.0)]
+        )
+        conn.commit()
+        conn.close()
+
+        init_database(db_path)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT zone_name, opp_fg_pct, opp_efg_pct FROM team_defensive_zones ORDER BY zone_name"
+        ).fetchall()
+        conn.close()
+        assert rows == [('Backcourt', 0, 0), ('Mid-Range', 4530, 4530)]
+
+    def test_natural_key_tables_are_clustered(self, test_db):
+        """Test that small natural-key tables are STRICT WITHOUT ROWID tables."""
+        conn = sqlite3.connect(test_db)
+        tables = {row[1]: row for row in conn.execute("PRAGMA table_list")}
+        conn.close()
+        for table in ('player_shooting_zones', 'player_assist_zones', 'team_pace'):
+            _, _, _, _, without_rowid, strict = tables[table]
+            assert without_rowid and strict
+        assert not tables['player_game_logs'][4]
+
+    def test_initializes_injected_connection(self, tmp_path):
+        """Test that a caller's connection is initialized and left open."""
+        conn = sqlite3.connect(str(tmp_path / "injected.db"))
+
+        init_database(conn=conn)
+
+        assert conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 30
+        conn.close()
+
+    def test_failed_ddl_is_rolled_back(self, tmp_path, monkeypatch):
+        """Test that a failing statement raises and leaves no partial schema."""
+        monkeypatch.setattr(
+            'src.db.init_db._SCHEMA_SQL', "CREATE TABLE partial (id INTEGER); CREATE TABLE broken ("
+        )
+        db_path = str(tmp_path / "broken.db")
+
+        with pytest.raises(sqlite3.Error):
+            init_database(db_path)
+
+        assert 'partial' not in table_names(db_path)
+
+    def test_foreign_keys_checked_at_commit(self, test_db):
+        """Test that with enforcement on, children may precede parents within a transaction."""
+        conn = sqlite3.connect(test_db)
+        conn.execute("PRAGMA foreign_keys=ON")
+        with conn:
+            conn.execute(
+                "INSERT INTO player_shooting_zones (player_id, season, zone_name) VALUES (1, '2025-26', 'Mid-Range')"
+            )
+            conn.execute("INSERT INTO player_stats (player_id, player_name, season) VALUES (1, 'A', '2025-26')")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with conn:
+                conn.execute(
+                    "INSERT INTO player_shooting_zones (player_id, season, zone_name) VALUES (2, '2025-26', 'Mid-Range')"
+                )
+        conn.close()
+
+    def test_player_ids_stored_as_integers(self, test_db):
+        """Test that game log and rolling stat player IDs use integer storage."""
+        conn = sqlite3.connect(test_db)
+        conn.execute("INSERT INTO player_game_logs (game_id, player_id) VALUES ('0022400001', '2544')")
+        conn.execute(
+            "INSERT INTO player_rolling_stats (player_id, game_id, game_date, season) "
+            "VALUES ('2544', '0022400001', '2024-12-20', '2024-25')"
+        )
+        assert conn.execute(
+            "SELECT typeof(pgl.player_id), typeof(pgl.game_id) FROM player_game_logs pgl "
+            "JOIN player_rolling_stats prs ON prs.player_id = pgl.player_id"
+        ).fetchone() == ('integer', 'text')
+        conn.close()
+
+    def test_source_props_are_views_over_all_props(self, test_db):
+        """Test that per-source props read through to all_props with their legacy column names."""
+        conn = sqlite3.connect(test_db)
+        conn.executemany("""
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, prop_type,
+                                   american_odds, updated_at, scraped_at)
+            VALUES (?, 'Test Player', 'points', 20.5, 'over', ?, ?, 'now', 'now')
+        """, [('underdog', None, -115), ('prizepicks', 'standard', None)])
+
+        assert conn.execute("SELECT full_name, american_price FROM underdog_props").fetchall() == [
+            ('Test Player', -115)
+        ]
+        assert conn.execute("SELECT prop_type FROM prizepicks_props").fetchall() == [('standard',)]
+        conn.close()
+
+    def test_seeds_teams_once(self, test_db):
+        """Test that the 30 teams are seeded and re-running does not duplicate them."""
+        init_database(test_db)
+
+        conn = sqlite3.connect(test_db)
+        count = conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0]
+        lakers = conn.execute("SELECT full_name FROM teams WHERE abbreviation = 'LAL'").fetchone()
+        conn.close()
+        assert count == 30
+        assert lakers == ('Los Angeles Lakers',)
+
+    def test_schema_blocks_are_complete_statements(self):
+        """Test that an unterminated DDL block is rejected when the schema is built."""
+        from src.db.init_db import _join_schema
+
+        with pytest.raises(ValueError):
+            _join_schema(("CREATE TABLE a (id INTEGER);", "CREATE TABLE b (id INTEGER)"))
+
+    def test_rolling_feature_reads_are_covered(self, test_db):
+        """Test that hot rolling-stat features for a date range are read from the index alone."""
+        conn = sqlite3.connect(test_db)
+        plan = ' '.join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT game_date, l5_pts, l10_pts, l10_pts_std FROM player_rolling_stats "
+            "WHERE player_id = ? AND game_date BETWEEN ? AND ?", (1, '2024-10-01', '2025-04-30')
+        ))
+        conn.close()
+        assert 'COVERING INDEX idx_rolling_covering' in plan
+
+    def test_default_timestamps_are_epoch_integers(self, test_db):
+        """Test that default-only timestamps are stored as integer unix epochs."""
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            "INSERT INTO player_injuries (player_id, player_name, injury_status, collection_date) "
+            "VALUES (1, 'Test Player', 'Out', '2024-12-20')"
+        )
+        created_at, iso = conn.execute(
+            "SELECT typeof(created_at), datetime(created_at, 'unixepoch') FROM player_injuries"
+        ).fetchone()
+        teams_updated = conn.execute("SELECT DISTINCT typeof(last_updated) FROM teams").fetchall()
+        conn.close()
+        assert created_at == 'integer'
+        assert iso.startswith('20')
+        assert teams_updated == [('text',)]
+
+    def test_converts_epoch_team_timestamps(self, tmp_path):
+        """Test that epoch team timestamps from an older schema are converted back to text."""
+        db_path = str(tmp_path / "epoch_teams.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE teams (
+                team_id INTEGER PRIMARY KEY, name TEXT NOT NULL, full_name TEXT NOT NULL,
+                abbreviation TEXT NOT NULL, city TEXT NOT NULL, state TEXT, year_founded INTEGER,
+                last_updated INTEGER DEFAULT (unixepoch())
+            )
+        """)
+        conn.execute(
+            "INSERT INTO teams VALUES (1610612744, 'Warriors', 'Golden State Warriors', 'GSW', "
+            "'San Francisco', 'California', 1946, 1734652800)"
+        )
+        conn.commit()
+        conn.close()
+
+        init_database(db_path)
+
+        conn = sqlite3.connect(db_path)
+        gsw = conn.execute("SELECT last_updated FROM teams WHERE abbreviation = 'GSW'").fetchone()[0]
+        conn.close()
+        assert gsw == '2024-12-20 00:00:00'
+
+    def test_hot_game_log_columns_are_covered(self, test_db):
+        """Test that hot box-score columns for a player's games are read from the index alone."""
+        conn = sqlite3.connect(test_db)
+        plan = ' '.join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT game_date, min, pts, reb, ast FROM player_game_logs "
+            "WHERE player_id = ? ORDER BY game_date DESC LIMIT 10", (1,)
+        ))
+        conn.close()
+        assert 'COVERING INDEX idx_game_logs_covering' in plan
+
+    def test_skips_reinit_at_current_schema_version(self, test_db, monkeypatch):
+        """Test that the schema version is stamped and re-init at that version is a no-op."""
+        from src.db.init_db import _SCHEMA_VERSION
+
+        conn = sqlite3.connect(test_db)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+        conn.close()
+        monkeypatch.setattr('src.db.init_db._SCHEMA_SQL', "CREATE TABLE broken (")
+
+        init_database(test_db)
+
+        monkeypatch.setattr('src.db.init_db._SCHEMA_VERSION', _SCHEMA_VERSION + 1)
+        with pytest.raises(sqlite3.Error):
+            init_database(test_db)
+
+
+class TestBulkInsert:
+    """Tests for bulk_insert and insert_many."""
+
+    def test_insert_many_commits_every_batch(self, test_db):
+        """Test that rows spanning several batches are all committed."""
+        conn = sqlite3.connect(test_db)
+        rows = [(i, f'Player {i}', '2025-26') for i in range(1, 12)]
+
+        insert_many(conn, "INSERT INTO player_stats (player_id, player_name, season) VALUES (?, ?, ?)",
+                    rows, batch_size=5)
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM player_stats").fetchone()[0] == 11
+        conn.close()
+
+    def test_insert_many_is_atomic(self, test_db):
+        """Test that a failure in a later batch rolls back the earlier batches too."""
+        conn = sqlite3.connect(test_db)
+        rows = [(i, f'Player {i}', '2025-26') for i in range(1, 7)] + [(1, 'Duplicate', '2025-26')]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_many(conn, "INSERT INTO player_stats (player_id, player_name, season) VALUES (?, ?, ?)",
+                        rows, batch_size=5)
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM player_stats").fetchone()[0] == 0
+        conn.close()
+
+    def test_bulk_insert_rolls_back_on_error(self, test_db):
+        """Test that a failing block leaves none of its rows behind."""
+        conn = sqlite3.connect(test_db)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with bulk_insert(conn):
+                conn.execute("INSERT INTO player_stats (player_id, player_name, season) VALUES (1, 'A', '2025-26')")
+                conn.execute("INSERT INTO player_stats (player_id, player_name, season) VALUES (1, 'B', '2025-26')")
+
+        assert conn.execute("SELECT COUNT(*) FROM player_stats").fetchone()[0] == 0
+        conn.close()
+
+
+class TestVacuumAndAnalyze:
+    """Tests for vacuum_and_analyze."""
+
+    def test_collects_planner_statistics(self, test_db):
+        """Test that ANALYZE populates sqlite_stat1 for indexed tables."""
+        vacuum_and_analyze(test_db)
+
+        conn = sqlite3.connect(test_db)
+        analyzed = {row[0] for row in conn.execute("SELECT tbl FROM sqlite_stat1")}
+        conn.close()
+        assert 'teams' in analyzed
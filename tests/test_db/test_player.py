@@ -0,0 +1,132 @@
+"""Tests for player repositories."""
+
+import sqlite3
+
+import pytest
+
+from src.db.player import MockPlayerRepository, SQLitePlayerRepository
+from src.models.player import PlayerStats
+
+
+def make_stats(player_id: int = 2544, name: str = 'LeBron James', games_played: int = 10) -> PlayerStats:
+    return PlayerStats(
+        player_id=player_id, player_name=name, season='2025-26', games_played=games_played,
+        points=25.0, assists=8.0, rebounds=7.0,
+    )
+
+
+def test_player_stats_use_slots():
+    """Test that PlayerStats rows carry no per-instance __dict__."""
+    stats = make_stats()
+    assert not hasattr(stats, '__dict__')
+    with pytest.raises(AttributeError):
+        stats.unknown_field = 1
+
+
+class TestSQLitePlayerRepository:
+    """Tests for SQLitePlayerRepository."""
+
+    def test_reuses_one_connection_per_thread(self, test_db):
+        """Test that consecutive calls share the repository's connection."""
+        repository = SQLitePlayerRepository(test_db)
+
+        repository.save(make_stats())
+        assert repository.exists(2544)
+        assert repository.get_by_id(2544).points == 25.0
+
+        assert len(repository._connections) == 1
+        repository.close()
+
+    def test_save_preserves_existing_position(self, test_db):
+        """Test that saving without a position keeps the stored one."""
+        repository = SQLitePlayerRepository(test_db)
+        stats = make_stats()
+        stats.position = 'F'
+        repository.save(stats)
+
+        repository.save(make_stats(games_played=11))
+
+        saved = repository.get_by_id(2544)
+        assert (saved.position, saved.games_played) == ('F', 11)
+        assert repository.delete(2544)
+        assert not repository.exists(2544)
+        repository.close()
+
+    def test_save_many_writes_all_players(self, test_db):
+        """Test that a batch save writes every player in one call."""
+        repository = SQLitePlayerRepository(test_db)
+
+        repository.save_many([make_stats(player_id=i, name=f'Player {i}') for i in range(1, 6)])
+
+        assert [stats.player_id for stats in repository.get_all()] == [1, 2, 3, 4, 5]
+        assert [stats.player_id for stats in repository.iter_all()] == [1, 2, 3, 4, 5]
+        repository.close()
+
+    def test_get_by_name_prefers_prefix_match(self, test_db):
+        """Test that names starting with the query win and substrings still match."""
+        repository = SQLitePlayerRepository(test_db)
+        repository.save_many([
+            make_stats(player_id=1, name='Anthony Davis'),
+            make_stats(player_id=2, name='Davis Bertans'),
+        ])
+
+        assert repository.get_by_name('davis').player_id == 2
+        assert repository.get_by_name('Anthony D').player_id == 1
+        assert repository.get_by_name('thony').player_id == 1
+        assert repository.get_by_name('nobody') is None
+
+        plan = ' '.join(row[3] for row in repository._get_connection().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM player_stats WHERE player_name_lower >= ? AND player_name_lower < ?",
+            ('a', 'b')
+        ))
+        assert 'idx_player_name_lower' in plan
+        repository.close()
+
+    def test_needs_update_compares_games_played(self, test_db):
+        """Test single and batched checks against the stored games played."""
+        repository = SQLitePlayerRepository(test_db)
+        repository.save_many([make_stats(player_id=1, games_played=10), make_stats(player_id=2, games_played=12)])
+
+        assert repository.needs_update(1, 11)
+        assert not repository.needs_update(2, 12)
+        assert repository.needs_update(3, 0)
+        assert repository.needs_update_many({1: 11, 2: 12, 3: 0}) == {1, 3}
+        repository.close()
+
+    def test_reads_rows_missing_optional_columns(self, tmp_path):
+        """Test that a legacy table without newer columns reads with defaults."""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE player_stats (
+                player_id INTEGER PRIMARY KEY, player_name TEXT, season TEXT, games_played INTEGER,
+                points REAL, assists REAL, rebounds REAL, steals REAL, blocks REAL, turnovers REAL
+            )
+        """)
+        conn.execute("INSERT INTO player_stats VALUES (1, 'A', '2025-26', NULL, 20.0, NULL, 5.0, 1.0, 0.0, 2.0)")
+        conn.commit()
+        conn.close()
+        repository = SQLitePlayerRepository(db_path)
+
+        stats = repository.get_all()[0]
+
+        assert (stats.games_played, stats.assists, stats.points) == (0, 0.0, 20.0)
+        assert (stats.fouls, stats.pts_plus_ast, stats.position) == (0.0, None, None)
+        assert repository.get_by_id(1) == stats
+        repository.close()
+
+
+class TestMockPlayerRepository:
+    """Tests for MockPlayerRepository."""
+
+    def test_get_by_name_matches_sqlite_precedence(self):
+        """Test that the mock prefers prefix matches and forgets deleted players."""
+        repository = MockPlayerRepository()
+        repository.save(make_stats(player_id=1, name='Anthony Davis'))
+        repository.save(make_stats(player_id=2, name='Davis Bertans'))
+
+        assert repository.get_by_name('DAVIS').player_id == 2
+        assert repository.get_by_name('thony').player_id == 1
+
+        repository.delete(1)
+        assert repository.get_by_name('thony') is None
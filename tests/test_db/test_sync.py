@@ -0,0 +1,384 @@
+"""Tests for local/cloud database merging."""
+
+import gzip
+import sqlite3
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.db.init_db import init_database
+from src.db.sync import DatabaseSyncer
+
+
+@pytest.fixture
+def cloud_db(tmp_path) -> Path:
+    """A cloud copy of the database holding one game log and one prop."""
+    path = tmp_path / "cloud.db"
+    init_database(str(path))
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO player_game_logs (game_id, player_id, game_date, pts) VALUES ('0022400001', 1, '2024-12-20', 30)"
+    )
+    conn.execute("""
+        INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, scheduled_at, updated_at, scraped_at)
+        VALUES ('underdog', 'Test Player', 'points', 20.5, 'over', '2024-12-20T03:00:00Z',
+                '2024-12-19T18:00:00Z', '2024-12-19T18:00:00Z')
+    """)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def result_for(results, table):
+    return next(result for result in results if result.table == table)
+
+
+class TestMergeTables:
+    """Tests for DatabaseSyncer._merge_tables."""
+
+    def test_merges_cloud_rows(self, test_db, cloud_db):
+        """Test that cloud rows land locally and repeated merges add nothing."""
+        syncer = DatabaseSyncer(db_path=test_db)
+
+        results = syncer._merge_tables(cloud_db)
+        again = syncer._merge_tables(cloud_db)
+
+        assert result_for(results, 'player_game_logs').new_rows == 1
+        assert result_for(results, 'all_props').new_rows == 1
+        assert result_for(again, 'all_props').new_rows == 0
+        # Re-merged replace rows are overwritten, not new
+        game_logs = result_for(again, 'player_game_logs')
+        assert (game_logs.new_rows, game_logs.replaced_rows, game_logs.status) == (0, 1, 'OK')
+        conn = sqlite3.connect(test_db)
+        assert conn.execute("SELECT pts FROM player_game_logs").fetchone() == (30,)
+        conn.close()
+
+    def test_skips_unchanged_append_only_tables(self, test_db, cloud_db, monkeypatch):
+        """Test that an append-only table is only re-merged once the cloud copy grows."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer._merge_tables(cloud_db)
+        executed = []
+        monkeypatch.setattr('src.db.sync._attach_cloud', lambda conn, path: (
+            conn.set_trace_callback(executed.append),
+            conn.execute("ATTACH DATABASE ? AS cloud", (str(path),)),
+        ))
+
+        syncer._merge_tables(cloud_db)
+        assert not any('INTO main.[all_props]' in sql for sql in executed)
+        assert any('INTO main.[player_game_logs]' in sql for sql in executed)
+
+        conn = sqlite3.connect(cloud_db)
+        conn.execute("""
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, scheduled_at, updated_at, scraped_at)
+            VALUES ('underdog', 'Other Player', 'points', 10.5, 'over', '2024-12-20T03:00:00Z',
+                    '2024-12-19T19:00:00Z', '2024-12-19T19:00:00Z')
+        """)
+        conn.commit()
+        conn.close()
+
+        results = syncer._merge_tables(cloud_db)
+        assert result_for(results, 'all_props').new_rows == 1
+
+    def test_remerges_when_cloud_reuses_rowids(self, test_db, cloud_db):
+        """Test that replacing the cloud's trailing rows is noticed even with the same count and max rowid."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer._merge_tables(cloud_db)
+
+        conn = sqlite3.connect(cloud_db)
+        conn.execute("DELETE FROM all_props")
+        conn.execute("""
+            INSERT INTO all_props (source, full_name, stat_name, stat_value, choice, scheduled_at, updated_at, scraped_at)
+            VALUES ('underdog', 'Other Player', 'points', 10.5, 'over', '2024-12-20T03:00:00Z',
+                    '2024-12-19T19:00:00Z', '2024-12-19T19:00:00Z')
+        """)
+        conn.commit()
+        conn.close()
+
+        results = syncer._merge_tables(cloud_db)
+
+        assert result_for(results, 'all_props').new_rows == 1
+
+    def test_drops_checkpoints_without_stamps(self, test_db, cloud_db):
+        """Test that checkpoints saved before stamps were tracked are discarded, not misread."""
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            "CREATE TABLE sync_checkpoints (table_name TEXT PRIMARY KEY, cloud_row_count INTEGER NOT NULL, "
+            "cloud_max_rowid INTEGER)"
+        )
+        conn.execute("INSERT INTO sync_checkpoints VALUES ('all_props', 1, 1)")
+        conn.commit()
+        conn.close()
+
+        results = DatabaseSyncer(db_path=test_db)._merge_tables(cloud_db)
+
+        assert result_for(results, 'all_props').new_rows == 1
+        assert result_for(results, 'all_props').error is None
+
+    def test_rebuilds_indexes_around_large_merges(self, test_db, cloud_db, monkeypatch):
+        """Test that a large append-only merge keeps its indexes and still dedups."""
+        monkeypatch.setattr('src.db.sync._INDEX_REBUILD_MIN_ROWS', 0)
+        executed = []
+        monkeypatch.setattr('src.db.sync._attach_cloud', lambda conn, path: (
+            conn.set_trace_callback(executed.append),
+            conn.execute("ATTACH DATABASE ? AS cloud", (str(path),)),
+        ))
+
+        def indexes():
+            conn = sqlite3.connect(test_db)
+            names = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'all_props'"
+            )}
+            conn.close()
+            return names
+
+        before = indexes()
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer._merge_tables(cloud_db)
+        assert any(sql.startswith('DROP INDEX') and 'idx_all_props' in sql for sql in executed)
+        assert indexes() == before
+
+        # Without a checkpoint, a local copy that already holds the cloud rows
+        # has nothing new to merge and keeps its indexes in place
+        conn = sqlite3.connect(test_db)
+        conn.execute("DELETE FROM sync_checkpoints")
+        conn.commit()
+        conn.close()
+        executed.clear()
+
+        results = syncer._merge_tables(cloud_db)
+
+        assert result_for(results, 'all_props').new_rows == 0
+        assert not any(sql.startswith('DROP INDEX') for sql in executed)
+        assert indexes() == before
+
+    def test_interrupted_merge_rolls_back(self, test_db, cloud_db, monkeypatch):
+        """Test that an error escaping a table merge leaves no partial merge behind."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        merge_table = syncer._merge_table
+
+        def failing_merge_table(cursor, result, *args):
+            if result.table == 'all_props':
+                raise KeyboardInterrupt
+            merge_table(cursor, result, *args)
+
+        monkeypatch.setattr(syncer, '_merge_table', failing_merge_table)
+
+        with pytest.raises(KeyboardInterrupt):
+            syncer._merge_tables(cloud_db)
+
+        conn = sqlite3.connect(test_db, timeout=0)
+        assert conn.execute("SELECT COUNT(*) FROM player_game_logs").fetchone() == (0,)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.rollback()
+        conn.close()
+
+    def test_cloud_db_is_attached_read_only(self, test_db, cloud_db):
+        """Test that the merge never writes to the downloaded cloud copy."""
+        before = cloud_db.read_bytes()
+
+        DatabaseSyncer(db_path=test_db)._merge_tables(cloud_db)
+
+        assert cloud_db.read_bytes() == before
+
+    def test_tunes_both_schemas_for_scans(self, test_db, cloud_db, monkeypatch):
+        """Test that the merge connection maps pages and enlarges the cache on both databases."""
+        executed = []
+        monkeypatch.setattr('src.db.sync._attach_cloud', lambda conn, path: (
+            conn.set_trace_callback(executed.append),
+            conn.execute("ATTACH DATABASE ? AS cloud", (str(path),)),
+        ))
+
+        DatabaseSyncer(db_path=test_db)._merge_tables(cloud_db)
+
+        assert "PRAGMA cloud.cache_size=-131072" in executed
+        assert "PRAGMA cloud.mmap_size=1073741824" in executed
+
+    def test_missing_tables_are_reported(self, test_db, cloud_db):
+        """Test that tables absent from either side are reported, not merged."""
+        results = DatabaseSyncer(db_path=test_db)._merge_tables(cloud_db)
+
+        assert result_for(results, 'model_versions').error == "not in cloud DB"
+
+    def test_skips_columns_missing_locally(self, test_db, cloud_db):
+        """Test that cloud-only columns are reported and the rest still merge."""
+        conn = sqlite3.connect(cloud_db)
+        conn.execute("ALTER TABLE team_pace ADD COLUMN cloud_only TEXT")
+        conn.execute("INSERT INTO team_pace (team_id, season, pace) VALUES (1610612747, '2025-26', 99.5)")
+        conn.commit()
+        conn.close()
+
+        results = DatabaseSyncer(db_path=test_db)._merge_tables(cloud_db)
+
+        team_pace = result_for(results, 'team_pace')
+        assert team_pace.skipped_columns == ['cloud_only']
+        assert team_pace.new_rows == 1
+
+
+class TestSyncModels:
+    """Tests for DatabaseSyncer._sync_models."""
+
+    def test_downloads_every_model(self, test_db, tmp_path, monkeypatch):
+        """Test that each .joblib blob is downloaded into trained_models/."""
+        blobs = []
+        for name in ('trained_models/points.joblib', 'trained_models/rebounds.joblib', 'trained_models/notes.txt'):
+            blob = MagicMock()
+            blob.name = name
+            blobs.append(blob)
+        client = MagicMock()
+        client.bucket.return_value.list_blobs.return_value = blobs
+        monkeypatch.setattr('src.db.sync._get_gcs_client', lambda: client)
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.project_root = tmp_path
+
+        syncer._sync_models()
+
+        for blob in blobs[:2]:
+            blob.download_to_filename.assert_called_once_with(
+                str(tmp_path / "trained_models" / Path(blob.name).name)
+            )
+        blobs[2].download_to_filename.assert_not_called()
+
+
+class TestPull:
+    """Tests for DatabaseSyncer.pull."""
+
+    def test_syncs_models_alongside_merge(self, test_db, cloud_db, tmp_path, monkeypatch):
+        """Test that models download on a worker thread and the cloud copy is kept."""
+        model_threads = []
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.backup_dir = tmp_path / "backups"
+        monkeypatch.setattr(syncer, '_download_from_gcs', lambda: cloud_db)
+        monkeypatch.setattr(syncer, '_sync_models', lambda: model_threads.append(threading.get_ident()))
+
+        report = syncer.pull()
+
+        assert result_for(report.results, 'player_game_logs').new_rows == 1
+        assert model_threads and model_threads[0] != threading.get_ident()
+        assert cloud_db.exists()
+
+    def test_skip_models(self, test_db, cloud_db, tmp_path, monkeypatch):
+        """Test that skip_models leaves trained models untouched."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.backup_dir = tmp_path / "backups"
+        sync_models = MagicMock()
+        monkeypatch.setattr(syncer, '_download_from_gcs', lambda: cloud_db)
+        monkeypatch.setattr(syncer, '_sync_models', sync_models)
+
+        syncer.pull(skip_models=True)
+
+        sync_models.assert_not_called()
+
+    def test_failed_merge_discards_cached_copy(self, test_db, cloud_db, tmp_path, monkeypatch):
+        """Test that a merge that raises drops the cached cloud DB so the next pull re-downloads."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.data_dir = tmp_path
+        syncer.backup_dir = tmp_path / "backups"
+        cache_path, generation_path = syncer._cloud_cache_paths()
+        cache_path.write_bytes(cloud_db.read_bytes())
+        generation_path.write_text("1")
+        monkeypatch.setattr(syncer, '_download_from_gcs', lambda: cache_path)
+        monkeypatch.setattr(syncer, '_merge_tables', MagicMock(side_effect=sqlite3.DatabaseError("malformed")))
+
+        with pytest.raises(sqlite3.DatabaseError):
+            syncer.pull(skip_models=True)
+
+        assert not cache_path.exists() and not generation_path.exists()
+
+
+class TestDownloadFromGcs:
+    """Tests for DatabaseSyncer._download_from_gcs."""
+
+    def test_reuses_copy_until_generation_changes(self, test_db, tmp_path, monkeypatch):
+        """Test that an unchanged blob generation skips the download."""
+        blob = MagicMock()
+        blob.generation = 1
+        blob.download_to_filename.side_effect = lambda path, **kwargs: Path(path).write_bytes(b"db")
+        bucket = MagicMock()
+        bucket.blob.return_value = blob
+        monkeypatch.setattr('src.db.sync._get_gcs_client', lambda: MagicMock(bucket=lambda name: bucket))
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.data_dir = tmp_path / "data"
+
+        first = syncer._download_from_gcs()
+        second = syncer._download_from_gcs()
+        blob.generation = 2
+        third = syncer._download_from_gcs()
+
+        assert first == second == third == syncer.data_dir / "cloud_nba_stats.db"
+        assert blob.download_to_filename.call_count == 2
+        assert blob.download_to_filename.call_args.kwargs == {'if_generation_match': 2}
+        assert sorted(p.name for p in syncer.data_dir.iterdir()) == [
+            "cloud_nba_stats.db", "cloud_nba_stats.db.generation",
+        ]
+
+
+class TestBackupLocalDb:
+    """Tests for DatabaseSyncer._backup_local_db."""
+
+    def test_backs_up_with_sqlite_and_reuses_unchanged(self, test_db, tmp_path):
+        """Test that the backup is a readable database and is not redone without writes."""
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.backup_dir = tmp_path / "backups"
+
+        backup_path = syncer._backup_local_db()
+
+        conn = sqlite3.connect(backup_path)
+        assert conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 30
+        conn.close()
+        assert syncer._backup_local_db() == backup_path
+        assert len(list(syncer.backup_dir.iterdir())) == 1
+
+
+class TestPush:
+    """Tests for DatabaseSyncer.push."""
+
+    def test_uploads_vacuumed_snapshot_in_chunks(self, test_db, tmp_path, monkeypatch):
+        """Test that a compacted, gzip-encoded copy is uploaded concurrently and then removed."""
+        uploads = []
+
+        def fake_upload(filename, blob, **kwargs):
+            restored = tmp_path / "restored.db"
+            restored.write_bytes(gzip.decompress(Path(filename).read_bytes()))
+            conn = sqlite3.connect(restored)
+            uploads.append((
+                conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0],
+                blob.content_encoding, kwargs['worker_type'],
+            ))
+            conn.close()
+
+        monkeypatch.setattr('src.db.sync._get_gcs_client', MagicMock)
+        monkeypatch.setattr('src.db.sync.transfer_manager.upload_chunks_concurrently', fake_upload)
+        syncer = DatabaseSyncer(db_path=test_db)
+        syncer.data_dir = tmp_path / "data"
+        monkeypatch.setattr(syncer, 'pull', lambda: None)
+
+        syncer.push()
+
+        assert uploads == [(30, 'gzip', 'thread')]
+        assert list(syncer.data_dir.iterdir()) == []
+
+
+def test_gcs_client_created_once(test_db, monkeypatch):
+    """Test that one syncer negotiates credentials only once across GCS calls."""
+    get_client = MagicMock()
+    monkeypatch.setattr('src.db.sync._get_gcs_client', get_client)
+    syncer = DatabaseSyncer(db_path=test_db)
+
+    assert syncer._bucket() is syncer._bucket()
+    get_client.assert_called_once()
+
+
+def test_preview_counts_both_sides(test_db, cloud_db):
+    """Test that the dry-run preview reports local and cloud counts without writing."""
+    conn = sqlite3.connect(test_db)
+    conn.execute("INSERT INTO player_game_logs (game_id, player_id, game_date) VALUES ('0022400002', 2, '2024-12-21')")
+    conn.execute("INSERT INTO player_game_logs (game_id, player_id, game_date) VALUES ('0022400003', 2, '2024-12-22')")
+    conn.commit()
+    conn.close()
+
+    results = DatabaseSyncer(db_path=test_db)._preview_merge(cloud_db)
+
+    game_logs = result_for(results, 'player_game_logs')
+    assert (game_logs.local_before, game_logs.cloud_rows, game_logs.new_rows) == (2, 1, 0)
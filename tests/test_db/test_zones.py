@@ -0,0 +1,113 @@
+"""Tests for zone repositories."""
+
+import sqlite3
+
+from src.db.zones import SQLiteTeamDefenseZoneRepository, SQLiteZoneRepository
+from src.models.zones import AssistZone, ShootingZone, TeamDefenseZone, TeamDefenseZones
+
+
+class TestSQLiteZoneRepository:
+    """Tests for SQLiteZoneRepository."""
+
+    def test_save_and_accumulate_assist_zones(self, test_db):
+        """Test that assist zones are replaced on save and summed on accumulate."""
+        repository = SQLiteZoneRepository(test_db)
+        repository.save_assist_zones(1, '2025-26', [
+            AssistZone(1, 'Restricted Area', 'Center(C)', 'Less Than 8 ft.', 3.0, 3.0, 4.0),
+            AssistZone(1, 'Mid-Range', 'Center(C)', '8-16 ft.', 1.0, 1.0, 2.0),
+        ])
+        repository.accumulate_assist_zones(1, '2025-26', [
+            AssistZone(1, 'Mid-Range', 'Center(C)', '8-16 ft.', 2.0, 2.0, 3.0),
+            AssistZone(1, 'Above the Break 3', 'Center(C)', '24+ ft.', 1.0, 1.0, 1.0),
+        ])
+
+        zones = {zone.zone_name: zone.ast for zone in repository.get_assist_zones(1, '2025-26')}
+        assert zones == {'Restricted Area': 3.0, 'Mid-Range': 3.0, 'Above the Break 3': 1.0}
+
+        repository.save_assist_zones(1, '2025-26', [
+            AssistZone(1, 'Mid-Range', 'Center(C)', '8-16 ft.', 5.0, 5.0, 6.0),
+        ])
+        assert [zone.ast for zone in repository.get_assist_zones(1, '2025-26')] == [5.0]
+
+    def test_get_all_groups_zones_by_player(self, test_db):
+        """Test that get_all returns each player's current-season zones."""
+        repository = SQLiteZoneRepository(test_db)
+        repository.save_shooting_zones(2, '2025-26', [ShootingZone('Mid-Range', 4, 10)])
+        repository.save_shooting_zones(1, '2025-26', [
+            ShootingZone('Restricted Area', 5, 8), ShootingZone('Corner 3', 1, 3),
+        ])
+        repository.save_assist_zones(1, '2025-26', [
+            AssistZone(1, 'Mid-Range', 'Center(C)', '8-16 ft.', 2.0, 2.0, 3.0),
+        ])
+        repository.save_shooting_zones(3, '2024-25', [ShootingZone('Mid-Range', 1, 1)])
+
+        players = repository.get_all()
+
+        assert [p.player_id for p in players] == [1, 2]
+        assert [len(p.shooting_zones) for p in players] == [2, 1]
+        assert [len(p.assist_zones) for p in players] == [1, 0]
+        assert players[0] == repository.get_by_id(1)
+        assert next(repository.iter_all()) == players[0]
+
+
+class TestSQLiteTeamDefenseZoneRepository:
+    """Tests for SQLiteTeamDefenseZoneRepository."""
+
+    def test_save_stores_percentages_as_basis_points(self, test_db):
+        """Test that derived opponent percentages are stored as integer basis points."""
+        repository = SQLiteTeamDefenseZoneRepository(test_db)
+        repository.save(TeamDefenseZones(
+            team_id=1610612747, team_name='Lakers', season='2025-26',
+            zones=[
+                TeamDefenseZone(1610612747, 'Mid-Range', 'Center(C)', '16-24 ft.', 4.53, 10.0),
+                TeamDefenseZone(1610612747, 'Backcourt', 'Back Court(BC)', 'Back Court Shot', 0.0, 0.0),
+            ],
+        ))
+
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute(
+            "SELECT zone_name, opp_fg_pct, typeof(opp_fg_pct) FROM team_defensive_zones ORDER BY zone_name"
+        ).fetchall()
+        conn.close()
+        assert rows == [('Backcourt', 0, 'integer'), ('Mid-Range', 4530, 'integer')]
+
+    def test_reads_include_team_name(self, test_db):
+        """Test that team defense reads join the team's name in one query."""
+        repository = SQLiteTeamDefenseZoneRepository(test_db)
+        for team_id in (1610612747, 1610612738):
+            repository.save(TeamDefenseZones(
+                team_id=team_id, team_name='', season='2025-26',
+                zones=[TeamDefenseZone(team_id, 'Mid-Range', 'Center(C)', '16-24 ft.', 4.0, 10.0)],
+            ))
+
+        defenses = repository.get_all()
+
+        assert [(d.team_id, d.team_name, len(d.zones)) for d in defenses] == [
+            (1610612738, 'Boston Celtics', 1), (1610612747, 'Los Angeles Lakers', 1),
+        ]
+        assert repository.get_by_team(1610612747, '2025-26') == defenses[1]
+        assert next(repository.iter_all()) == defenses[0]
+        assert repository.get_by_team(1610612747, '2024-25') is None
+
+
+def test_connections_use_wal(test_db):
+    """Test that repository connections run in WAL mode with relaxed syncing."""
+    repository = SQLiteTeamDefenseZoneRepository(test_db)
+    conn = repository._get_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    repository.close()
+
+
+def test_reuses_one_connection_per_thread(test_db):
+    """Test that consecutive calls share the repository's connection."""
+    repository = SQLiteZoneRepository(test_db)
+
+    repository.save_shooting_zones(1, '2025-26', [ShootingZone('Mid-Range', 4, 10)])
+    assert repository.exists(1)
+    assert repository.delete(1)
+    assert not repository.exists(1)
+
+    assert len(repository._connections) == 1
+    repository.close()
@@ -0,0 +1,73 @@
+"""Tests for combo stats helpers."""
+
+from dataclasses import asdict
+from datetime import date
+
+import pandas as pd
+import pytest
+from src.helpers.combo_stats import (
+    calculate_combo_stats,
+    calculate_combo_stats_batch,
+    calculate_fantasy_points,
+    calculate_fantasy_points_batch,
+)
+from src.models.game import GameLog
+
+
+def make_game_log(points: int, rebounds: int, assists: int, steals: int, blocks: int, turnovers: int) -> GameLog:
+    return GameLog(
+        player_id=12345, player_name='Test Player', game_id='0022400001', game_date=date(2024, 12, 1),
+        team_id=1610612744, team_abbr='GSW', opponent_id=0, opponent_abbr='LAL',
+        is_home=False, minutes=34.0, points=points, rebounds=rebounds, assists=assists,
+        steals=steals, blocks=blocks, turnovers=turnovers, fgm=8, fga=16, fg3m=3, fg3a=7, ftm=1, fta=2,
+    )
+
+
+@pytest.fixture
+def game_logs():
+    return [
+        make_game_log(30, 8, 11, 2, 1, 4),
+        make_game_log(12, 3, 2, 0, 0, 1),
+        make_game_log(0, 0, 0, 0, 0, 0),
+    ]
+
+
+def to_frame(logs) -> pd.DataFrame:
+    return pd.DataFrame({
+        'pts': [log.points for log in logs],
+        'reb': [log.rebounds for log in logs],
+        'ast': [log.assists for log in logs],
+        'stl': [log.steals for log in logs],
+        'blk': [log.blocks for log in logs],
+        'tov': [log.turnovers for log in logs],
+    }, index=[10, 20, 30])
+
+
+class TestCalculateComboStatsBatch:
+    """Tests for calculate_combo_stats_batch."""
+
+    def test_matches_scalar_calculation(self, game_logs):
+        """Test that each row equals calculate_combo_stats for the same game."""
+        result = calculate_combo_stats_batch(to_frame(game_logs))
+
+        assert list(result.index) == [10, 20, 30]
+        assert result.to_dict('records') == [asdict(calculate_combo_stats(log)) for log in game_logs]
+
+
+class TestCalculateFantasyPointsBatch:
+    """Tests for calculate_fantasy_points_batch."""
+
+    def test_matches_scalar_calculation(self, game_logs):
+        """Test that default scoring equals calculate_fantasy_points per game."""
+        result = calculate_fantasy_points_batch(to_frame(game_logs))
+
+        assert list(result.index) == [10, 20, 30]
+        assert result.tolist() == pytest.approx([calculate_fantasy_points(log) for log in game_logs])
+
+    def test_partial_scoring_falls_back_to_defaults(self, game_logs):
+        """Test that stats missing from a custom scoring dict keep their default weight."""
+        scoring = {'points': 2.0, 'turnovers': -1.0}
+
+        result = calculate_fantasy_points_batch(to_frame(game_logs), scoring)
+
+        assert result.tolist() == pytest.approx([calculate_fantasy_points(log, scoring) for log in game_logs])
@@ -0,0 +1,102 @@
+"""Tests for zone mapper helpers."""
+
+import numpy as np
+import pytest
+from src.helpers.zone_mapper import (
+    ZONE_NAMES,
+    count_zones_from_coordinates,
+    get_zone_from_coordinates,
+    get_zone_ids_from_coordinates,
+    get_zone_value,
+    is_paint,
+    is_three_pointer,
+    normalize_zone_name,
+)
+
+
+class TestGetZoneFromCoordinates:
+    """Tests for get_zone_from_coordinates."""
+
+    @pytest.mark.parametrize("x,y,expected", [
+        (0, 0, 'Restricted Area'),
+        (30, 20, 'Restricted Area'),
+        (60, 100, 'Paint (Non-RA)'),
+        (150, 100, 'Mid-Range'),
+        (-230, 10, 'Left Corner 3'),
+        (230, 10, 'Right Corner 3'),
+        (0, 260, 'Above the Break 3'),
+        (0, 700, 'Above the Break 3'),
+    ])
+    def test_known_coordinates(self, x, y, expected):
+        assert get_zone_from_coordinates(x, y) == expected
+
+
+class TestGetZoneIdsFromCoordinates:
+    """Tests for the vectorized zone lookup."""
+
+    def test_matches_scalar_mapping(self):
+        """Test that the lookup table agrees with the scalar function, including off-court points."""
+        rng = np.random.default_rng(0)
+        xs = rng.integers(-300, 300, size=5000)
+        ys = rng.integers(-80, 950, size=5000)
+
+        zone_ids = get_zone_ids_from_coordinates(xs, ys)
+
+        expected = [get_zone_from_coordinates(int(x), int(y)) for x, y in zip(xs, ys)]
+        assert [ZONE_NAMES[i] for i in zone_ids] == expected
+
+    def test_truncates_float_coordinates(self):
+        """Test that float inputs are truncated like int()."""
+        zone_ids = get_zone_ids_from_coordinates([39.9, -229.5], [0.5, 10.0])
+        assert [ZONE_NAMES[i] for i in zone_ids] == ['Restricted Area', 'Left Corner 3']
+
+    def test_empty_input(self):
+        assert len(get_zone_ids_from_coordinates([], [])) == 0
+
+
+class TestCountZonesFromCoordinates:
+    """Tests for the per-zone shot counter."""
+
+    def test_counts_every_zone(self):
+        """Test that counts cover all zones, including off-court points."""
+        counts = count_zones_from_coordinates([0, 10, 230, 0, 0], [0, 5, 10, 260, 900])
+
+        assert dict(zip(ZONE_NAMES, counts.tolist())) == {
+            'Restricted Area': 2,
+            'Paint (Non-RA)': 0,
+            'Mid-Range': 0,
+            'Left Corner 3': 0,
+            'Right Corner 3': 1,
+            'Above the Break 3': 2,
+        }
+
+
+class TestZoneLookups:
+    """Tests for zone name normalization and classification lookups."""
+
+    @pytest.mark.parametrize("raw,expected", [
+        ('In The Paint (Non-RA)', 'Paint (Non-RA)'),
+        ('  restricted area ', 'Restricted Area'),
+        ('Above the Break 3', 'Above the Break 3'),
+        ('something else', 'Something Else'),
+    ])
+    def test_normalize_zone_name(self, raw, expected):
+        assert normalize_zone_name(raw) == expected
+
+    def test_every_zone_is_classified(self):
+        for name in ZONE_NAMES:
+            assert is_three_pointer(name) == name.endswith(' 3')
+            assert is_paint(name) == (name in ('Restricted Area', 'Paint (Non-RA)'))
+            assert get_zone_value(name) != 1.0
+
+    @pytest.mark.parametrize("name,expected", [
+        ('Above the Break 3 (Wing)', True),
+        ('In The Corner 3', True),
+        ('Mid-Range', False),
+        ('Backcourt', False),
+    ])
+    def test_is_three_pointer_accepts_raw_names(self, name, expected):
+        assert is_three_pointer(name) is expected
+
+    def test_unknown_zone_value_defaults(self):
+        assert get_zone_value('Backcourt') == 1.0
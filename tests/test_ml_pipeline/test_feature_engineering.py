@@ -1,8 +1,32 @@
 """Tests for feature engineering helpers (feature_engineering.py)."""
 
+import sqlite3
+
 import pytest
 
-from src.ml_pipeline.feature_engineering import parse_matchup
+from src.ml_pipeline.feature_engineering import (
+    _HOME_AWAY_UPDATE_SQL, _REST_DAYS_UPDATE_SQL,
+    compute_home_away_features, compute_opponent_rest_features, compute_rest_days_features, parse_matchup,
+)
+
+
+def query_plan(db_path, sql):
+    """Return the EXPLAIN QUERY PLAN details of sql joined into one string."""
+    conn = sqlite3.connect(db_path)
+    plan = ' '.join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+    conn.close()
+    return plan
+
+
+def insert_game_logs(db_path, rows):
+    """Insert (game_id, player_id, season, game_date, matchup) rows into player_game_logs."""
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO player_game_logs (game_id, player_id, season, game_date, matchup) VALUES (?, ?, ?, ?, ?)",
+        rows
+    )
+    conn.commit()
+    conn.close()
 
 
 # =============================================================================
@@ -63,3 +87,105 @@ class TestParseMatchup:
             is_home, opponent = parse_matchup(matchup)
             assert is_home == expected_home
             assert opponent == expected_opp
+
+
+# =============================================================================
+# compute_home_away_features
+# =============================================================================
+
+class TestComputeHomeAwayFeatures:
+    def test_scans_only_pending_rows(self, test_db):
+        assert 'idx_game_logs_home_away_pending' in query_plan(test_db, _HOME_AWAY_UPDATE_SQL)
+
+    def test_matches_parse_matchup(self, test_db):
+        matchups = ["PHX vs. LAL", "PHX @ LAL", "PHX vs.  LAL ", "PHX - LAL", "phx VS. lal", None]
+        insert_game_logs(test_db, [
+            (f"00224000{i:02d}", i, "2025-26", "2025-01-01", matchup) for i, matchup in enumerate(matchups)
+        ])
+
+        result = compute_home_away_features(test_db)
+
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute("SELECT matchup, is_home, opponent_abbr FROM player_game_logs ORDER BY player_id").fetchall()
+        conn.close()
+        assert result == {'updated': 3}
+        assert [(home, opponent) for _, home, opponent in rows] == [parse_matchup(m) for m, _, _ in rows]
+
+    def test_skips_rows_already_filled(self, test_db):
+        insert_game_logs(test_db, [("0022400001", 1, "2025-26", "2025-01-01", "PHX vs. LAL")])
+
+        assert compute_home_away_features(test_db) == {'updated': 1}
+        assert compute_home_away_features(test_db) == {'updated': 0}
+
+
+# =============================================================================
+# compute_rest_days_features
+# =============================================================================
+
+class TestComputeRestDaysFeatures:
+    def test_window_reads_index_in_order(self, test_db):
+        plan = query_plan(test_db, _REST_DAYS_UPDATE_SQL)
+        assert 'COVERING INDEX idx_game_logs_player_season_date' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_days_since_previous_game_per_season(self, test_db):
+        insert_game_logs(test_db, [
+            ("0022400001", 1, "2024-25", "2025-04-10", "PHX vs. LAL"),
+            ("0022500001", 1, "2025-26", "2025-10-22T00:00:00", "PHX vs. LAL"),
+            ("0022500002", 1, "2025-26", "2025-10-23", "PHX @ LAL"),
+            ("0022500003", 1, "2025-26", "2025-10-27", "PHX @ BOS"),
+            ("0022500004", 2, "2025-26", "2025-10-23", "BOS vs. PHX"),
+        ])
+
+        result = compute_rest_days_features(test_db)
+
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute(
+            "SELECT game_id, days_rest, is_back_to_back FROM player_game_logs ORDER BY game_id"
+        ).fetchall()
+        conn.close()
+        assert result == {'updated': 2}
+        assert rows == [
+            ("0022400001", None, None),
+            ("0022500001", None, None),
+            ("0022500002", 1, 1),
+            ("0022500003", 4, 0),
+            ("0022500004", None, None),
+        ]
+
+
+# =============================================================================
+# compute_opponent_rest_features
+# =============================================================================
+
+class TestComputeOpponentRestFeatures:
+    @pytest.mark.parametrize("batch_size", [10_000, 1, 2])
+    def test_days_since_opponents_previous_game(self, test_db, monkeypatch, batch_size):
+        monkeypatch.setattr('src.ml_pipeline.feature_engineering._OPPONENT_REST_BATCH_SIZE', batch_size)
+        conn = sqlite3.connect(test_db)
+        conn.executemany(
+            "INSERT INTO schedule (game_id, game_date, home_team_id, home_team_abbreviation, "
+            "away_team_id, away_team_abbreviation) VALUES (?, ?, 1, ?, 2, ?)",
+            [
+                ("g1", "2025-10-20T00:00:00", "LAL", "BOS"),
+                ("g2", "2025-10-22", "MIA", "LAL"),
+                ("g3", "2025-10-25", "LAL", "PHX"),
+            ]
+        )
+        conn.commit()
+        conn.close()
+        insert_game_logs(test_db, [
+            ("g2", 10, "2025-26", "2025-10-22", "MIA vs. LAL"),
+            ("g3", 11, "2025-26", "2025-10-25T00:00:00", "PHX @ LAL"),
+            ("g1", 12, "2025-26", "2025-10-20", "BOS @ LAL"),
+        ])
+        compute_home_away_features(test_db)
+
+        result = compute_opponent_rest_features(test_db)
+
+        conn = sqlite3.connect(test_db)
+        rows = conn.execute("SELECT player_id, opponent_days_rest FROM player_game_logs ORDER BY player_id").fetchall()
+        conn.close()
+        assert result == {'updated': 2}
+        assert rows == [(10, 2), (11, 3), (12, None)]
+
@@ -0,0 +1,50 @@
+"""Tests for PrizePicks scraper persistence."""
+
+import sqlite3
+from unittest.mock import patch
+
+from src.scrapers.prizepicks import PrizePicksScraper
+
+
+def make_prop(**overrides):
+    prop = {
+        'full_name': 'LeBron James',
+        'team_name': 'Los Angeles Lakers',
+        'opponent_name': 'Golden State Warriors',
+        'position_name': 'F',
+        'stat_name': 'points',
+        'stat_value': 25.5,
+        'prop_type': 'standard',
+        'game_id': '123',
+        'scheduled_at': '2024-12-20T03:00:00Z',
+        'choice': 'over',
+    }
+    prop.update(overrides)
+    return prop
+
+
+class TestPrizePicksScrape:
+    """Tests for PrizePicksScraper.scrape saving props."""
+
+    def test_invalid_props_do_not_abort_batch(self, test_db):
+        """Test that props violating all_props constraints are skipped and the rest are saved."""
+        scraper = PrizePicksScraper()
+        props = [
+            make_prop(),
+            make_prop(choice='under'),
+            make_prop(stat_value=None),
+            make_prop(full_name=None),
+        ]
+
+        with patch.object(scraper, 'fetch_projections_data', return_value=([{}], {})), \
+                patch.object(scraper, 'parse_projections', return_value=props):
+            scraper.scrape(test_db)
+
+        conn = sqlite3.connect(test_db)
+        saved = conn.execute("SELECT choice FROM prizepicks_props ORDER BY choice").fetchall()
+        conn.close()
+        assert saved == [('over',), ('under',)]
+
+    def test_validate_prop_rejects_bad_choice(self):
+        """Test _validate_prop with an unknown choice value."""
+        assert PrizePicksScraper()._validate_prop(make_prop(choice='sideways')) is False